@@ -322,6 +322,11 @@ class SuperAgente(Agente):
         self.archivo = archivo
         self.inicio = self.tablero.casilleros[65]
         self.data = self.load_csv_data()
+        # Disposición base (id de estantería -> índice de casillero). Los individuos se
+        # evalúan como vistas sobre ella, sin reescribir las estanterías del tablero
+        self.posiciones_base = {casillero.caracter: casillero.get_indice() for casillero in self.tablero.casilleros
+                                if not casillero.libre and casillero.caracter.isdigit()}
+        self.estanterias_base = sorted(self.posiciones_base, key=int)
     
     def load_csv_data(self):
             """Carga los datos desde un archivo CSV."""
@@ -356,7 +361,7 @@ class SuperAgente(Agente):
         print("Iniciando algoritmo genético para optimización de ubicación de productos...")
         
         # Paso 1: Obtener todas las estanterías/productos que pueden ser reubicados
-        productos_disponibles = self.tablero.obtener_estanterias()
+        productos_disponibles = list(self.estanterias_base)
         n_productos = len(productos_disponibles)
         
         if n_productos == 0:
@@ -424,8 +429,7 @@ class SuperAgente(Agente):
         print(f"Algoritmo genético completado. Mejor fitness: {mejor_fitness_global}")
         
         # Aplicar la mejor solución encontrada al tablero
-        #self.tablero.cambiar_estanterias(mejor_individuo_global)
-        #self._aplicar_solucion(mejor_individuo_global, productos_disponibles)
+        #self._aplicar_solucion(mejor_individuo_global)
         
         return mejor_individuo_global
 
@@ -467,22 +471,29 @@ class SuperAgente(Agente):
         #print(costos)
         return fitness_valores
 
+    def _vista_individuo(self, individuo):
+        """
+        Disposición de un individuo como vista sobre la base: la estantería que en la base
+        muestra estanterias_base[k] pasa a mostrar individuo[k].
+
+        Returns:
+            Diccionario {id de estantería: índice de casillero}
+        """
+        return {str(nuevo): self.posiciones_base[original]
+                for original, nuevo in zip(self.estanterias_base, individuo)}
+
     def _calcular_costo_individuo(self, individuo):
         """
         Calcula el costo total de un individuo sumando los costos de todas las órdenes.
         """
-        
-        # Modificamos la ubicación de las estanterías
-        self.tablero.cambiar_estanterias(individuo)
-
-        
-        self.tablero.dibujar(False)
+        # Las estanterías del tablero no se modifican: los objetivos se buscan en la vista
+        posiciones = self._vista_individuo(individuo)
         
         # Calculamos el costo total para todas las órdenes
         costo_total = 0
         for orden in self.data:
             # Configuramos los objetivos para esta orden
-            self._configurar_objetivos_orden(orden)
+            self._configurar_objetivos_orden(orden, posiciones)
             
             # Calculamos el camino usando temple simulado
             camino = self.temple_simulado_multi_objetivo(max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95, graficar = False)
@@ -493,45 +504,24 @@ class SuperAgente(Agente):
         
         return costo_total
 
-    def _guardar_configuracion_tablero(self):
-        """
-        Guarda la configuración actual del tablero para poder restaurarla después.
-        """
-        return {
-            'objetivos': deepcopy(self.tablero.get_objetivos()),
-            'productos': deepcopy(self.tablero.get_objetivos_disponibles())
-        }
-
-    def _restaurar_configuracion_tablero(self, configuracion):
-        """
-        Restaura la configuración guardada del tablero.
-        """
-        # Limpiamos los objetivos actuales
-        self.tablero.limpiar_objetivos()
-        
-        # Restauramos los objetivos
-        for objetivo in configuracion['objetivos']:
-            self.tablero.set_objetivo(objetivo.get_indice())
-        
-        # Restauramos las posiciones de los productos
-        productos_disponibles = self.tablero.get_objetivos_disponibles()
-        for i, producto in enumerate(configuracion['productos']):
-            if i < len(productos_disponibles):
-                # Restaurar el producto a su posición original
-                self.tablero.mover_producto(productos_disponibles[i], producto.get_indice())
-
-    def _configurar_objetivos_orden(self, orden):
+    def _configurar_objetivos_orden(self, orden, posiciones=None):
         """
         Configura los objetivos en el tablero según la orden dada.
+
+        Args:
+            orden: Ids de las estanterías de la orden
+            posiciones: Vista {id: índice de casillero} del individuo (por defecto, la base)
         """
+        posiciones = self.posiciones_base if posiciones is None else posiciones
         # Limpiamos los objetivos actuales
         self.tablero.limpiar_tablero()
         self.tablero.set_inicio(self.inicio.get_indice())
         # Configuramos los nuevos objetivos
         # print(orden)
         for objetivo in orden:
-            indice = self.tablero.buscar_por_caracter(objetivo)
-            self.tablero.set_objetivo(int(indice))
+            indice = posiciones.get(objetivo.strip())
+            if indice is not None:
+                self.tablero.set_objetivo(indice)
         
         self.objetivos = self.tablero.get_objetivos()
         self.nodo_inicio = self.tablero.get_inicio()
@@ -632,12 +622,9 @@ class SuperAgente(Agente):
         # Intercambiamos los elementos
         individuo[pos1], individuo[pos2] = individuo[pos2], individuo[pos1]
 
-    def _aplicar_solucion(self, individuo, productos_originales):
+    def _aplicar_solucion(self, individuo):
         """
-        Aplica la solución encontrada al tablero, reubicando los productos.
+        Aplica la solución encontrada al tablero, reetiquetando las estanterías.
         """
-        # Por cada producto en el individuo, lo movemos a la posición correspondiente
-        for i, producto in enumerate(individuo):
-            if i < len(productos_originales):
-                # Mover el producto a su nueva posición
-                self.tablero.mover_producto(productos_originales[i], producto.get_indice())
\ No newline at end of file
+        for id_estanteria, indice in self._vista_individuo(individuo).items():
+            self.tablero.casilleros[indice].caracter = id_estanteria
@@ -1,7 +1,9 @@
 import random
 import math
 from constantes import *
-from interfaz import Tablero, Casillero
+from tablero_modelo import Tablero, Casillero
+from busqueda_local import optimizar_ruta
+from temple_adaptativo import TempleInstrumentado
 import time
 import math
 from copy import deepcopy
@@ -32,7 +34,18 @@ class Agente:
             return
         self.__tablero.actualizar_tablero(self.__camino)
     
-    def temple_simulado_multi_objetivo(self, max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95):
+    def temple_simulado_multi_objetivo(self, max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95,
+                                       pulir=False, estrategia_pulido='primera'):
+        """
+        Busca el orden de visita de los objetivos con temple simulado y construye el camino completo.
+
+        Args:
+            max_iteraciones: Número máximo de iteraciones del temple
+            temp_inicial: Temperatura inicial
+            factor_enfriamiento: Factor de enfriamiento geométrico
+            pulir: Si es True, refina el orden obtenido con búsqueda local (2-opt, Or-opt, reubicación)
+            estrategia_pulido: 'primera' (primera mejora) o 'mejor' (mejor mejora)
+        """
         # 1) Manejar casos simples
         if not self.__objetivos:
             # No hay objetivos => cost 0 si no hay que moverse
@@ -42,11 +55,36 @@ class Agente:
             # Si hay un solo objetivo, iremos C-> objetivo -> C
             return self.construir_camino_completo(self.__nodo_inicio, self.__objetivos)
         
-        # 2) Orden aleatorio inicial
-        mejor_orden = self.__objetivos.copy()
-        random.shuffle(mejor_orden)
+        mejor_orden, _ = self.temple_simulado_orden(max_iteraciones, temp_inicial, factor_enfriamiento)
+        
+        if pulir:
+            mejor_orden, _ = self.pulir_orden(mejor_orden, estrategia=estrategia_pulido)
+        
+        # Construir ruta final (incluye regreso a C)
+        camino_completo = self.construir_camino_completo(self.__nodo_inicio, mejor_orden)
+        return camino_completo
+
+    def temple_simulado_orden(self, max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95,
+                              orden_inicial=None):
+        """
+        Ejecuta el temple simulado sobre el orden de visita sin construir ni dibujar el camino.
+
+        Args:
+            orden_inicial: Orden de arranque (p. ej. una solución guardada); por defecto, aleatorio
+
+        Returns:
+            Tupla (orden de objetivos, costo del recorrido incluyendo el regreso a C)
+        """
+        # 2) Orden inicial (aleatorio si no se indica uno)
+        if orden_inicial is not None:
+            mejor_orden = list(orden_inicial)
+        else:
+            mejor_orden = self.__objetivos.copy()
+            random.shuffle(mejor_orden)
         
         mejor_costo = self.calcular_costo_total(self.__nodo_inicio, mejor_orden)
+        if len(mejor_orden) < 2:
+            return mejor_orden, mejor_costo
         
         temp = temp_inicial
         
@@ -76,9 +114,55 @@ class Agente:
             if temp < 0.01:
                 break
         
-        # Construir ruta final (incluye regreso a C)
-        camino_completo = self.construir_camino_completo(self.__nodo_inicio, mejor_orden)
-        return camino_completo
+        return mejor_orden, mejor_costo
+
+    def temple_adaptativo_orden(self, max_iteraciones=2000, temp_inicial=30, factor_enfriamiento=0.995,
+                                **parametros):
+        """
+        Temple con telemetría y enfriamiento adaptativo sobre la matriz de costos de la orden.
+        Se detiene al estancarse el mejor costo en vez de agotar un número fijo de iteraciones.
+
+        Args:
+            parametros: Parámetros adicionales de TempleInstrumentado.ejecutar
+
+        Returns:
+            Tupla (orden de objetivos, costo, TempleInstrumentado con la telemetría de la corrida)
+        """
+        nodos = [self.__nodo_inicio] + list(self.__objetivos)
+        temple = TempleInstrumentado(self.matriz_costos(nodos))
+        parametros.setdefault('adaptativo', True)
+        ruta, costo = temple.ejecutar(max_iteraciones=max_iteraciones, temp_inicial=temp_inicial,
+                                      factor_enfriamiento=factor_enfriamiento, **parametros)
+        return [nodos[i] for i in ruta], costo, temple
+
+    def matriz_costos(self, nodos):
+        """
+        Calcula con A* la matriz de costos (pasos) entre todos los pares de nodos dados.
+        El nodo 0 debe ser el inicio/celda C; el resto, los objetivos de la orden.
+        """
+        n = len(nodos)
+        matriz = [[0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                camino = self.a_star(nodos[i], nodos[j])
+                costo = float('inf') if camino is None else len(camino) - 1
+                # Los tramos son simétricos: basta con una búsqueda por par
+                matriz[i][j] = costo
+                matriz[j][i] = costo
+        return matriz
+
+    def pulir_orden(self, orden_objetivos, estrategia='primera', k_vecinos=None):
+        """
+        Refina un orden de visita con búsqueda local (2-opt, Or-opt y reubicación).
+
+        Returns:
+            Tupla (orden refinado, costo del recorrido)
+        """
+        nodos = [self.__nodo_inicio] + list(orden_objetivos)
+        matriz = self.matriz_costos(nodos)
+        ruta, costo = optimizar_ruta(matriz, list(range(1, len(nodos))),
+                                     estrategia=estrategia, k_vecinos=k_vecinos)
+        return [nodos[i] for i in ruta], costo
 
 
     def calcular_costo_total(self, nodo_inicio, orden_objetivos):
@@ -148,8 +232,9 @@ class Agente:
         todos_objetivos = orden_objetivos.copy()
         todos_objetivos.append(c_celda)
         
-        # 4) Visualizar la ruta completa (incluido el último tramo)
-        self.visualizar_camino_completo(camino_completo, todos_objetivos)
+        # 4) Visualizar la ruta completa (incluido el último tramo), solo si hay ventana
+        if self.__tablero.ventana is not None:
+            self.visualizar_camino_completo(camino_completo, todos_objetivos)
         return camino_completo
 
 
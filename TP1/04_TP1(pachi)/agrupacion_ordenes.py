@@ -0,0 +1,204 @@
+# agrupacion_ordenes.py
+"""
+Agrupación de órdenes en viajes (wave picking).
+
+En lugar de hacer un viaje C -> productos -> C por orden, junta varias órdenes en un
+mismo viaje del montacargas mientras no se supere su capacidad (en unidades: cada id
+de una orden cuenta como una unidad). Las estanterías compartidas por varias órdenes
+de un lote se visitan una sola vez.
+
+Heurísticas:
+    - 'semilla': abre un lote con la orden pendiente de ruta más cara y le agrega la
+      orden que menos alarga la ruta, hasta llenar la capacidad.
+    - 'ahorros': Clarke-Wright. Parte de un lote por orden y une los lotes en orden de
+      ahorro decreciente, costo(A) + costo(B) - costo(A u B), si entran en la capacidad.
+
+Los costos de ruta de las heurísticas se estiman con búsqueda local sobre la tabla de
+costos del ModeloAlmacen; cada lote final se rutea con el PlanificadorRutas.
+
+Uso:
+    python agrupacion_ordenes.py --ordenes ordenes.csv --capacidad 20
+"""
+import argparse
+import os
+import time
+from busqueda_local import optimizar_ruta
+from procesador_batch import leer_ordenes
+from resolvedores import PlanificadorRutas, RESOLVEDORES
+
+HEURISTICAS = ('individual', 'semilla', 'ahorros')
+
+
+class AgrupadorOrdenes:
+    def __init__(self, planificador=None, capacidad=20, ventana=None):
+        """
+        Args:
+            planificador: PlanificadorRutas usado para estimar y rutear (por defecto, uno nuevo)
+            capacidad: Unidades que entran en un viaje
+            ventana: Si se indica, solo se agrupan órdenes que estén a menos de `ventana`
+                     posiciones entre sí en la lista (limita el costo con muchas órdenes)
+        """
+        self.planificador = planificador or PlanificadorRutas()
+        self.capacidad = capacidad
+        self.ventana = ventana
+        self._estimaciones = {}
+
+    def costo_estimado(self, ids):
+        """Costo aproximado de la ruta que visita los ids dados (memorizado por conjunto)."""
+        clave = frozenset(ids)
+        if clave not in self._estimaciones:
+            matriz, indices = self.planificador.matriz_orden(sorted(clave))
+            self._estimaciones[clave] = optimizar_ruta(matriz.tolist())[1] if indices else 0
+        return self._estimaciones[clave]
+
+    def _compatibles(self, i, j):
+        return self.ventana is None or abs(i - j) < self.ventana
+
+    def agrupar(self, ordenes, heuristica='ahorros'):
+        """
+        Reparte las órdenes en lotes.
+
+        Args:
+            ordenes: Lista de órdenes (listas de ids de estantería)
+            heuristica: 'individual', 'semilla' o 'ahorros'
+
+        Returns:
+            Lista de lotes; cada lote es la lista de índices de sus órdenes
+        """
+        for i, orden in enumerate(ordenes):
+            if len(orden) > self.capacidad:
+                raise ValueError(f"La orden {i} ({len(orden)} unidades) supera la capacidad ({self.capacidad})")
+        if heuristica == 'individual':
+            return [[i] for i in range(len(ordenes))]
+        if heuristica == 'semilla':
+            return self._agrupar_semilla(ordenes)
+        if heuristica == 'ahorros':
+            return self._agrupar_ahorros(ordenes)
+        raise ValueError(f"Heurística desconocida: {heuristica}. Opciones: {', '.join(HEURISTICAS)}")
+
+    def _agrupar_semilla(self, ordenes):
+        pendientes = set(range(len(ordenes)))
+        lotes = []
+        while pendientes:
+            semilla = max(pendientes, key=lambda i: (self.costo_estimado(ordenes[i]), -i))
+            pendientes.remove(semilla)
+            lote, ids, carga = [semilla], set(ordenes[semilla]), len(ordenes[semilla])
+            while True:
+                candidatos = [i for i in pendientes if carga + len(ordenes[i]) <= self.capacidad
+                              and all(self._compatibles(i, j) for j in lote)]
+                if not candidatos:
+                    break
+                costo_lote = self.costo_estimado(ids)
+                elegida = min(candidatos, key=lambda i: (self.costo_estimado(ids | set(ordenes[i])) - costo_lote, i))
+                pendientes.remove(elegida)
+                lote.append(elegida)
+                ids |= set(ordenes[elegida])
+                carga += len(ordenes[elegida])
+            lotes.append(sorted(lote))
+        return sorted(lotes)
+
+    def _agrupar_ahorros(self, ordenes):
+        # Ahorros entre pares de órdenes, calculados una sola vez
+        ahorros = []
+        for i in range(len(ordenes)):
+            for j in range(i + 1, len(ordenes)):
+                if not self._compatibles(i, j) or len(ordenes[i]) + len(ordenes[j]) > self.capacidad:
+                    continue
+                ahorro = (self.costo_estimado(ordenes[i]) + self.costo_estimado(ordenes[j])
+                          - self.costo_estimado(set(ordenes[i]) | set(ordenes[j])))
+                if ahorro > 0:
+                    ahorros.append((-ahorro, i, j))
+        ahorros.sort()
+
+        lote_de = list(range(len(ordenes)))
+        lotes = {i: [i] for i in range(len(ordenes))}
+        ids = {i: set(orden) for i, orden in enumerate(ordenes)}
+        carga = {i: len(orden) for i, orden in enumerate(ordenes)}
+        for _, i, j in ahorros:
+            a, b = lote_de[i], lote_de[j]
+            if a == b or carga[a] + carga[b] > self.capacidad:
+                continue
+            if not all(self._compatibles(x, y) for x in lotes[a] for y in lotes[b]):
+                continue
+            # El ahorro del par puede no valer para los lotes ya formados: se recalcula
+            union = ids[a] | ids[b]
+            if self.costo_estimado(ids[a]) + self.costo_estimado(ids[b]) - self.costo_estimado(union) <= 0:
+                continue
+            for k in lotes[b]:
+                lote_de[k] = a
+            lotes[a] += lotes.pop(b)
+            ids[a] = union
+            carga[a] += carga.pop(b)
+            del ids[b]
+        return sorted(sorted(lote) for lote in lotes.values())
+
+    def rutear_lotes(self, ordenes, lotes, semilla=None):
+        """
+        Rutea cada lote con el planificador (una visita por estantería del lote).
+
+        Returns:
+            Lista de diccionarios con las órdenes del lote, la ruta, el costo y el tiempo
+        """
+        resultados = []
+        for k, lote in enumerate(lotes):
+            ids = list(dict.fromkeys(id_estanteria for i in lote for id_estanteria in ordenes[i]))
+            resultado = self.planificador.planificar(ids, None if semilla is None else semilla + k)
+            resultado['ordenes'] = lote
+            resultado['unidades'] = sum(len(ordenes[i]) for i in lote)
+            resultados.append(resultado)
+        return resultados
+
+
+def comparar_agrupaciones(ordenes, capacidad=20, metodo='temple+local', heuristicas=HEURISTICAS,
+                          ventana=None, semilla=0):
+    """
+    Compara viajes, recorrido total y tiempos de cada heurística frente a un viaje por orden.
+
+    Returns:
+        Diccionario {heurística: métricas}
+    """
+    planificador = PlanificadorRutas(metodo=metodo)
+    metricas = {}
+    for heuristica in heuristicas:
+        agrupador = AgrupadorOrdenes(planificador, capacidad, ventana)
+        inicio = time.perf_counter()
+        lotes = agrupador.agrupar(ordenes, heuristica)
+        tiempo_agrupacion = time.perf_counter() - inicio
+        resultados = agrupador.rutear_lotes(ordenes, lotes, semilla)
+        metricas[heuristica] = {
+            'viajes': len(lotes),
+            'costo_total': sum(r['costo'] for r in resultados),
+            'ordenes_por_viaje': len(ordenes) / max(len(lotes), 1),
+            'tiempo_agrupacion_s': tiempo_agrupacion,
+            'tiempo_ruteo_s': sum(r['tiempo'] for r in resultados),
+        }
+    return metricas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agrupa órdenes en viajes y compara contra un viaje por orden.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--capacidad', type=int, default=20, help="Unidades por viaje")
+    parser.add_argument('--ventana', type=int, default=None, help="Distancia máxima entre órdenes agrupadas")
+    parser.add_argument('--metodo', default='temple+local', choices=sorted(RESOLVEDORES))
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    archivo = args.ordenes
+    if not os.path.isabs(archivo) and not os.path.exists(archivo):
+        archivo = os.path.join(os.path.dirname(os.path.realpath(__file__)), archivo)
+    ordenes = leer_ordenes(archivo)
+
+    metricas = comparar_agrupaciones(ordenes, args.capacidad, args.metodo, ventana=args.ventana,
+                                     semilla=args.semilla)
+    base = metricas['individual']['costo_total']
+    print(f"{'Heurística':<12}{'Viajes':>8}{'Órd/viaje':>11}{'Recorrido':>11}{'Ahorro %':>10}"
+          f"{'Agrupar s':>11}{'Rutear s':>10}")
+    for heuristica, m in metricas.items():
+        ahorro = 100 * (base - m['costo_total']) / base if base else 0.0
+        print(f"{heuristica:<12}{m['viajes']:>8}{m['ordenes_por_viaje']:>11.2f}{m['costo_total']:>11.0f}"
+              f"{ahorro:>10.1f}{m['tiempo_agrupacion_s']:>11.2f}{m['tiempo_ruteo_s']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,23 @@
 # algoritmo_genetico.py
 import sys
+import os
+import json
 import random
 import math
 import time
 import numpy as np
-import pygame
-import matplotlib.pyplot as plt
 from constantes import *
 from agente import Agente
+from fitness_paralelo import EvaluadorParalelo
+from motor_fitness import MotorFitness
+from carreras_fitness import CarrerasFitness
+from cache_fitness import CacheFitness, firma_fitness
+from vista_layout import VistaLayout, TableroVista
+from operadores_geneticos import (CRUCES, MUTACIONES, distancia_hamming_media, poblacion_aleatoria,
+                                  seleccion_torneo, tipo_genes)
+from surrogado_fitness import SurrogadoFitness
+from memetico import EscaladaIntercambios
+from mapa_calor import MapaCalor, dibujar_mapa_calor
 
 class AlgoritmoGenetico:
     """
@@ -16,7 +26,14 @@ class AlgoritmoGenetico:
     de cada disposición.
     """
     def __init__(self, tablero, ordenes, tam_poblacion=10, tasa_mutacion=0.2, 
-                 tasa_cruce=0.8, num_generaciones=50, elitismo=2):
+                 tasa_cruce=0.8, num_generaciones=50, elitismo=2, cache_soluciones=None,
+                 num_procesos=None, motor_fitness=False, carreras_fitness=False,
+                 capacidad_cache_fitness=10000, archivo_cache_fitness=None,
+                 operador_cruce='pmx', operador_mutacion='intercambio', fraccion_surrogado=None,
+                 memetico_k=0, presupuesto_memetico=100, max_ordenes_fitness=10, pesos_ordenes=None,
+                 individuo_inicial=None, fraccion_vecinos=0.5, capacidad_costos_orden=0,
+                 archivo_costos_orden=None, diversidad_minima=None, fraccion_inmigrantes=0.5,
+                 muestra_surrogado=2):
         """
         Inicializa el algoritmo genético.
         
@@ -28,6 +45,45 @@ class AlgoritmoGenetico:
             tasa_cruce: Probabilidad de cruce entre individuos
             num_generaciones: Número de generaciones a evolucionar
             elitismo: Número de mejores individuos que pasan directamente
+            cache_soluciones: CacheSoluciones opcional con recorridos ya resueltos por orden y disposición
+            num_procesos: Si se indica, el fitness se evalúa en un pool de ese número de procesos
+                          (sin tablero ni memoria de soluciones; ver fitness_paralelo)
+            motor_fitness: Si es True, el fitness se calcula sobre la tabla fija de distancias
+                           entre posiciones (ver motor_fitness), sin modificar el tablero
+            carreras_fitness: Si es True, el fitness usa todas las órdenes con mini-lotes por
+                              generación y carreras entre individuos empatados (ver carreras_fitness);
+                              el mejor individuo se elige al final sobre todas las órdenes
+            capacidad_cache_fitness: Individuos que guarda la caché de fitness (LRU)
+            archivo_cache_fitness: Archivo .npz donde persistir la caché de fitness entre corridas
+                                   (no se usa con carreras_fitness, cuyo fitness depende del mini-lote)
+            operador_cruce: 'pmx' u 'ox' (ver operadores_geneticos)
+            operador_mutacion: 'intercambio' (de genes sueltos) o 'inversion' (de un segmento)
+            fraccion_surrogado: Si se indica (entre 0 y 1), se generan hijos de más, se ordenan con
+                                el surrogado (ver surrogado_fitness) y solo esa fracción, la mejor,
+                                pasa a la evaluación completa del fitness
+            muestra_surrogado: Hijos descartados por el surrogado (elegidos al azar) que igual se
+                               evalúan por completo en cada generación, para que la correlación
+                               del surrogado incluya candidatos descartados
+            memetico_k: Individuos (los mejores) que se mejoran con búsqueda local en cada
+                        generación (0 = sin búsqueda local; ver memetico)
+            presupuesto_memetico: Intercambios por generación de la búsqueda local, repartidos
+                                  entre los memetico_k individuos
+            max_ordenes_fitness: Órdenes que se evalúan en cada fitness (None = todas): las primeras,
+                                 o las más recientes (las últimas) si hay pesos_ordenes
+            pesos_ordenes: Peso de cada orden de `ordenes` en el fitness (por defecto, todas pesan 1),
+                           en orden cronológico como las órdenes; las carreras de fitness no los usan
+            individuo_inicial: Disposición (lista de ids) desde la cual arrancar, por ejemplo la mejor
+                               de una corrida anterior; la población inicial la incluye junto con
+                               vecinos suyos (ver reoptimizacion)
+            fraccion_vecinos: Fracción de la población inicial formada por vecinos del individuo
+                              inicial (1 a 3 intercambios); el resto es aleatoria
+            capacidad_costos_orden: Costos de orden por conjunto de posiciones que guarda el motor de
+                                    fitness (0 = ninguno; ver motor_fitness)
+            archivo_costos_orden: Archivo JSON donde el motor de fitness persiste esos costos
+            diversidad_minima: Si se indica (entre 0 y 1), cuando la distancia de Hamming media de
+                               la población cae por debajo de ese valor, los peores individuos se
+                               reemplazan por inmigrantes aleatorios
+            fraccion_inmigrantes: Fracción de la población (sin la élite) que se reemplaza
         """
         self.tablero = tablero
         self.ordenes = ordenes
@@ -41,30 +97,118 @@ class AlgoritmoGenetico:
         self.estanterias = self._obtener_ids_estanterias()
         print(f"Estanterías identificadas: {len(self.estanterias)}")
         
+        # Operadores vectorizados: la población es un arreglo (tam_poblacion x estanterías)
+        # con el índice en self.estanterias del id que muestra cada estantería
+        self._ids = np.array(self.estanterias)
+        self._rng = np.random.default_rng(random.getrandbits(32))
+        self._cruce = CRUCES[operador_cruce]
+        self._mutacion = MUTACIONES[operador_mutacion]
+        
         # Crear la población inicial
+        self.individuo_inicial = individuo_inicial
+        self.fraccion_vecinos = fraccion_vecinos
         self.poblacion = self._inicializar_poblacion()
         
         # Mejor individuo encontrado
         self.mejor_individuo = None
         self.mejor_fitness = float('inf')
         
-        # Historial para visualización
+        # Historial para visualización (con carreras_fitness, historial_fitness es el mejor
+        # fitness del mini-lote de cada generación, no el mejor acumulado)
         self.historial_fitness = []
         self.historial_promedio = []
         self.historial_diversidad = []
+        self.historial_tiempo = []
+        
+        # Inmigración cuando la población pierde diversidad
+        self.diversidad_minima = diversidad_minima
+        self.fraccion_inmigrantes = fraccion_inmigrantes
+        self.generaciones_inmigracion = []
+        
+        # Órdenes y parámetros del temple usados en cada evaluación de fitness
+        self.max_ordenes_fitness = max_ordenes_fitness
+        self.parametros_temple_fitness = dict(max_iteraciones=50, temp_inicial=30, factor_enfriamiento=0.9)
+        if pesos_ordenes is None:
+            self.ordenes_fitness = self.ordenes[:max_ordenes_fitness]
+            self.pesos_fitness = None
+        else:
+            # Con pesos por antigüedad, las órdenes que cuentan son las más recientes
+            if len(pesos_ordenes) != len(self.ordenes):
+                raise ValueError(f"Se esperaban {len(self.ordenes)} pesos de órdenes, no {len(pesos_ordenes)}")
+            inicio = 0 if max_ordenes_fitness is None else max(len(self.ordenes) - max_ordenes_fitness, 0)
+            self.ordenes_fitness = self.ordenes[inicio:]
+            self.pesos_fitness = list(pesos_ordenes)[inicio:]
         
         # Cache para optimizar cálculos repetidos
-        self._cache_fitness = {}
+        if carreras_fitness:
+            archivo_cache_fitness = None
+        parametros_firma = dict(self.parametros_temple_fitness)
+        if self.pesos_fitness is not None:
+            parametros_firma['pesos'] = self.pesos_fitness
+        self._firma = firma_fitness(self.estanterias, self.ordenes_fitness, **parametros_firma)
+        self._cache_fitness = CacheFitness(self.estanterias, capacidad_cache_fitness, archivo_cache_fitness,
+                                           self._firma)
+        self.cache_soluciones = cache_soluciones
+        
+        # Evaluación paralela (el pool se crea al ejecutar)
+        self.num_procesos = num_procesos
+        self._evaluador = None
+        
+        # Recorridos del mejor individuo resueltos en otros procesos (ver incorporar_rutas)
+        self._rutas_externas = (None, {})
+        self._fitness_rutas_externas = float('inf')
+        
+        # Motor de fitness sobre distancias precalculadas entre posiciones
+        self._motor = None
+        if motor_fitness:
+            self._motor = MotorFitness(self.estanterias, self.ordenes_fitness, pesos=self.pesos_fitness,
+                                       capacidad_costos=capacidad_costos_orden,
+                                       archivo_costos=archivo_costos_orden, **self.parametros_temple_fitness)
+        
+        # Fitness por mini-lotes y carreras sobre el conjunto completo de órdenes
+        self._carreras = None
+        self._candidatos = []
+        if carreras_fitness:
+            self._carreras = CarrerasFitness(MotorFitness(self.estanterias, self.ordenes,
+                                                          **self.parametros_temple_fitness))
+        
+        # Pre-filtrado de hijos con el surrogado; su correlación con el fitness se registra por generación
+        if fraccion_surrogado is not None and not 0 < fraccion_surrogado <= 1:
+            raise ValueError(f"fraccion_surrogado debe estar en (0, 1], no {fraccion_surrogado}")
+        self.fraccion_surrogado = fraccion_surrogado
+        self._surrogado = None
+        self.historial_correlacion_surrogado = []
+        self.muestra_surrogado = muestra_surrogado
+        self._descartados_surrogado = self.poblacion[:0]
+        if fraccion_surrogado:
+            ordenes_surrogado = self.ordenes if carreras_fitness else self.ordenes_fitness
+            self._surrogado = SurrogadoFitness(self.estanterias, ordenes_surrogado)
+        
+        # Búsqueda local (modo memético) sobre los mejores individuos de cada generación
+        self.memetico_k = memetico_k
+        self.presupuesto_memetico = presupuesto_memetico
+        self.mejoras_memeticas = 0
+        self._escalada = None
+        if memetico_k:
+            ordenes_escalada = self.ordenes if carreras_fitness else self.ordenes_fitness
+            self._escalada = EscaladaIntercambios(self.estanterias, ordenes_escalada)
         
         # Crear agente para evaluación
         self.agente = Agente(self.tablero)
         
-        # Guardar la disposición original de estanterías para restaurarla después
+        # Disposición original de estanterías: cada individuo se evalúa sobre una vista de
+        # ella, sin modificar el tablero compartido
+        self.layout_base = VistaLayout.desde_tablero(self.tablero, self.estanterias)
+        
     def _desactivar_visualizacion(self):
         """
         Desactiva temporalmente la visualización del tablero para mejorar rendimiento.
         Evita problemas con Pygame deshabilitando las actualizaciones gráficas.
         """
+        # Tablero sin ventana (tablero_modelo): no hay nada que desactivar
+        if self.tablero.ventana is None:
+            return
+        
         # Guardar estado original de dibujar del tablero
         if hasattr(self.tablero, 'dibujar_original'):
             return  # Ya está desactivada
@@ -81,6 +225,7 @@ class AlgoritmoGenetico:
         
         # También desactivar pygame.display.flip() para evitar actualizaciones de pantalla
         if 'pygame' in sys.modules:
+            pygame = sys.modules['pygame']
             self.pygame_flip_original = pygame.display.flip
             pygame.display.flip = lambda: None
         
@@ -90,13 +235,16 @@ class AlgoritmoGenetico:
         """
         Restaura la visualización del tablero y las funciones de Pygame.
         """
+        if self.tablero.ventana is None:
+            return
+        
         if hasattr(self.tablero, 'dibujar_original'):
             self.tablero.dibujar = self.tablero.dibujar_original
             delattr(self.tablero, 'dibujar_original')
         
         # Restaurar pygame.display.flip() si fue desactivado
         if hasattr(self, 'pygame_flip_original'):
-            pygame.display.flip = self.pygame_flip_original
+            sys.modules['pygame'].display.flip = self.pygame_flip_original
             delattr(self, 'pygame_flip_original')
         
         print("Visualización restaurada.")
@@ -110,390 +258,386 @@ class AlgoritmoGenetico:
         return sorted(ids)  # Ordenamos para consistencia
     
     def _inicializar_poblacion(self):
-        """Crea la población inicial de individuos aleatorios."""
-        poblacion = []
+        """
+        Crea la población inicial de individuos aleatorios. Con individuo inicial, la primera
+        fila es ese individuo y una fracción fraccion_vecinos de las demás son vecinos suyos
+        (1 a 3 intercambios de genes).
+        """
         print("Inicializando población inicial...")
-        for i in range(self.tam_poblacion):
-            # Crear una permutación aleatoria
-            individuo = self.estanterias.copy()
-            random.shuffle(individuo)
-            poblacion.append(individuo)
-            print(f"\rIndividuo {i+1}/{self.tam_poblacion} creado", end="")
-        print("\nPoblación inicial creada correctamente.")
+        poblacion = poblacion_aleatoria(self.tam_poblacion, len(self.estanterias), self._rng)
+        if self.individuo_inicial is not None:
+            base = self.codificar([self.individuo_inicial])[0]
+            poblacion[0] = base
+            num_vecinos = min(int(round(self.fraccion_vecinos * self.tam_poblacion)), self.tam_poblacion - 1)
+            for fila in range(1, num_vecinos + 1):
+                vecino = base.copy()
+                for _ in range(self._rng.integers(1, 4)):
+                    i, j = self._rng.choice(len(vecino), size=2, replace=False)
+                    vecino[[i, j]] = vecino[[j, i]]
+                poblacion[fila] = vecino
+            print(f"Arranque desde un individuo inicial y {num_vecinos} vecinos suyos.")
+        print(f"Población inicial creada correctamente ({self.tam_poblacion} individuos).")
         return poblacion
     
-    def _aplicar_mapeo_al_tablero(self, individuo):
-        """
-        Aplica temporalmente la disposición de estanterías del individuo al tablero.
-        Evita la serialización que causa problemas con los objetos de Pygame.
+    def individuos(self, poblacion=None):
+        """Individuos (listas de ids de estanterías) de las filas de la población."""
+        poblacion = self.poblacion if poblacion is None else poblacion
+        return self._ids[poblacion].tolist()
+    
+    def _resolver_orden(self, tablero, layout, temp_arranque_tibio=5, **parametros_temple):
         """
-        # Guardar estado actual para restaurarlo después
-        estado_original = {}
-        for casillero in self.tablero.casilleros:
-            if not casillero.libre and casillero.caracter in self.estanterias:
-                estado_original[casillero.get_indice()] = casillero.caracter
+        Resuelve con temple simulado la orden cargada en el tablero. Si hay memoria de
+        soluciones, reutiliza el recorrido guardado o arranca el temple desde una solución
+        guardada que difiera en un solo producto.
         
-        # Crear mapeo de ID original a nueva posición
-        mapeo = {original: nuevo for original, nuevo in zip(self.estanterias, individuo)}
-        
-        # Aplicar mapeo al tablero
-        for casillero in self.tablero.casilleros:
-            if not casillero.libre and casillero.caracter in self.estanterias:
-                casillero.caracter = mapeo[casillero.caracter]
+        Args:
+            tablero: Tablero (o TableroVista) con el inicio y los objetivos de la orden
+            layout: Hash de la disposición del tablero
+            temp_arranque_tibio: Temperatura inicial al partir de una solución guardada
+            parametros_temple: Parámetros de Agente.temple_simulado_orden
         
-        return estado_original
+        Returns:
+            Tupla (orden de casilleros a visitar, costo)
+        """
+        agente = Agente(tablero)
+        if self.cache_soluciones is None:
+            return agente.temple_simulado_orden(**parametros_temple)
+        
+        objetivos = tablero.get_objetivos()
+        por_id = {casillero.caracter: casillero for casillero in objetivos}
+        ids = list(por_id)
+        
+        guardada = self.cache_soluciones.buscar(layout, ids)
+        if guardada is not None:
+            ruta, costo = guardada
+            return [por_id[i] for i in ruta], costo
+        
+        parecida = self.cache_soluciones.buscar_parecida(layout, ids)
+        if parecida is None:
+            orden, costo = agente.temple_simulado_orden(**parametros_temple)
+        else:
+            ruta, faltantes = parecida
+            inicio = tablero.get_inicio()
+            orden_inicial = [por_id[i] for i in ruta]
+            for id_faltante in faltantes:
+                # Insertar el producto nuevo en la posición más barata
+                candidatos = [orden_inicial[:k] + [por_id[id_faltante]] + orden_inicial[k:]
+                              for k in range(len(orden_inicial) + 1)]
+                orden_inicial = min(candidatos, key=lambda o: agente.calcular_costo_total(inicio, o))
+            costo_inicial = agente.calcular_costo_total(inicio, orden_inicial)
+            
+            # Temple a baja temperatura para no perder el arranque
+            parametros_tibios = dict(parametros_temple, temp_inicial=temp_arranque_tibio)
+            orden, costo = agente.temple_simulado_orden(orden_inicial=orden_inicial, **parametros_tibios)
+            if costo_inicial <= costo:
+                orden, costo = orden_inicial, costo_inicial
+        
+        self.cache_soluciones.guardar(layout, ids, [c.caracter for c in orden], costo)
+        return orden, costo
     
     def evaluar_fitness(self, individuo):
         """
         Evalúa la aptitud de un individuo usando recocido simulado para cada orden.
         Versión optimizada con mejor manejo de errores.
         """
-        # Convertir a tupla para poder usarla como clave de diccionario
-        individuo_tupla = tuple(individuo)
-        
         # Verificar si ya calculamos este fitness
-        if individuo_tupla in self._cache_fitness:
-            return self._cache_fitness[individuo_tupla]
+        cacheado = self._cache_fitness.buscar(individuo)
+        if cacheado is not None:
+            return cacheado
+        
+        if self._carreras is not None:
+            # Sobre el mini-lote actual, sin descartar los costos de la población
+            costo_total = self._carreras.evaluar_individuo(individuo)
+            self._cache_fitness.guardar(individuo, costo_total)
+            return costo_total
+        
+        if self._motor is not None:
+            costo_total = self._motor.evaluar(individuo)
+            self._cache_fitness.guardar(individuo, costo_total)
+            return costo_total
         
         try:
-            # Aplicar la disposición del individuo al tablero y guardar estado original
-            estado_original = self._aplicar_mapeo_al_tablero(individuo)
+            # Vista de la disposición del individuo sobre el tablero original (no lo modifica)
+            vista = self.layout_base.con_individuo(individuo)
+            tablero = TableroVista(self.tablero, vista)
             
             # Calcular costo total para todas las órdenes usando recocido simulado
             costo_total = 0
             
             # Limitar el número de órdenes a evaluar para mejorar rendimiento en etapas tempranas
-            ordenes_a_evaluar = self.ordenes[:min(len(self.ordenes), 10)]  # Evaluar solo las primeras 10 órdenes
+            ordenes_a_evaluar = self.ordenes_fitness  # Evaluar solo las primeras órdenes
+            pesos = self.pesos_fitness or [1] * len(ordenes_a_evaluar)
+            layout = vista.hash()
             
-            for orden in ordenes_a_evaluar:
+            for orden, peso in zip(ordenes_a_evaluar, pesos):
                 # Limpiar objetivos anteriores
-                self.tablero.limpiar_tablero()
+                tablero.limpiar_tablero()
                 
                 # Establecer punto de inicio (celda C)
-                celda_c = self.tablero.get_celda_c()
-                self.tablero.set_inicio(celda_c.get_indice())
+                celda_c = tablero.get_celda_c()
+                tablero.set_inicio(celda_c.get_indice())
                 
                 # Configurar objetivos para esta orden
                 objetivos_validos = 0
                 for id_estanteria in orden:
                     # Buscar casillero correspondiente
-                    indice = self.tablero.buscar_por_caracter(str(id_estanteria))
+                    indice = tablero.buscar_por_caracter(str(id_estanteria))
                     if indice is not None:
-                        self.tablero.set_objetivo(indice)
+                        tablero.set_objetivo(indice)
                         objetivos_validos += 1
                 
                 # Si no hay objetivos válidos, continuar con la siguiente orden
                 if objetivos_validos == 0:
                     continue
                 
-                # Usar recocido simulado para encontrar la mejor ruta
-                agente_evaluador = Agente(self.tablero)
+                # Usar recocido simulado para encontrar el mejor orden de visita
+                # (solo hace falta el costo: no se construye ni se dibuja el camino)
+                _, costo_orden = self._resolver_orden(tablero, layout, **self.parametros_temple_fitness)
                 
-                # Parámetros más eficientes para recocido simulado
-                mejor_ruta = agente_evaluador.temple_simulado_multi_objetivo(
-                    max_iteraciones=50,  # Reducido para eficiencia
-                    temp_inicial=30,
-                    factor_enfriamiento=0.9
-                )
-                
-                # Calcular el costo de esta ruta
-                if mejor_ruta is not None:
-                    costo_orden = len(mejor_ruta) - 1  # Longitud del camino menos 1
-                else:
+                if costo_orden == float('inf'):
                     # Penalización alta pero no infinita si no se encuentra ruta
                     costo_orden = 1000 * len(orden)
                 
-                costo_total += costo_orden
-            
-            # Restaurar la disposición original del tablero
-            for indice, caracter in estado_original.items():
-                self.tablero.casilleros[indice].caracter = caracter
+                costo_total += peso * costo_orden
             
             # Guardar en caché
-            self._cache_fitness[individuo_tupla] = costo_total
+            self._cache_fitness.guardar(individuo, costo_total)
             
             return costo_total
         
         except Exception as e:
-            # Log del error y retorno de un valor de fitness muy alto
-            self._log(f"Error en evaluar_fitness: {str(e)}", "ERROR")
+            # Informar el error y devolver un valor de fitness muy alto
             import traceback
-            self._log(traceback.format_exc(), "ERROR")
-            
-            # Restaurar tablero al estado original si es posible
-            try:
-                if 'estado_original' in locals():
-                    for indice, caracter in estado_original.items():
-                        self.tablero.casilleros[indice].caracter = caracter
-            except:
-                pass
-            
+            print(f"\nError en evaluar_fitness: {e}")
+            traceback.print_exc()
             return float('inf')  # Fitness extremadamente malo para individuos que causan errores
+    
+    def evaluar_poblacion(self, poblacion):
+        """
+        Evalúa el fitness de todos los individuos de una población.
+        Con evaluación paralela, los individuos que no están en la caché se reparten en
+        el pool de procesos y sus resultados se guardan en la caché del proceso principal.
+        
+        Returns:
+            Lista de fitness, en el mismo orden que la población
+        """
+        if self._carreras is not None:
+            # La caché vale solo para el mini-lote de la generación actual
+            fitness = self._carreras.evaluar_poblacion(poblacion)
+            for ind, f in zip(poblacion, fitness):
+                self._cache_fitness.guardar(ind, f)
+            return fitness
+        
+        if self._evaluador is None:
+            return [self.evaluar_fitness(ind) for ind in poblacion]
+        
+        fitness = {}
+        for ind in poblacion:
+            if tuple(ind) not in fitness:
+                fitness[tuple(ind)] = self._cache_fitness.buscar(ind)
+        pendientes = [individuo for individuo, valor in fitness.items() if valor is None]
+        if pendientes:
+            semillas = [random.getrandbits(32) for _ in pendientes]
+            for individuo, (valor, rutas) in zip(pendientes, self._evaluador.evaluar(pendientes, semillas)):
+                fitness[individuo] = valor
+                self._cache_fitness.guardar(individuo, valor)
+                self.incorporar_rutas(individuo, valor, rutas)
+        return [fitness[tuple(ind)] for ind in poblacion]
+    
+    def incorporar_rutas(self, individuo, fitness, rutas):
+        """
+        Guarda recorridos resueltos fuera de este proceso (trabajadores del pool o islas) si
+        el individuo es el mejor visto hasta ahora; los usa generar_mapa_calor.
+        
+        Args:
+            individuo: Individuo (lista o tupla de ids)
+            fitness: Su fitness
+            rutas: Diccionario {MotorFitness.clave_orden: ruta} (ver MotorFitness.rutas_individuo)
+        """
+        if fitness < self._fitness_rutas_externas:
+            self._fitness_rutas_externas = fitness
+            self._rutas_externas = (list(individuo), rutas)
+    
+    def rutas_mejor(self):
+        """Recorridos ya resueltos para el mejor individuo: {MotorFitness.clave_orden: ruta en posiciones}."""
+        rutas = {}
+        individuo, externas = self._rutas_externas
+        if individuo == list(self.mejor_individuo):
+            rutas.update(externas)
+        motor = self._motor if self._carreras is None else self._carreras.motor
+        if motor is not None:
+            rutas.update(motor.rutas_individuo(self.mejor_individuo))
+        return rutas
+    
+    def _ruta_registrada(self, orden, vista, rutas_motor, posiciones):
+        """
+        Recorrido (celdas de las estanterías en orden de visita) ya calculado para la orden
+        con la disposición de la vista: del motor de fitness (de este proceso, del pool o de
+        las islas) o de la memoria de soluciones.
+        """
+        ruta = rutas_motor.get(MotorFitness.clave_orden(posiciones, [str(i) for i in orden]))
+        if ruta is not None:
+            # La posición k + 1 es la estantería física que originalmente mostraba estanterias[k]
+            return [self.layout_base.posicion(self.estanterias[p - 1]) for p in ruta]
+        if self.cache_soluciones is not None:
+            ids = list(dict.fromkeys(str(i) for i in orden if vista.posicion(i) is not None))
+            guardada = self.cache_soluciones.buscar(vista.hash(), ids)
+            if guardada is not None:
+                return [vista.posicion(i) for i in guardada[0]]
+        return None
+    
     def generar_mapa_calor(self):
         """
         Genera un mapa de calor que muestra la frecuencia de visitas a cada casillero
         basado en las órdenes procesadas con la mejor disposición.
-        """
-        import matplotlib.pyplot as plt
-        import numpy as np
-        
-        # Aplicar la mejor solución al tablero
-        self._aplicar_mapeo_al_tablero(self.mejor_individuo)
         
-        # Crear matriz para mapa de calor
-        mapa_calor = np.zeros((self.tablero.filas, self.tablero.columnas))
-        
-        # Contador de visitas para cada casillero
+        Usa los recorridos ya calculados durante la evaluación (ver mapa_calor); las órdenes
+        que no se evaluaron con esta disposición se ordenan por vecino más cercano sobre la
+        tabla de costos. No resuelve recorridos ni busca caminos nuevos.
+        """
+        # Vista de la mejor solución sobre el tablero original
+        vista = self.layout_base.con_individuo(self.mejor_individuo)
+        tablero = TableroVista(self.tablero, vista)
+        rutas_motor = self.rutas_mejor()
+        posiciones = {str(id_estanteria): k + 1 for k, id_estanteria in enumerate(self.mejor_individuo)}
+        
+        mapa = MapaCalor()
+        rutas = []
+        registradas = 0
         for orden in self.ordenes:
-            # Limpiar objetivos anteriores
-            self.tablero.limpiar_tablero()
-            
-            # Establecer punto de inicio (celda C)
-            celda_c = self.tablero.get_celda_c()
-            self.tablero.set_inicio(celda_c.get_indice())
-            
-            # Configurar objetivos para esta orden
-            for id_estanteria in orden:
-                indice = self.tablero.buscar_por_caracter(str(id_estanteria))
-                if indice is not None:
-                    self.tablero.set_objetivo(indice)
-            
-            # Usar recocido simulado para encontrar la mejor ruta
-            agente_evaluador = Agente(self.tablero)
-            mejor_ruta = agente_evaluador.temple_simulado_multi_objetivo()
-            
-            # Incrementar contador de visitas para cada casillero en la ruta
-            if mejor_ruta:
-                for casillero in mejor_ruta:
-                    fila = casillero.y // CELL_SIZE
-                    columna = casillero.x // CELL_SIZE
-                    mapa_calor[fila][columna] += 1
-        
-        # Crear visualización
-        plt.figure(figsize=(12, 10))
-        
-        # Generar mapa de calor
-        plt.imshow(mapa_calor, cmap='hot', interpolation='nearest')
-        plt.colorbar(label='Frecuencia de visitas')
+            ruta = self._ruta_registrada(orden, vista, rutas_motor, posiciones)
+            if ruta is None:
+                ruta = mapa.ordenar_vecino_mas_cercano([vista.posicion(i) for i in orden
+                                                        if vista.posicion(i) is not None])
+            else:
+                registradas += 1
+            rutas.append(ruta)
+        mapa.acumular(rutas)
+        
+        # Etiquetas de las estanterías con la disposición optimizada
+        etiquetas = {(casillero.y // CELL_SIZE, casillero.x // CELL_SIZE): casillero.caracter
+                     for casillero in tablero.casilleros if not casillero.libre}
+        dibujar_mapa_calor(mapa.matriz(), etiquetas, 'mapa_calor_optimizacion.png',
+                           'Mapa de calor de frecuencia de visitas con la disposición optimizada')
+        
+        aproximados = "; el resto, aproximados por vecino más cercano" if registradas < len(self.ordenes) else ""
+        print(f"\nMapa de calor generado y guardado como 'mapa_calor_optimizacion.png' "
+              f"({registradas} de {len(self.ordenes)} recorridos calculados durante la optimización{aproximados})")
+    
+    def codificar(self, individuos):
+        """Filas de la población (índices en self.estanterias) de una lista de individuos."""
+        indice = {e: i for i, e in enumerate(self.estanterias)}
+        return np.array([[indice[str(e)] for e in individuo] for individuo in individuos],
+                        dtype=tipo_genes(len(self.estanterias))).reshape(-1, len(self.estanterias))
+    
+    def reemplazar_peores(self, individuos, fitness):
+        """
+        Reemplaza los peores individuos de la población por los dados (por ejemplo, inmigrantes).
         
-        # Añadir etiquetas para estanterías
-        for casillero in self.tablero.casilleros:
-            if not casillero.libre:
-                fila = casillero.y // CELL_SIZE
-                columna = casillero.x // CELL_SIZE
-                plt.text(columna, fila, casillero.caracter, 
-                        ha='center', va='center', color='white',
-                        fontweight='bold')
-        
-        plt.title('Mapa de calor de frecuencia de visitas con la disposición optimizada')
-        plt.xlabel('Columna')
-        plt.ylabel('Fila')
-        plt.tight_layout()
-        plt.savefig('mapa_calor_optimizacion.png')
-        plt.show()
-        
-        # Restaurar estado original
-        estado_original = {}
-        for indice, casillero in enumerate(self.tablero.casilleros):
-            if not casillero.libre and casillero.caracter in self.estanterias:
-                estado_original[indice] = casillero.caracter
-        
-        for indice, caracter in estado_original.items():
-            self.tablero.casilleros[indice].caracter = caracter
-        
-        print("\nMapa de calor generado y guardado como 'mapa_calor_optimizacion.png'")   
-    def seleccion_torneo(self, k=3):
-        """Selecciona un individuo mediante torneo."""
-        # Seleccionar k individuos aleatorios
-        candidatos = random.sample(range(self.tam_poblacion), k)
-        
-        # Encontrar el mejor individuo
-        mejor_idx = candidatos[0]
-        mejor_fitness = self.evaluar_fitness(self.poblacion[mejor_idx])
-        
-        for idx in candidatos[1:]:
-            fitness = self.evaluar_fitness(self.poblacion[idx])
-            if fitness < mejor_fitness:
-                mejor_fitness = fitness
-                mejor_idx = idx
-        
-        return self.poblacion[mejor_idx]
+        Args:
+            individuos: Lista de individuos (listas de ids) a incorporar
+            fitness: Vector con el fitness de cada fila de self.poblacion
+        """
+        filas = self.codificar(individuos)[:self.tam_poblacion]
+        peores = np.argsort(fitness, kind='stable')[::-1][:len(filas)]
+        self.poblacion[peores] = filas
+    
+    def seleccion_torneo(self, fitness, cantidad, k=3):
+        """Índices de `cantidad` individuos elegidos por torneo sobre el vector de fitness."""
+        return seleccion_torneo(fitness, cantidad, self._rng, k)
     
-    def cruce_pmx(self, padre1, padre2):
+    def cruzar(self, padres1, padres2):
+        """Cruza cada par de filas con probabilidad tasa_cruce. Devuelve (hijos1, hijos2)."""
+        return self._cruce(padres1, padres2, self.tasa_cruce, self._rng)
+    
+    def mutar(self, poblacion):
+        """Devuelve la población mutada con tasa_mutacion."""
+        return self._mutacion(poblacion, self.tasa_mutacion, self._rng)
+    
+    def refinar_mejores(self, fitness):
         """
-        Implementa el operador de cruce PMX (Partially Mapped Crossover) para problemas de permutación.
-        Versión optimizada que evita bucles infinitos y garantiza permutaciones válidas.
+        Mejora con búsqueda local a los memetico_k mejores individuos de la población. Cada
+        individuo mejorado reemplaza al original solo si su fitness no es peor.
         
         Args:
-            padre1, padre2: Individuos (permutaciones) a cruzar
+            fitness: Vector con el fitness de cada fila de self.poblacion
         
         Returns:
-            Tupla con dos hijos resultantes del cruce
+            Vector de fitness actualizado
         """
-        # Validar entrada
-        if len(padre1) != len(padre2):
-            raise ValueError("Los padres deben tener la misma longitud")
-        
-        # Copiar padres para no modificarlos
-        hijo1 = padre1.copy()
-        hijo2 = padre2.copy()
-        
-        # Si no se cumple la probabilidad, devolver copias de los padres
-        if random.random() > self.tasa_cruce:
-            return hijo1, hijo2
-        
-        # Obtener longitud
-        longitud = len(padre1)
-        
-        # Elegir dos puntos de corte aleatorios (asegurar que punto1 < punto2)
-        punto1 = random.randint(0, longitud - 2)
-        punto2 = random.randint(punto1 + 1, longitud - 1)
-        
-        # Crear mapeos para resolver conflictos
-        mapeo1 = {}  # Mapeo de padre2 a padre1 en la sección de cruce
-        mapeo2 = {}  # Mapeo de padre1 a padre2 en la sección de cruce
-        
-        # Intercambiar segmentos entre los puntos de corte
-        for i in range(punto1, punto2 + 1):
-            # Guardar valores originales antes del intercambio
-            valor1 = hijo1[i]
-            valor2 = hijo2[i]
-            
-            # Realizar intercambio
-            hijo1[i] = valor2
-            hijo2[i] = valor1
-            
-            # Actualizar mapeos
-            mapeo1[valor2] = valor1
-            mapeo2[valor1] = valor2
-        
-        # Resolver conflictos en hijo1
-        for i in range(longitud):
-            # Solo procesar posiciones fuera de la sección de cruce
-            if i < punto1 or i > punto2:
-                # Mientras el valor en la posición i esté en el mapeo (es decir, causa conflicto)
-                valor = hijo1[i]
-                contador = 0  # Contador para evitar bucles infinitos
-                max_iteraciones = longitud  # Límite máximo de iteraciones
-                
-                while valor in mapeo1 and contador < max_iteraciones:
-                    valor = mapeo1[valor]  # Seguir la cadena de mapeo
-                    contador += 1
-                
-                # Si salimos por contador, hay un problema en el mapeo
-                if contador >= max_iteraciones:
-                    # Solución alternativa: asignar un valor no utilizado
-                    valores_usados = set(hijo1[punto1:punto2+1])
-                    for posible_valor in padre1:
-                        if posible_valor not in valores_usados:
-                            valor = posible_valor
-                            valores_usados.add(posible_valor)
-                            break
-                
-                hijo1[i] = valor
-        
-        # Resolver conflictos en hijo2
-        for i in range(longitud):
-            # Solo procesar posiciones fuera de la sección de cruce
-            if i < punto1 or i > punto2:
-                # Mientras el valor en la posición i esté en el mapeo (es decir, causa conflicto)
-                valor = hijo2[i]
-                contador = 0  # Contador para evitar bucles infinitos
-                max_iteraciones = longitud  # Límite máximo de iteraciones
-                
-                while valor in mapeo2 and contador < max_iteraciones:
-                    valor = mapeo2[valor]  # Seguir la cadena de mapeo
-                    contador += 1
-                
-                # Si salimos por contador, hay un problema en el mapeo
-                if contador >= max_iteraciones:
-                    # Solución alternativa: asignar un valor no utilizado
-                    valores_usados = set(hijo2[punto1:punto2+1])
-                    for posible_valor in padre2:
-                        if posible_valor not in valores_usados:
-                            valor = posible_valor
-                            valores_usados.add(posible_valor)
-                            break
-                
-                hijo2[i] = valor
-        
-        # Verificar que los hijos son permutaciones válidas
-        self._verificar_permutacion(hijo1, "Hijo1 después de PMX")
-        self._verificar_permutacion(hijo2, "Hijo2 después de PMX")
+        fitness = np.array(fitness, dtype=float)
+        mejores = np.argsort(fitness, kind='stable')[:self.memetico_k]
+        presupuesto = max(1, self.presupuesto_memetico // len(mejores))
+        refinados = []
+        for individuo in self.individuos(self.poblacion[mejores]):
+            refinado, intercambios, _ = self._escalada.mejorar(individuo, presupuesto)
+            refinados.append(refinado if intercambios else None)
+        
+        pendientes = [(fila, individuo) for fila, individuo in zip(mejores, refinados) if individuo is not None]
+        if pendientes:
+            nuevos_fitness = self._evaluar_aparte([individuo for _, individuo in pendientes])
+            for (fila, individuo), nuevo_fitness in zip(pendientes, nuevos_fitness):
+                if nuevo_fitness <= fitness[fila]:
+                    self.poblacion[fila] = self.codificar([individuo])[0]
+                    fitness[fila] = nuevo_fitness
+                    self.mejoras_memeticas += 1
+        return fitness
+    
+    def _evaluar_aparte(self, individuos):
+        """Fitness de individuos que no forman parte de la población (refinados, muestras de control)."""
+        if self._carreras is not None:
+            # Sobre el mismo mini-lote que la población, sin reiniciar sus costos
+            return [self.evaluar_fitness(individuo) for individuo in individuos]
+        return self.evaluar_poblacion(individuos)
+    
+    def siguiente_generacion(self, fitness):
+        """
+        Nueva población: los mejores `elitismo` individuos pasan sin cambios y el resto
+        se obtiene por torneo, cruce y mutación. Con surrogado, se generan
+        num_hijos / fraccion_surrogado hijos y se conservan los de mejor puntaje; de los
+        descartados se guarda una muestra de muestra_surrogado para controlar el filtro.
         
-        return hijo1, hijo2
-
-    def _verificar_permutacion(self, individuo, etiqueta=""):
+        Args:
+            fitness: Vector con el fitness de cada fila de self.poblacion
         """
-        Verifica que un individuo sea una permutación válida y lo repara si es necesario.
+        orden = np.argsort(fitness, kind='stable')
+        elite = self.poblacion[orden[:min(self.elitismo, self.tam_poblacion)]]
+        num_hijos = self.tam_poblacion - len(elite)
+        num_candidatos = num_hijos
+        if self._surrogado is not None:
+            num_candidatos = int(math.ceil(num_hijos / self.fraccion_surrogado))
+        
+        padres = self.seleccion_torneo(fitness, 2 * ((num_candidatos + 1) // 2))
+        hijos1, hijos2 = self.cruzar(self.poblacion[padres[0::2]], self.poblacion[padres[1::2]])
+        hijos = np.stack([hijos1, hijos2], axis=1).reshape(-1, len(self.estanterias))[:num_candidatos]
+        hijos = self.mutar(hijos)
+        if self._surrogado is not None:
+            hijos, descartados = self._surrogado.separar(hijos, num_hijos)
+            muestra = self._rng.choice(len(descartados), min(self.muestra_surrogado, len(descartados)),
+                                       replace=False)
+            self._descartados_surrogado = descartados[np.sort(muestra)]
+        return np.concatenate([elite, hijos])
+    
+    def calcular_diversidad(self):
+        """Diversidad genética de la población: fracción media de genes distintos entre dos individuos."""
+        return distancia_hamming_media(self.poblacion)
+    
+    def inmigrar(self, fitness):
+        """
+        Reemplaza a los peores individuos (nunca a la élite) por individuos aleatorios.
         
         Args:
-            individuo: Individuo a verificar
-            etiqueta: Etiqueta para mensajes de depuración
+            fitness: Vector con el fitness de cada fila de self.poblacion
         
         Returns:
-            True si es una permutación válida, False si requirió reparación
-        """
-        # Obtener conjunto de valores esperados (todos los IDs de estanterías)
-        valores_esperados = set(self.estanterias)
-        
-        # Obtener conjunto de valores actuales
-        valores_actuales = set(individuo)
-        
-        # Verificar si hay valores faltantes o duplicados
-        valores_faltantes = valores_esperados - valores_actuales
-        valores_duplicados = []
-        
-        # Contar ocurrencias para encontrar duplicados
-        conteo = {}
-        for valor in individuo:
-            conteo[valor] = conteo.get(valor, 0) + 1
-            if conteo[valor] > 1:
-                valores_duplicados.append(valor)
-        
-        # Si no hay problemas, retornar True
-        if not valores_faltantes and not valores_duplicados:
-            return True
-        
-        # Si hay problemas, reparar la permutación
-        if valores_faltantes and valores_duplicados:
-            # Reemplazar duplicados con valores faltantes
-            for i, valor in enumerate(individuo):
-                if valor in valores_duplicados and conteo[valor] > 1:
-                    # Tomar un valor faltante
-                    valor_faltante = valores_faltantes.pop()
-                    individuo[i] = valor_faltante
-                    conteo[valor] -= 1
-                    
-                    # Si ya no hay más duplicados de este valor, removerlo de la lista
-                    if conteo[valor] == 1:
-                        valores_duplicados.remove(valor)
-                    
-                    # Si no hay más valores faltantes, salir
-                    if not valores_faltantes:
-                        break
-        
-        return False
-    def mutacion(self, individuo):
-        """Aplica mutación de intercambio a un individuo."""
-        # Copiar individuo
-        individuo_mutado = individuo.copy()
-        
-        # Para cada gen, aplicar mutación con probabilidad tasa_mutacion
-        for i in range(len(individuo)):
-            if random.random() < self.tasa_mutacion:
-                # Elegir otro gen aleatorio para intercambiar
-                j = random.randint(0, len(individuo) - 1)
-                
-                # Intercambiar genes
-                individuo_mutado[i], individuo_mutado[j] = individuo_mutado[j], individuo_mutado[i]
-        
-        return individuo_mutado
-    
-    def calcular_diversidad(self):
-        """Calcula la diversidad de la población como la desviación estándar de fitness."""
-        fitness_valores = [self.evaluar_fitness(ind) for ind in self.poblacion]
-        return np.std(fitness_valores) if len(fitness_valores) > 1 else 0
+            Cantidad de inmigrantes
+        """
+        cantidad = int(round(self.fraccion_inmigrantes * (self.tam_poblacion - self.elitismo)))
+        if cantidad <= 0:
+            return 0
+        peores = np.argsort(fitness, kind='stable')[::-1][:cantidad]
+        self.poblacion[peores] = poblacion_aleatoria(cantidad, len(self.estanterias), self._rng)
+        return cantidad
     
     def _mostrar_barra_progreso(self, generacion, fitness_actual, promedio_actual, tiempo_gen):
         """
@@ -526,12 +670,80 @@ class AlgoritmoGenetico:
         print(f" | T.Gen: {tiempo_gen:.2f}s", end='')
         print(info_tiempo, end='')
     
-    def ejecutar(self, tiempo_maximo=300):  # 5 minutos por defecto
+    def guardar_checkpoint(self, archivo, generacion):
+        """
+        Guarda el estado de la corrida (población, mejor individuo, historiales, caché de
+        fitness y estado de los generadores aleatorios) en un .npz, de forma atómica.
+        
+        Args:
+            archivo: Archivo .npz del checkpoint
+            generacion: Generaciones completadas
+        """
+        individuos_cache, fitness_cache = self._cache_fitness.exportar()
+        version, estado, gauss = random.getstate()
+        generadores = {'random': [version, list(estado), gauss], 'numpy': self._rng.bit_generator.state}
+        temporal = archivo + ".tmp.npz"
+        np.savez_compressed(
+            temporal, firma=np.array(self._firma), generacion=np.array(generacion), poblacion=self.poblacion,
+            mejor_individuo=self.codificar([self.mejor_individuo])[0], mejor_fitness=np.array(self.mejor_fitness),
+            candidatos=self.codificar(self._candidatos),
+            historial_fitness=np.array(self.historial_fitness, dtype=float),
+            historial_promedio=np.array(self.historial_promedio, dtype=float),
+            historial_tiempo=np.array(self.historial_tiempo, dtype=float),
+            historial_correlacion_surrogado=np.array(self.historial_correlacion_surrogado, dtype=float),
+            historial_diversidad=np.array(self.historial_diversidad, dtype=float),
+            generaciones_inmigracion=np.array(self.generaciones_inmigracion, dtype=np.int64),
+            cache_individuos=individuos_cache, cache_fitness=fitness_cache,
+            generadores=np.array(json.dumps(generadores)))
+        os.replace(temporal, archivo)
+    
+    def cargar_checkpoint(self, archivo):
+        """
+        Restaura el estado guardado con guardar_checkpoint.
+        
+        Returns:
+            Generaciones completadas en el checkpoint
+        """
+        datos = np.load(archivo)
+        if str(datos['firma']) != self._firma or datos['poblacion'].shape != self.poblacion.shape:
+            raise ValueError(f"El checkpoint '{archivo}' corresponde a otras órdenes, parámetros o tamaño de población")
+        self.poblacion = datos['poblacion'].astype(self.poblacion.dtype)
+        self.mejor_individuo = self.individuos(datos['mejor_individuo'][None, :])[0]
+        self.mejor_fitness = float(datos['mejor_fitness'])
+        self._candidatos = self.individuos(datos['candidatos'])
+        self.historial_fitness = datos['historial_fitness'].tolist()
+        self.historial_promedio = datos['historial_promedio'].tolist()
+        self.historial_tiempo = datos['historial_tiempo'].tolist()
+        self.historial_correlacion_surrogado = datos['historial_correlacion_surrogado'].tolist()
+        if 'historial_diversidad' in datos.files:
+            self.historial_diversidad = datos['historial_diversidad'].tolist()
+            self.generaciones_inmigracion = datos['generaciones_inmigracion'].tolist()
+        self._cache_fitness.importar(datos['cache_individuos'], datos['cache_fitness'])
+        
+        generadores = json.loads(str(datos['generadores']))
+        version, estado, gauss = generadores['random']
+        random.setstate((version, tuple(estado), gauss))
+        self._rng.bit_generator.state = generadores['numpy']
+        return int(datos['generacion'])
+    
+    def ejecutar(self, tiempo_maximo=300, generaciones_sin_mejora=5, al_terminar_generacion=None,
+                 archivo_checkpoint=None, intervalo_checkpoint=5, reanudar_desde=None):  # 5 minutos por defecto
         """
         Ejecuta el algoritmo genético con control de tiempo para evitar bloqueos.
         
         Args:
             tiempo_maximo: Tiempo máximo de ejecución en segundos
+            generaciones_sin_mejora: Generaciones seguidas sin cambio del mejor fitness tras las que
+                                     se detiene (None = no detenerse por convergencia; no se aplica
+                                     con carreras_fitness, cuyos fitness cambian con el mini-lote)
+            al_terminar_generacion: Función opcional llamada al final de cada generación como
+                                    f(algoritmo, generacion, fitness), con el fitness de cada fila de
+                                    self.poblacion; puede modificar la población (ver islas.py)
+            archivo_checkpoint: Archivo .npz donde guardar el estado cada intervalo_checkpoint
+                                generaciones y al terminar (también por tiempo límite)
+            intervalo_checkpoint: Generaciones entre checkpoints
+            reanudar_desde: Checkpoint desde el cual continuar una corrida anterior (no se vuelve a
+                            evaluar la población inicial y los fitness conocidos salen de la caché)
         
         Returns:
             Tupla con el mejor individuo encontrado y su fitness
@@ -549,35 +761,56 @@ class AlgoritmoGenetico:
         tiempo_limite = self._tiempo_inicio + tiempo_maximo
         
         try:
-            # Evaluar población inicial
-            print("Evaluando población inicial...")
-            fitness_inicial = []
-            for i, ind in enumerate(self.poblacion):
-                fitness = self.evaluar_fitness(ind)
-                fitness_inicial.append(fitness)
-                print(f"\rEvaluando individuo {i+1}/{self.tam_poblacion}, fitness: {fitness:.2f}", end="")
-                
-                # Verificar tiempo límite
-                if time.time() > tiempo_limite:
-                    print("\nTiempo límite alcanzado durante evaluación inicial.")
-                    raise TimeoutError("Tiempo máximo de ejecución excedido")
+            if self.num_procesos:
+                self._evaluador = EvaluadorParalelo(self.estanterias, self.ordenes_fitness, self.num_procesos,
+                                                    pesos=self.pesos_fitness, **self.parametros_temple_fitness)
+                print(f"Evaluación de fitness en paralelo con {self.num_procesos} procesos")
             
-            print()  # Nueva línea después del progreso
+            generacion_inicial = 0
+            if reanudar_desde is not None:
+                generacion_inicial = self.cargar_checkpoint(reanudar_desde)
+                # Los tiempos registrados continúan los de la corrida anterior
+                self._tiempo_inicio -= self.historial_tiempo[-1]
+                print(f"Corrida reanudada desde '{reanudar_desde}' tras {generacion_inicial} generaciones "
+                      f"(mejor fitness: {self.mejor_fitness:.2f}, {len(self._cache_fitness)} fitness en caché)")
+            else:
+                # Evaluar población inicial
+                print("Evaluando población inicial...")
+                if self._evaluador is not None or self._carreras is not None:
+                    # En carreras, los individuos se comparan sobre el mismo mini-lote
+                    fitness_inicial = self.evaluar_poblacion(self.individuos())
+                else:
+                    fitness_inicial = []
+                    for i, ind in enumerate(self.individuos()):
+                        fitness = self.evaluar_fitness(ind)
+                        fitness_inicial.append(fitness)
+                        print(f"\rEvaluando individuo {i+1}/{self.tam_poblacion}, fitness: {fitness:.2f}", end="")
+
+                        # Verificar tiempo límite
+                        if time.time() > tiempo_limite:
+                            print("\nTiempo límite alcanzado durante evaluación inicial.")
+                            raise TimeoutError("Tiempo máximo de ejecución excedido")
+
+                    print()  # Nueva línea después del progreso
             
-            # Encontrar el mejor individuo inicial
-            mejor_idx = fitness_inicial.index(min(fitness_inicial))
-            self.mejor_individuo = self.poblacion[mejor_idx].copy()
-            self.mejor_fitness = min(fitness_inicial)
+                # Encontrar el mejor individuo inicial
+                mejor_idx = fitness_inicial.index(min(fitness_inicial))
+                self.mejor_individuo = self.individuos()[mejor_idx]
+                self.mejor_fitness = min(fitness_inicial)
+                self._candidatos = [self.mejor_individuo.copy()]
             
-            # Registrar métricas iniciales
-            self.historial_fitness.append(self.mejor_fitness)
-            self.historial_promedio.append(sum(fitness_inicial) / len(fitness_inicial))
+                # Registrar métricas iniciales
+                self.historial_fitness.append(self.mejor_fitness)
+                self.historial_promedio.append(sum(fitness_inicial) / len(fitness_inicial))
+                self.historial_tiempo.append(time.time() - self._tiempo_inicio)
+                self.historial_diversidad.append(self.calcular_diversidad())
             
-            print(f"Fitness inicial - Mejor: {self.mejor_fitness:.2f}, Promedio: {self.historial_promedio[0]:.2f}")
-            print("\nEvolucionando población...\n")
+                print(f"Fitness inicial - Mejor: {self.mejor_fitness:.2f}, Promedio: {self.historial_promedio[0]:.2f}")
+                print("\nEvolucionando población...\n")
             
             # Iterar por generaciones
-            for generacion in range(self.num_generaciones):
+            generaciones_completadas = generacion_inicial
+            for generacion in range(generacion_inicial, self.num_generaciones):
                 tiempo_gen_inicio = time.time()
                 
                 # Verificar tiempo límite
@@ -585,106 +818,124 @@ class AlgoritmoGenetico:
                     print(f"\nTiempo límite alcanzado después de {generacion} generaciones.")
                     break
                 
-                # Crear nueva población
-                nueva_poblacion = []
+                if self._carreras is not None:
+                    # Nuevo mini-lote: los fitness de la generación anterior no son comparables
+                    self._carreras.nuevo_lote()
+                    self._cache_fitness.limpiar()
                 
-                # Elitismo: pasar los mejores individuos directamente
-                fitness_actual = [self.evaluar_fitness(ind) for ind in self.poblacion]
-                indices_ordenados = sorted(range(len(fitness_actual)), key=lambda i: fitness_actual[i])
-                
-                for i in range(min(self.elitismo, len(indices_ordenados))):
-                    nueva_poblacion.append(self.poblacion[indices_ordenados[i]].copy())
-                
-                # Generar el resto de la población mediante selección, cruce y mutación
-                intentos_cruce = 0
-                max_intentos = self.tam_poblacion * 10  # Límite de intentos para evitar bucles
-                
-                while len(nueva_poblacion) < self.tam_poblacion and intentos_cruce < max_intentos:
-                    # Verificar tiempo límite
-                    if time.time() > tiempo_limite:
-                        print(f"\nTiempo límite alcanzado durante generación {generacion+1}.")
-                        break
-                    
-                    # Seleccionar padres
-                    padre1 = self.seleccion_torneo()
-                    padre2 = self.seleccion_torneo()
-                    
-                    try:
-                        # Cruzar con límite de tiempo
-                        tiempo_inicio_cruce = time.time()
-                        hijo1, hijo2 = self.cruce_pmx(padre1, padre2)
-                        
-                        # Si el cruce toma demasiado tiempo, usar copias de los padres
-                        if time.time() - tiempo_inicio_cruce > 1.0:  # Más de 1 segundo
-                            print(f"Advertencia: Cruce PMX tomó demasiado tiempo, usando copias.")
-                            hijo1, hijo2 = padre1.copy(), padre2.copy()
-                        
-                        # Mutar
-                        hijo1 = self.mutacion(hijo1)
-                        hijo2 = self.mutacion(hijo2)
-                        
-                        # Agregar a nueva población
-                        nueva_poblacion.append(hijo1)
-                        if len(nueva_poblacion) < self.tam_poblacion:
-                            nueva_poblacion.append(hijo2)
-                        
-                    except Exception as e:
-                        print(f"Error en cruce/mutación: {str(e)}")
-                        # En caso de error, usar copias de los padres
-                        if len(nueva_poblacion) < self.tam_poblacion:
-                            nueva_poblacion.append(padre1.copy())
-                        if len(nueva_poblacion) < self.tam_poblacion:
-                            nueva_poblacion.append(padre2.copy())
-                    
-                    intentos_cruce += 1
-                
-                # Si no se completó la población, llenarla con copias de individuos existentes
-                if len(nueva_poblacion) < self.tam_poblacion:
-                    print(f"Advertencia: Población incompleta ({len(nueva_poblacion)}/{self.tam_poblacion}). Completando...")
-                    while len(nueva_poblacion) < self.tam_poblacion:
-                        idx = random.randint(0, len(self.poblacion) - 1)
-                        nueva_poblacion.append(self.poblacion[idx].copy())
-                
-                # Actualizar población
-                self.poblacion = nueva_poblacion
+                # Elitismo, torneo, cruce y mutación sobre toda la población a la vez
+                fitness_actual = self.evaluar_poblacion(self.individuos())
+                self.poblacion = self.siguiente_generacion(np.array(fitness_actual))
                 
                 # Evaluar nueva población
-                fitness_actual = [self.evaluar_fitness(ind) for ind in self.poblacion]
+                individuos = self.individuos()
+                fitness_actual = self.evaluar_poblacion(individuos)
+                if self._escalada is not None:
+                    fitness_actual = self.refinar_mejores(fitness_actual).tolist()
+                    individuos = self.individuos()
                 promedio_actual = sum(fitness_actual) / len(fitness_actual)
                 mejor_actual = min(fitness_actual)
                 mejor_idx = fitness_actual.index(mejor_actual)
+                if self._carreras is not None:
+                    # El mejor de cada mini-lote compite en el ranking final
+                    self._candidatos.append(individuos[mejor_idx])
                 
+                if self._carreras is not None:
+                    # Estimaciones de otro mini-lote: no se comparan con las anteriores. El mejor
+                    # de la corrida sale del ranking final sobre todas las órdenes
+                    self.mejor_fitness = mejor_actual
+                    self.mejor_individuo = individuos[mejor_idx]
                 # Actualizar mejor individuo si se encontró uno mejor
-                if mejor_actual < self.mejor_fitness:
+                elif mejor_actual < self.mejor_fitness:
                     self.mejor_fitness = mejor_actual
-                    self.mejor_individuo = self.poblacion[mejor_idx].copy()
+                    self.mejor_individuo = individuos[mejor_idx]
                     print(f"\nNueva mejor solución en generación {generacion+1}: {self.mejor_fitness:.2f}")
                 
                 # Registrar métricas
                 self.historial_fitness.append(self.mejor_fitness)
                 self.historial_promedio.append(promedio_actual)
+                self.historial_tiempo.append(time.time() - self._tiempo_inicio)
+                diversidad = self.calcular_diversidad()
+                self.historial_diversidad.append(diversidad)
                 
                 # Calcular tiempo de generación
                 tiempo_gen = time.time() - tiempo_gen_inicio
                 
                 # Mostrar progreso
                 self._mostrar_barra_progreso(generacion, self.mejor_fitness, promedio_actual, tiempo_gen)
+                cache = self._cache_fitness.estadisticas_generacion()
+                print(f" | Caché: {cache['aciertos']} aciertos, {cache['fallos']} fallos, "
+                      f"{cache['desalojos']} desalojos", end='')
+                if self._surrogado is not None:
+                    # La correlación incluye una muestra de los hijos descartados: solo con los
+                    # aceptados no se vería si el filtro deja afuera hijos buenos
+                    control = self._descartados_surrogado
+                    fitness_control = self._evaluar_aparte(self.individuos(control)) if len(control) else []
+                    correlacion = self._surrogado.correlacion(np.concatenate([self.poblacion, control]),
+                                                              list(fitness_actual) + list(fitness_control))
+                    self.historial_correlacion_surrogado.append(correlacion)
+                    peor_hijo = max(fitness_actual[min(self.elitismo, self.tam_poblacion):], default=float('inf'))
+                    print(f" | Surrogado: ρ={correlacion:.2f}, descartados mejores que un hijo aceptado: "
+                          f"{sum(f < peor_hijo for f in fitness_control)}/{len(fitness_control)}", end='')
+                print(f" | Diversidad: {diversidad:.2f}", end='')
+                
+                if al_terminar_generacion is not None:
+                    al_terminar_generacion(self, generacion, np.array(fitness_actual))
+                
+                # Población casi clonada: los cruces ya no exploran, se incorporan inmigrantes
+                if self.diversidad_minima is not None and diversidad < self.diversidad_minima:
+                    inmigrantes = self.inmigrar(np.array(fitness_actual))
+                    if inmigrantes:
+                        self.generaciones_inmigracion.append(generacion + 1)
+                        print(f" | Inmigración: {inmigrantes} individuos", end='')
+                
+                generaciones_completadas = generacion + 1
+                if archivo_checkpoint and generaciones_completadas % intervalo_checkpoint == 0:
+                    self.guardar_checkpoint(archivo_checkpoint, generaciones_completadas)
                 
                 # Verificar si se ha alcanzado convergencia
-                if generacion > 10 and all(abs(self.historial_fitness[-i-1] - self.historial_fitness[-i-2]) < 0.001 for i in range(5)):
+                if (generaciones_sin_mejora is not None and self._carreras is None and generacion > 10 and
+                        len(self.historial_fitness) > generaciones_sin_mejora and
+                        (np.abs(np.diff(self.historial_fitness[-generaciones_sin_mejora - 1:])) < 0.001).all()):
                     print(f"\nConvergencia alcanzada después de {generacion+1} generaciones.")
                     break
             
+            if archivo_checkpoint:
+                self.guardar_checkpoint(archivo_checkpoint, generaciones_completadas)
+                print(f"\nCheckpoint guardado en '{archivo_checkpoint}' ({generaciones_completadas} generaciones)")
+            
+            if self._carreras is not None:
+                # Ranking final sobre todas las órdenes (los fitness por mini-lote son estimaciones)
+                ranking = self._carreras.ranking_final(self._candidatos + self.individuos())
+                self.mejor_individuo, self.mejor_fitness = ranking[0]
+                print(f"\nRanking final sobre {self._carreras.num_ordenes} órdenes: {len(ranking)} candidatos, "
+                      f"{self._carreras.evaluaciones} órdenes resueltas, "
+                      f"{self._carreras.rondas_desempate} rondas de desempate")
+            
             # Mostrar tiempo total
             tiempo_total = time.time() - self._tiempo_inicio
             print(f"\nOptimización completada en {tiempo_total:.2f} segundos")
             print(f"Mejor fitness encontrado: {self.mejor_fitness:.2f}")
+            print(f"Caché de fitness: {len(self._cache_fitness)} individuos, {self._cache_fitness.aciertos} aciertos, "
+                  f"{self._cache_fitness.fallos} fallos, {self._cache_fitness.desalojos} desalojos")
+            self._cache_fitness.guardar_en_disco()
+            if self._motor is not None and self._motor.capacidad_costos:
+                print(f"Costos de órdenes: {len(self._motor._costos)} guardados, {self._motor.aciertos_costos} "
+                      f"aciertos, {self._motor.fallos_costos} fallos")
+                self._motor.guardar_costos()
+            if self._escalada is not None:
+                print(f"Búsqueda local: {self.mejoras_memeticas} individuos mejorados")
+            if self.cache_soluciones is not None:
+                estadisticas = self.cache_soluciones.estadisticas()
+                print(f"Memoria de soluciones: {estadisticas['entradas']} entradas, "
+                      f"tasa de aciertos {estadisticas['tasa_aciertos']*100:.1f}%, "
+                      f"{estadisticas['arranques_tibios']} arranques tibios")
             
             # Verificar mejor solución
             if self.mejor_individuo is None:
                 print("ADVERTENCIA: No se encontró solución. Usando mejor individuo de población final.")
                 mejor_idx = fitness_actual.index(min(fitness_actual))
-                self.mejor_individuo = self.poblacion[mejor_idx].copy()
+                self.mejor_individuo = self.individuos()[mejor_idx]
                 self.mejor_fitness = min(fitness_actual)
         
         except Exception as e:
@@ -696,9 +947,9 @@ class AlgoritmoGenetico:
             if not hasattr(self, 'mejor_individuo') or self.mejor_individuo is None:
                 print("Recuperando mejor solución de la población actual...")
                 try:
-                    fitness_actual = [self.evaluar_fitness(ind) for ind in self.poblacion]
+                    fitness_actual = self.evaluar_poblacion(self.individuos())
                     mejor_idx = fitness_actual.index(min(fitness_actual))
-                    self.mejor_individuo = self.poblacion[mejor_idx].copy()
+                    self.mejor_individuo = self.individuos()[mejor_idx]
                     self.mejor_fitness = min(fitness_actual)
                 except:
                     print("No se pudo recuperar una solución.")
@@ -708,6 +959,10 @@ class AlgoritmoGenetico:
                     self.mejor_fitness = float('inf')
         
         finally:
+            if self._evaluador is not None:
+                self._evaluador.cerrar()
+                self._evaluador = None
+            
             # Restaurar visualización
             self._restaurar_visualizacion()
         
@@ -734,10 +989,8 @@ class AlgoritmoGenetico:
                 print()
         print()
         
-        # Aplicar mapeo al tablero
-        for casillero in self.tablero.casilleros:
-            if not casillero.libre and casillero.caracter in self.estanterias:
-                casillero.caracter = mapeo[casillero.caracter]
+        # Escribir la disposición en el tablero (a partir de la original, aunque ya se haya aplicado)
+        self.layout_base.con_individuo(self.mejor_individuo).aplicar(self.tablero)
         
         print("\nSolución aplicada al tablero correctamente.")
         
@@ -748,12 +1001,15 @@ class AlgoritmoGenetico:
     def visualizar_resultados(self):
         """Visualiza la evolución de las métricas a lo largo de las generaciones."""
         try:
+            import matplotlib.pyplot as plt
+            
             # Crear figura con tres subplots
             fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 15))
             
             # Gráfico 1: Evolución del fitness
             ax1.plot(range(len(self.historial_fitness)), self.historial_fitness, 'b-', 
-                     label='Mejor fitness', linewidth=2)
+                     label='Mejor fitness' if self._carreras is None else 'Mejor fitness del mini-lote',
+                     linewidth=2)
             ax1.plot(range(len(self.historial_promedio)), self.historial_promedio, 'r-', 
                      label='Fitness promedio', linewidth=2)
             
@@ -769,7 +1025,7 @@ class AlgoritmoGenetico:
             
             ax2.set_title('Evolución de la diversidad de la población', fontsize=14)
             ax2.set_xlabel('Generación', fontsize=12)
-            ax2.set_ylabel('Diversidad (desviación estándar)', fontsize=12)
+            ax2.set_ylabel('Diversidad (distancia de Hamming media)', fontsize=12)
             ax2.grid(True)
             
             # Gráfico 3: Diferencia entre mejor y promedio
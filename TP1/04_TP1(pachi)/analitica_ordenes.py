@@ -0,0 +1,216 @@
+# analitica_ordenes.py
+"""
+Índice de estadísticas de las órdenes, construido en una sola pasada por bloques.
+
+Guarda, para todas las órdenes vistas:
+- la frecuencia de cada id (órdenes en que aparece);
+- la co-ocurrencia de pares de ids, dispersa: solo los pares que aparecieron juntos,
+  como claves int64 ordenadas (i * 2**32 + j, con i < j índices de ids) y sus cuentas;
+- el histograma de tamaños de orden.
+
+Se actualiza en forma incremental: actualizar_desde_csv lee solo las líneas agregadas
+al archivo desde la última lectura (recuerda la posición en bytes). Se persiste en un
+.npz compacto para que el surrogado, la búsqueda tabú o el generador de órdenes lo
+consulten sin volver a leer el CSV.
+
+Uso:
+    python analitica_ordenes.py --ordenes ordenes.csv --indice indice_ordenes.npz
+"""
+import argparse
+import os
+import numpy as np
+
+_DESPLAZAMIENTO = np.int64(2 ** 32)
+
+
+class IndiceOrdenes:
+    def __init__(self):
+        self.ids = []                 # id de cada índice, en orden de aparición
+        self._indice = {}             # id -> índice
+        self._frecuencia = np.zeros(0, dtype=np.int64)
+        self._claves_pares = np.zeros(0, dtype=np.int64)
+        self._cuentas_pares = np.zeros(0, dtype=np.int64)
+        self.histograma_tamanios = np.zeros(0, dtype=np.int64)
+        self.num_ordenes = 0
+        self.num_invalidas = 0
+        self.archivo_ordenes = None
+        self.posicion_archivo = 0     # bytes ya leídos de archivo_ordenes
+
+    @classmethod
+    def desde_ordenes(cls, ordenes):
+        indice = cls()
+        indice.agregar(ordenes)
+        return indice
+
+    def _indices(self, orden):
+        """Índices (sin repetir, ordenados) de los ids de una orden; registra los ids nuevos."""
+        for id_producto in orden:
+            if id_producto not in self._indice:
+                self._indice[id_producto] = len(self.ids)
+                self.ids.append(id_producto)
+        return np.unique(np.fromiter((self._indice[i] for i in orden), dtype=np.int64, count=len(orden)))
+
+    def agregar(self, ordenes):
+        """Agrega un bloque de órdenes (listas de ids enteros) a las estadísticas."""
+        ordenes = [[int(i) for i in orden] for orden in ordenes]
+        if not ordenes:
+            return
+        indices = [self._indices(orden) for orden in ordenes]
+        n = len(self.ids)
+
+        tamanios = np.bincount([len(orden) for orden in ordenes])
+        if len(tamanios) > len(self.histograma_tamanios):
+            self.histograma_tamanios = np.pad(self.histograma_tamanios,
+                                              (0, len(tamanios) - len(self.histograma_tamanios)))
+        self.histograma_tamanios[:len(tamanios)] += tamanios
+
+        todos = np.concatenate(indices)
+        self._frecuencia = np.pad(self._frecuencia, (0, n - len(self._frecuencia)))
+        np.add.at(self._frecuencia, todos, 1)
+
+        # Claves de todos los pares del bloque; se suman a las existentes con np.unique
+        triangulos = {}
+        claves = []
+        for ids_orden in indices:
+            m = len(ids_orden)
+            if m < 2:
+                continue
+            if m not in triangulos:
+                triangulos[m] = np.triu_indices(m, 1)
+            a, b = triangulos[m]
+            claves.append(ids_orden[a] * _DESPLAZAMIENTO + ids_orden[b])
+        if claves:
+            nuevas, cuentas = np.unique(np.concatenate(claves), return_counts=True)
+            todas = np.concatenate([self._claves_pares, nuevas])
+            self._claves_pares, posicion = np.unique(todas, return_inverse=True)
+            sumas = np.zeros(len(self._claves_pares), dtype=np.int64)
+            np.add.at(sumas, posicion, np.concatenate([self._cuentas_pares, cuentas]))
+            self._cuentas_pares = sumas
+        self.num_ordenes += len(ordenes)
+
+    def actualizar_desde_csv(self, archivo, bloque=10000):
+        """
+        Agrega las órdenes del CSV que todavía no se leyeron (las agregadas al final desde
+        la última lectura). Una última línea sin fin de línea se deja para la próxima vez.
+
+        Returns:
+            Cantidad de órdenes agregadas
+        """
+        if self.archivo_ordenes is not None and os.path.abspath(archivo) != self.archivo_ordenes:
+            raise ValueError(f"El índice corresponde a '{self.archivo_ordenes}', no a '{archivo}'")
+        if os.path.getsize(archivo) < self.posicion_archivo:
+            raise ValueError(f"'{archivo}' es más corto que lo ya leído: hay que reconstruir el índice")
+        self.archivo_ordenes = os.path.abspath(archivo)
+
+        antes = self.num_ordenes
+        ordenes = []
+        with open(archivo, 'rb') as f:
+            f.seek(self.posicion_archivo)
+            for linea in f:
+                if not linea.endswith(b"\n"):
+                    break
+                self.posicion_archivo += len(linea)
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    ordenes.append([int(item) for item in linea.split(b",")])
+                except ValueError:
+                    self.num_invalidas += 1
+                    continue
+                if len(ordenes) >= bloque:
+                    self.agregar(ordenes)
+                    ordenes = []
+        self.agregar(ordenes)
+        return self.num_ordenes - antes
+
+    def frecuencia(self, ids):
+        """Órdenes en que aparece cada id de `ids` (0 si nunca apareció)."""
+        return np.array([self._frecuencia[self._indice[int(i)]] if int(i) in self._indice else 0
+                         for i in ids], dtype=np.int64)
+
+    def coocurrencia(self, ids):
+        """Matriz densa (len(ids) x len(ids)) de órdenes en que aparece cada par de `ids`."""
+        # Posición en `ids` de cada índice del índice (-1 si no está en `ids`)
+        local = np.full(len(self.ids), -1, dtype=np.int64)
+        for k, i in enumerate(ids):
+            if int(i) in self._indice:
+                local[self._indice[int(i)]] = k
+        a = local[self._claves_pares // _DESPLAZAMIENTO]
+        b = local[self._claves_pares % _DESPLAZAMIENTO]
+        validos = (a >= 0) & (b >= 0)
+        matriz = np.zeros((len(ids), len(ids)), dtype=np.int64)
+        np.add.at(matriz, (a[validos], b[validos]), self._cuentas_pares[validos])
+        return matriz + matriz.T
+
+    def pares_frecuentes(self, cantidad=10):
+        """Los `cantidad` pares de ids más pedidos juntos, como ((id_a, id_b), órdenes)."""
+        mejores = np.argsort(-self._cuentas_pares, kind='stable')[:cantidad]
+        return [((self.ids[int(clave // _DESPLAZAMIENTO)], self.ids[int(clave % _DESPLAZAMIENTO)]), int(cuenta))
+                for clave, cuenta in zip(self._claves_pares[mejores], self._cuentas_pares[mejores])]
+
+    def tamanios(self):
+        """Tamaño de cada orden vista (en orden de tamaño), reconstruido desde el histograma."""
+        return np.repeat(np.arange(len(self.histograma_tamanios)), self.histograma_tamanios)
+
+    def guardar(self, archivo):
+        """Escribe el índice de forma atómica (archivo temporal + reemplazo)."""
+        temporal = archivo + ".tmp.npz"
+        np.savez_compressed(temporal, ids=np.array(self.ids, dtype=np.int64), frecuencia=self._frecuencia,
+                            claves_pares=self._claves_pares, cuentas_pares=self._cuentas_pares,
+                            histograma_tamanios=self.histograma_tamanios,
+                            contadores=np.array([self.num_ordenes, self.num_invalidas, self.posicion_archivo]),
+                            archivo_ordenes=np.array(self.archivo_ordenes or ""))
+        os.replace(temporal, archivo)
+
+    @classmethod
+    def cargar(cls, archivo):
+        datos = np.load(archivo)
+        indice = cls()
+        indice.ids = datos['ids'].tolist()
+        indice._indice = {i: k for k, i in enumerate(indice.ids)}
+        indice._frecuencia = datos['frecuencia']
+        indice._claves_pares = datos['claves_pares']
+        indice._cuentas_pares = datos['cuentas_pares']
+        indice.histograma_tamanios = datos['histograma_tamanios']
+        indice.num_ordenes, indice.num_invalidas, indice.posicion_archivo = (int(c) for c in datos['contadores'])
+        indice.archivo_ordenes = str(datos['archivo_ordenes']) or None
+        return indice
+
+
+def actualizar_indice(archivo_indice, archivo_ordenes):
+    """Carga el índice (o lo crea), le agrega las órdenes nuevas del CSV y lo guarda."""
+    if os.path.exists(archivo_indice):
+        indice = IndiceOrdenes.cargar(archivo_indice)
+    else:
+        indice = IndiceOrdenes()
+    nuevas = indice.actualizar_desde_csv(archivo_ordenes)
+    if nuevas or not os.path.exists(archivo_indice):
+        indice.guardar(archivo_indice)
+    return indice, nuevas
+
+
+def main():
+    import time
+
+    parser = argparse.ArgumentParser(description="Actualiza y resume el índice de estadísticas de las órdenes.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--indice', default='indice_ordenes.npz')
+    parser.add_argument('--pares', type=int, default=10, help="Pares más frecuentes a mostrar")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    indice, nuevas = actualizar_indice(args.indice, args.ordenes)
+    print(f"{nuevas} órdenes nuevas en {time.perf_counter() - inicio:.3f}s; "
+          f"{indice.num_ordenes} órdenes ({indice.num_invalidas} líneas inválidas), "
+          f"{len(indice.ids)} productos, {len(indice._claves_pares)} pares distintos")
+    tamanios = indice.tamanios()
+    if len(tamanios):
+        print(f"Tamaño de orden: medio {tamanios.mean():.2f}, mínimo {tamanios.min()}, máximo {tamanios.max()}")
+    mas_pedidos = np.argsort(-indice._frecuencia, kind='stable')[:args.pares]
+    print("Productos más pedidos: " + ", ".join(f"{indice.ids[k]} ({indice._frecuencia[k]})" for k in mas_pedidos))
+    print("Pares más pedidos juntos: " + ", ".join(f"{a}-{b} ({c})" for (a, b), c in indice.pares_frecuentes(args.pares)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from interfaz import Tablero, MenuSelector, Casillero, pygame, sys
 from constantes import*
 from agente import Agente
+from tablero_modelo import llenar_tablero
 import sys
 
 class Aplicacion:
@@ -76,45 +77,5 @@ class Aplicacion:
         
             
     def llenar_tablero(self):
-        # Crear un tablero de 11 filas y 13 columnas
-        filas = 11
-        columnas = 13
-
-        num_casillero = 0
-        # Crear casilleros y agregarlos al tablero
-        set1 = 1
-        set2 = 9
-        set3 = 17
-        for _ in range(143):
-            i = num_casillero // columnas
-            j = num_casillero % columnas
-            x = j * CELL_SIZE
-            y = i * CELL_SIZE
-            
-            if i == 5 and j == 0:
-                casillero = Casillero(x, y, "C", libre=True)
-
-            elif ((j > 1 and j < 4) or (j > 5 and j < 8) or (j > 9 and j < 12)) and (i%5 != 0):
-                if (j > 1 and j < 4) and (i<5):
-                    casillero = Casillero(x, y, f"{set1}", libre=False)
-                    set1 += 1
-                elif (j > 5 and j < 8) and (i<5):
-                    casillero = Casillero(x, y, f"{set2}", libre=False)
-                    set2 += 1
-                elif (j > 9 and j < 12) and (i<5):
-                    casillero = Casillero(x, y, f"{set3}", libre=False)
-                    set3 += 1
-                elif (j > 1 and j < 4) and (i>5):
-                    casillero = Casillero(x, y, f"{set1+16}", libre=False)
-                    set1 += 1
-                elif (j > 5 and j < 8) and (i>5):
-                    casillero = Casillero(x, y, f"{set2+16}", libre=False)
-                    set2 += 1
-                elif (j > 9 and j < 12) and (i>5):
-                    casillero = Casillero(x, y, f"{set3+16}", libre=False)
-                    set3 += 1
-            else:
-                casillero = Casillero(x, y, "", libre=True)
-            self.tablero.agregar_casillero(casillero)
-            
-            num_casillero += 1
\ No newline at end of file
+        # Crear un tablero de 11 filas y 13 columnas (misma disposición que el modelo sin pygame)
+        llenar_tablero(self.tablero, Casillero)
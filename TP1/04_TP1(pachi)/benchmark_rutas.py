@@ -0,0 +1,152 @@
+# benchmark_rutas.py
+"""
+Benchmark de los métodos de ruteo sobre órdenes sintéticas o reales.
+
+Para cada método (ver resolvedores.RESOLVEDORES) registra la brecha de costo respecto
+de la mejor ruta encontrada por cualquier método para la misma orden, el tiempo por
+orden y el pico de memoria. También mide el procesador por lotes en paralelo.
+
+Uso:
+    python benchmark_rutas.py --cantidad 300 --zipf 1.1 --semilla 0
+    python benchmark_rutas.py --ordenes ordenes.csv
+"""
+import argparse
+import json
+import resource
+import time
+import tracemalloc
+from generador_ordenes import GeneradorOrdenes, DISTRIBUCIONES
+from procesador_batch import leer_ordenes, procesar_ordenes
+from resolvedores import PlanificadorRutas, RESOLVEDORES, MAX_OBJETIVOS_EXACTO
+
+
+def _percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(int(p / 100 * len(ordenados)), len(ordenados) - 1)] if ordenados else 0.0
+
+
+def ejecutar_benchmark(ordenes, metodos=None, semilla=0, batch=True, metodo_batch='temple+local',
+                       num_procesos=None, muestra_memoria=20):
+    """
+    Ejecuta cada método sobre todas las órdenes.
+
+    Args:
+        ordenes: Lista de órdenes
+        metodos: Métodos a comparar (por defecto, todos los de RESOLVEDORES). El método
+                 'exacto' solo se aplica a órdenes de hasta MAX_OBJETIVOS_EXACTO productos.
+        semilla: Semilla base (la orden i usa semilla + i)
+        batch: Si es True, mide también procesador_batch.procesar_ordenes
+        metodo_batch: Método usado por el procesador por lotes
+        num_procesos: Procesos del procesador por lotes
+        muestra_memoria: Órdenes usadas para medir el pico de memoria de cada método
+
+    Returns:
+        Diccionario {método: métricas}
+    """
+    metodos = metodos or list(RESOLVEDORES)
+    costos = {}
+    metricas = {}
+
+    for metodo in metodos:
+        planificador = PlanificadorRutas(metodo=metodo)
+        costos[metodo] = {}
+        tiempos = []
+        aplicables = [(i, orden) for i, orden in enumerate(ordenes)
+                      if metodo != 'exacto' or len(set(orden)) <= MAX_OBJETIVOS_EXACTO]
+        for i, orden in aplicables:
+            resultado = planificador.planificar(orden, semilla + i)
+            costos[metodo][i] = resultado['costo']
+            tiempos.append(resultado['tiempo'])
+
+        # tracemalloc enlentece mucho la ejecución: la memoria se mide en una pasada aparte
+        tracemalloc.start()
+        for i, orden in aplicables[:muestra_memoria]:
+            planificador.planificar(orden, semilla + i)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        metricas[metodo] = {
+            'ordenes': len(tiempos),
+            'tiempo_medio_ms': 1000 * sum(tiempos) / max(len(tiempos), 1),
+            'tiempo_p95_ms': 1000 * _percentil(tiempos, 95),
+            'pico_memoria_kb': pico / 1024,
+        }
+
+    if batch:
+        # En el proceso principal tracemalloc solo mide lo que retiene el padre (resultados)
+        tracemalloc.start()
+        resultados, resumen = procesar_ordenes(ordenes, metodo_batch, num_procesos, semilla)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        nombre = f"batch ({metodo_batch})"
+        costos[nombre] = {i: r['costo'] for i, r in enumerate(resultados)}
+        metricas[nombre] = {
+            'ordenes': resumen['ordenes'],
+            # Tiempo de reloj por orden: incluye el paralelismo y el arranque del pool
+            'tiempo_medio_ms': 1000 * resumen['tiempo_total_s'] / max(resumen['ordenes'], 1),
+            'tiempo_p95_ms': 1000 * resumen['tiempo_p95_orden_s'],
+            'pico_memoria_kb': pico / 1024,
+            # ru_maxrss está en KB en Linux: el mayor proceso trabajador
+            'pico_memoria_trabajadores_kb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+            'ordenes_por_segundo': resumen['ordenes_por_segundo'],
+        }
+
+    # Brecha respecto de la mejor ruta conocida de cada orden
+    for i in range(len(ordenes)):
+        conocidos = [costos[m][i] for m in costos if i in costos[m]]
+        mejor = min(conocidos)
+        for m in costos:
+            if i in costos[m] and mejor > 0:
+                costos[m][i] = 100 * (costos[m][i] - mejor) / mejor
+            elif i in costos[m]:
+                costos[m][i] = 0.0
+    for m in metricas:
+        brechas = list(costos[m].values())
+        metricas[m]['brecha_media_pct'] = sum(brechas) / max(len(brechas), 1)
+        metricas[m]['brecha_max_pct'] = max(brechas, default=0.0)
+        metricas[m]['optimas_pct'] = 100 * sum(b == 0 for b in brechas) / max(len(brechas), 1)
+    return metricas
+
+
+def imprimir_tabla(metricas):
+    print(f"{'Método':<24}{'Órdenes':>9}{'Brecha %':>10}{'Máx %':>8}{'Óptimas %':>11}"
+          f"{'ms/orden':>10}{'p95 ms':>9}{'Pico KB':>10}")
+    for metodo, m in metricas.items():
+        print(f"{metodo:<24}{m['ordenes']:>9}{m['brecha_media_pct']:>10.2f}{m['brecha_max_pct']:>8.1f}"
+              f"{m['optimas_pct']:>11.1f}{m['tiempo_medio_ms']:>10.2f}{m['tiempo_p95_ms']:>9.2f}"
+              f"{m['pico_memoria_kb']:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de métodos de ruteo de órdenes.")
+    parser.add_argument('--ordenes', default=None, help="CSV de órdenes; si no se indica, se generan")
+    parser.add_argument('--cantidad', type=int, default=200)
+    parser.add_argument('--distribucion', default='poisson', choices=DISTRIBUCIONES)
+    parser.add_argument('--tamanio-medio', type=float, default=6)
+    parser.add_argument('--zipf', type=float, default=1.1)
+    parser.add_argument('--afinidad', type=float, default=0.5)
+    parser.add_argument('--metodos', nargs='*', default=None, choices=sorted(RESOLVEDORES))
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--salida', default=None, help="Archivo JSON donde guardar las métricas")
+    args = parser.parse_args()
+
+    if args.ordenes:
+        ordenes = leer_ordenes(args.ordenes)
+    else:
+        generador = GeneradorOrdenes(distribucion=args.distribucion, tamanio_medio=args.tamanio_medio,
+                                     exponente_zipf=args.zipf, prob_afinidad=args.afinidad,
+                                     semilla=args.semilla)
+        ordenes = list(generador.generar(args.cantidad))
+
+    inicio = time.perf_counter()
+    metricas = ejecutar_benchmark(ordenes, args.metodos, args.semilla, num_procesos=args.procesos)
+    imprimir_tabla(metricas)
+    print(f"\nBenchmark de {len(ordenes)} órdenes completado en {time.perf_counter() - inicio:.1f}s")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(metricas, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
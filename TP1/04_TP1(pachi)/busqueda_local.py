@@ -0,0 +1,323 @@
+# busqueda_local.py
+"""
+Búsqueda local para el ruteo de picking (C -> objetivos -> C).
+
+Trabaja sobre una matriz de costos entre nodos, donde el nodo 0 es la celda C
+(inicio y regreso) y los nodos 1..n son los objetivos de la orden. Una ruta es
+la lista de nodos a visitar, sin incluir el nodo 0 en los extremos.
+
+Vecindarios disponibles:
+    - '2opt': invierte un tramo de la ruta.
+    - 'oropt': mueve un segmento de 2 o 3 nodos consecutivos (opcionalmente invertido).
+    - 'reubicar': mueve un único nodo a otra posición.
+
+Se asume que la matriz es simétrica, como ocurre con los costos de A* en el tablero.
+"""
+import random
+import time
+
+EPSILON = 1e-9
+VECINDARIOS = ('2opt', 'oropt', 'reubicar')
+
+
+def costo_ruta(matriz, ruta):
+    """Costo de recorrer C -> ruta -> C."""
+    costo = 0
+    nodo_actual = 0
+    for nodo in ruta:
+        costo += matriz[nodo_actual][nodo]
+        nodo_actual = nodo
+    return costo + matriz[nodo_actual][0]
+
+
+def ruta_vecino_mas_cercano(matriz):
+    """Construye una ruta inicial visitando siempre el objetivo más cercano."""
+    pendientes = set(range(1, len(matriz)))
+    ruta = []
+    nodo_actual = 0
+    while pendientes:
+        siguiente = min(pendientes, key=lambda nodo: (matriz[nodo_actual][nodo], nodo))
+        ruta.append(siguiente)
+        pendientes.remove(siguiente)
+        nodo_actual = siguiente
+    return ruta
+
+
+def listas_vecinos(matriz, k):
+    """Para cada nodo, devuelve los k objetivos más cercanos (nunca el nodo 0 ni él mismo)."""
+    n = len(matriz)
+    return [sorted((j for j in range(1, n) if j != i), key=lambda j: (matriz[i][j], j))[:k]
+            for i in range(n)]
+
+
+def _posiciones(recorrido):
+    """Posición de cada objetivo dentro del recorrido [0, ..., 0]."""
+    return {nodo: i for i, nodo in enumerate(recorrido[1:-1], start=1)}
+
+
+def _movimiento_2opt(matriz, recorrido, estrategia, vecinos):
+    """
+    Busca un movimiento 2-opt de mejora: invertir recorrido[i..j].
+
+    Returns:
+        Tupla (delta, nuevo recorrido) o None si no hay mejora
+    """
+    n = len(recorrido) - 2
+    if vecinos is None:
+        candidatos = ((i, j) for i in range(1, n) for j in range(i + 1, n + 1))
+    else:
+        pos = _posiciones(recorrido)
+        candidatos = set()
+        for i in range(1, n + 1):
+            # Nueva arista (recorrido[i-1], c)
+            for c in vecinos[recorrido[i - 1]]:
+                if pos[c] > i:
+                    candidatos.add((i, pos[c]))
+            # Nueva arista (recorrido[i], c) con c = recorrido[j+1]
+            for c in vecinos[recorrido[i]]:
+                if pos[c] - 1 > i:
+                    candidatos.add((i, pos[c] - 1))
+        candidatos = sorted(candidatos)
+
+    mejor = None
+    for i, j in candidatos:
+        a, b = recorrido[i - 1], recorrido[i]
+        c, d = recorrido[j], recorrido[j + 1]
+        delta = matriz[a][c] + matriz[b][d] - matriz[a][b] - matriz[c][d]
+        if delta < -EPSILON and (mejor is None or delta < mejor[0]):
+            mejor = (delta, i, j)
+            if estrategia == 'primera':
+                break
+
+    if mejor is None:
+        return None
+    delta, i, j = mejor
+    return delta, recorrido[:i] + recorrido[i:j + 1][::-1] + recorrido[j + 1:]
+
+
+def _movimiento_segmento(matriz, recorrido, estrategia, vecinos, longitudes):
+    """
+    Busca un movimiento de mejora que traslade un segmento de la ruta a otra posición.
+    Con longitudes=(1,) es la reubicación de un nodo; con (2, 3), Or-opt.
+
+    Returns:
+        Tupla (delta, nuevo recorrido) o None si no hay mejora
+    """
+    n = len(recorrido) - 2
+    pos = _posiciones(recorrido) if vecinos is not None else None
+    mejor = None
+
+    for largo in longitudes:
+        if largo >= n:
+            continue
+        for i in range(1, n - largo + 2):
+            a, b = recorrido[i - 1], recorrido[i + largo]
+            s0, s1 = recorrido[i], recorrido[i + largo - 1]
+            ganancia = matriz[a][s0] + matriz[s1][b] - matriz[a][b]
+
+            # Aristas (recorrido[k], recorrido[k+1]) del recorrido sin el segmento
+            if vecinos is None:
+                aristas = range(0, n + 1)
+            else:
+                aristas = {0, n}
+                for c in set(vecinos[s0]) | set(vecinos[s1]):
+                    aristas.add(pos[c])
+                    aristas.add(pos[c] - 1)
+                aristas = sorted(aristas)
+
+            for k in aristas:
+                if i - 1 <= k <= i + largo - 1:
+                    continue
+                p, q = recorrido[k], recorrido[k + 1]
+                for invertido in ((False, True) if largo > 1 else (False,)):
+                    if invertido:
+                        costo_insercion = matriz[p][s1] + matriz[s0][q] - matriz[p][q]
+                    else:
+                        costo_insercion = matriz[p][s0] + matriz[s1][q] - matriz[p][q]
+                    delta = costo_insercion - ganancia
+                    if delta < -EPSILON and (mejor is None or delta < mejor[0]):
+                        mejor = (delta, i, largo, k, invertido)
+                        if estrategia == 'primera':
+                            break
+                if mejor is not None and estrategia == 'primera':
+                    break
+            if mejor is not None and estrategia == 'primera':
+                break
+        if mejor is not None and estrategia == 'primera':
+            break
+
+    if mejor is None:
+        return None
+    delta, i, largo, k, invertido = mejor
+    segmento = recorrido[i:i + largo]
+    if invertido:
+        segmento = segmento[::-1]
+    resto = recorrido[:i] + recorrido[i + largo:]
+    idx = k + 1 if k < i else k - largo + 1
+    return delta, resto[:idx] + segmento + resto[idx:]
+
+
+def _buscar_movimiento(vecindario, matriz, recorrido, estrategia, vecinos):
+    if vecindario == '2opt':
+        return _movimiento_2opt(matriz, recorrido, estrategia, vecinos)
+    if vecindario == 'oropt':
+        return _movimiento_segmento(matriz, recorrido, estrategia, vecinos, (2, 3))
+    if vecindario == 'reubicar':
+        return _movimiento_segmento(matriz, recorrido, estrategia, vecinos, (1,))
+    raise ValueError(f"Vecindario desconocido: {vecindario}")
+
+
+def optimizar_ruta(matriz, ruta=None, vecindarios=VECINDARIOS, estrategia='primera', k_vecinos=None):
+    """
+    Descenso por vecindarios variables: aplica movimientos de mejora hasta que
+    ningún vecindario mejore la ruta (óptimo local).
+
+    Args:
+        matriz: Matriz de costos entre nodos (nodo 0 = celda C)
+        ruta: Ruta inicial; si es None se construye con vecino más cercano
+        vecindarios: Vecindarios a explorar, en orden
+        estrategia: 'primera' (primera mejora) o 'mejor' (mejor mejora)
+        k_vecinos: Si se indica, restringe los movimientos a las listas de k vecinos más cercanos
+
+    Returns:
+        Tupla (ruta optimizada, costo)
+    """
+    if estrategia not in ('primera', 'mejor'):
+        raise ValueError(f"Estrategia desconocida: {estrategia}")
+    if ruta is None:
+        ruta = ruta_vecino_mas_cercano(matriz)
+
+    recorrido = [0] + list(ruta) + [0]
+    if len(ruta) < 2:
+        return list(ruta), costo_ruta(matriz, ruta)
+    vecinos = listas_vecinos(matriz, k_vecinos) if k_vecinos else None
+
+    indice = 0
+    while indice < len(vecindarios):
+        movimiento = _buscar_movimiento(vecindarios[indice], matriz, recorrido, estrategia, vecinos)
+        if movimiento is None:
+            indice += 1
+        else:
+            recorrido = movimiento[1]
+            indice = 0  # Volver al primer vecindario tras una mejora
+
+    ruta = recorrido[1:-1]
+    return ruta, costo_ruta(matriz, ruta)
+
+
+def dos_opt(matriz, ruta=None, estrategia='primera', k_vecinos=None):
+    """Optimiza la ruta usando únicamente movimientos 2-opt."""
+    return optimizar_ruta(matriz, ruta, ('2opt',), estrategia, k_vecinos)
+
+
+def or_opt(matriz, ruta=None, estrategia='primera', k_vecinos=None):
+    """Optimiza la ruta usando únicamente movimientos Or-opt."""
+    return optimizar_ruta(matriz, ruta, ('oropt',), estrategia, k_vecinos)
+
+
+def reubicar(matriz, ruta=None, estrategia='primera', k_vecinos=None):
+    """Optimiza la ruta usando únicamente movimientos de reubicación."""
+    return optimizar_ruta(matriz, ruta, ('reubicar',), estrategia, k_vecinos)
+
+
+def _preparar_orden(tablero, orden):
+    """Marca en el tablero la celda C como inicio y los ids de la orden como objetivos."""
+    tablero.limpiar_tablero()
+    tablero.set_inicio(tablero.get_celda_c().get_indice())
+    for id_estanteria in orden:
+        indice = tablero.buscar_por_caracter(str(id_estanteria))
+        if indice is not None:
+            tablero.set_objetivo(indice)
+
+
+def curvas_calidad_tiempo(tablero, ordenes, presupuestos=(10, 25, 50, 100, 200, 1000), semilla=0):
+    """
+    Compara calidad contra tiempo entre el temple simulado actual y la búsqueda local.
+
+    El temple se ejecuta con distintos presupuestos de iteraciones (con los parámetros
+    por defecto la temperatura cae bajo 0.01 a las ~180 iteraciones, por lo que presupuestos
+    mayores no cambian el resultado). La búsqueda local parte de un orden aleatorio e incluye
+    en su tiempo el cálculo de la matriz de costos.
+
+    Returns:
+        Diccionario {configuración: (tiempo medio por orden [s], costo medio, gap medio [%])}
+    """
+    from agente import Agente
+
+    configuraciones = [f"temple {p} it" for p in presupuestos]
+    configuraciones += ["temple + pulido", "local primera", "local mejor", "local primera k=4"]
+    tiempos = {c: [] for c in configuraciones}
+    costos = {c: [] for c in configuraciones}
+
+    for orden in ordenes:
+        _preparar_orden(tablero, orden)
+        if len(tablero.get_objetivos()) < 2:
+            continue
+        agente = Agente(tablero)
+
+        for configuracion in configuraciones:
+            random.seed(semilla)
+            inicio = time.perf_counter()
+            if configuracion.startswith("temple") and configuracion.endswith("it"):
+                _, costo = agente.temple_simulado_orden(max_iteraciones=int(configuracion.split()[1]))
+            elif configuracion == "temple + pulido":
+                orden_temple, _ = agente.temple_simulado_orden()
+                _, costo = agente.pulir_orden(orden_temple)
+            else:
+                orden_inicial = tablero.get_objetivos().copy()
+                random.shuffle(orden_inicial)
+                estrategia = configuracion.split()[1]
+                k_vecinos = 4 if configuracion.endswith("k=4") else None
+                _, costo = agente.pulir_orden(orden_inicial, estrategia=estrategia, k_vecinos=k_vecinos)
+            tiempos[configuracion].append(time.perf_counter() - inicio)
+            costos[configuracion].append(costo)
+
+    # Gap de cada configuración respecto del mejor costo encontrado por orden
+    mejores = [min(costos[c][i] for c in configuraciones) for i in range(len(costos[configuraciones[0]]))]
+    resultados = {}
+    for c in configuraciones:
+        gaps = [100 * (costo - mejor) / mejor for costo, mejor in zip(costos[c], mejores) if mejor > 0]
+        resultados[c] = (sum(tiempos[c]) / max(len(tiempos[c]), 1),
+                         sum(costos[c]) / max(len(costos[c]), 1),
+                         sum(gaps) / max(len(gaps), 1))
+    return resultados
+
+
+def graficar_curvas(resultados, archivo='curvas_busqueda_local.png'):
+    """Grafica gap contra tiempo por orden para cada configuración."""
+    import matplotlib.pyplot as plt
+
+    temple = [(t, g) for c, (t, _, g) in resultados.items() if c.endswith(" it")]
+    plt.figure(figsize=(10, 6))
+    plt.plot([t * 1000 for t, _ in temple], [g for _, g in temple], 'bo-', label='Temple simulado')
+    for c, (t, _, g) in resultados.items():
+        if not c.endswith(" it"):
+            plt.plot(t * 1000, g, 's', markersize=8, label=c)
+    plt.xscale('log')
+    plt.xlabel('Tiempo medio por orden (ms)')
+    plt.ylabel('Gap medio respecto del mejor (%)')
+    plt.title('Calidad vs. tiempo: temple simulado y búsqueda local')
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(archivo)
+    print(f"Gráfico guardado como '{archivo}'")
+
+
+def main():
+    import csv
+    from tablero_modelo import crear_tablero
+
+    tablero = crear_tablero()
+    with open('ordenes.csv', 'r', newline='', encoding='utf-8') as f:
+        ordenes = [[int(item) for item in fila] for fila in csv.reader(f) if fila]
+
+    resultados = curvas_calidad_tiempo(tablero, ordenes)
+    print(f"{'Configuración':<22}{'Tiempo/orden (ms)':>20}{'Costo medio':>14}{'Gap (%)':>10}")
+    for configuracion, (tiempo, costo, gap) in resultados.items():
+        print(f"{configuracion:<22}{tiempo * 1000:>20.2f}{costo:>14.2f}{gap:>10.2f}")
+    graficar_curvas(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# busqueda_tabu.py
+"""
+Búsqueda tabú robusta (Taillard) para asignar ids de estanterías a posiciones.
+
+La asignación se plantea como un problema de asignación cuadrática (QAP):
+- flujo entre dos ids: cantidad de órdenes en que aparecen juntos;
+- distancia entre dos posiciones: costo de recorrido entre sus estanterías físicas;
+- además, un término lineal: frecuencia de cada id x distancia ida y vuelta a C.
+Es el mismo costo que SurrogadoFitness, que aporta las matrices.
+
+Cada movimiento intercambia las posiciones de dos ids. Las variaciones de costo de
+todos los intercambios se guardan en una matriz; tras aplicar un intercambio (u, v),
+las de los pares que no incluyen a u ni a v se actualizan en O(1) cada una y solo se
+recalculan las filas de u y v. Un intercambio es tabú si devuelve a los dos ids a
+posiciones que ocuparon hace poco, salvo que mejore el mejor costo conocido.
+"""
+import random
+import time
+import numpy as np
+from surrogado_fitness import SurrogadoFitness
+
+
+class BusquedaTabu:
+    def __init__(self, estanterias, ordenes, modelo=None, tenencia=None, semilla=None, indice=None):
+        """
+        Args:
+            estanterias: Ids originales de las estanterías, en el orden de los genes
+            ordenes: Órdenes de las que se toma el flujo (co-ocurrencia) y la frecuencia
+            modelo: ModeloAlmacen con la disposición original (por defecto, uno nuevo)
+            tenencia: Iteraciones tabú medias (por defecto, la cantidad de estanterías);
+                      cada movimiento sortea entre 0.9 y 1.1 veces ese valor
+            semilla: Semilla del sorteo de tenencias
+            indice: IndiceOrdenes del que tomar flujo y frecuencia en lugar de `ordenes`
+        """
+        self.estanterias = [str(e) for e in estanterias]
+        problema = SurrogadoFitness(self.estanterias, ordenes, modelo, indice)
+        self.flujo = problema.coocurrencia
+        self.frecuencia = problema.frecuencia
+        self.distancias = problema.distancias
+        self.distancia_c = problema.distancia_c
+        self.n = len(self.estanterias)
+        self.tenencia = tenencia or self.n
+        self.rng = random.Random(semilla)
+
+        self.mejor_individuo = None
+        self.mejor_costo = float('inf')
+        self.historial_costo = []
+        self.iteraciones = 0
+
+    def costo(self, posicion):
+        """Costo QAP de una asignación (posicion[i] = posición del id de índice i)."""
+        g = self.distancias[np.ix_(posicion, posicion)]
+        return float((self.flujo * g).sum() / 2 + (self.frecuencia * self.distancia_c[posicion]).sum())
+
+    def _deltas_filas(self, filas, posicion, g):
+        """Variación de costo de intercambiar cada id de `filas` con cada uno de los demás."""
+        f = self.flujo
+        c = self.distancia_c[posicion]
+        a = (f * g).sum(axis=1)
+        deltas = (f[filas] @ g + g[filas] @ f - a[filas, None] - a[None, :] + 2 * f[filas] * g[filas]
+                  - (self.frecuencia[filas, None] - self.frecuencia[None, :]) * (c[filas, None] - c[None, :]))
+        deltas[np.arange(len(filas)), filas] = 0
+        return deltas
+
+    def _intercambiar(self, posicion, g, deltas, u, v):
+        """Intercambia las posiciones de los ids u y v y actualiza g y la matriz de variaciones."""
+        posicion[[u, v]] = posicion[[v, u]]
+        g[[u, v]] = g[[v, u]]
+        g[:, [u, v]] = g[:, [v, u]]
+
+        # Actualización O(1) por par de los intercambios que no incluyen a u ni a v
+        fu = self.flujo[:, u] - self.flujo[:, v]
+        gu = g[:, u] - g[:, v]
+        deltas += (fu[:, None] - fu[None, :]) * (gu[None, :] - gu[:, None])
+        filas = self._deltas_filas(np.array([u, v]), posicion, g)
+        deltas[[u, v]] = filas
+        deltas[:, [u, v]] = filas.T
+
+    def estado(self, posicion):
+        """Matriz de distancias entre las posiciones de los ids y variaciones de todos los intercambios."""
+        g = self.distancias[np.ix_(posicion, posicion)]
+        return g, self._deltas_filas(np.arange(self.n), posicion, g)
+
+    def posiciones(self, individuo):
+        """Asignación (posición de cada id) de un individuo del algoritmo genético."""
+        indice = {e: i for i, e in enumerate(self.estanterias)}
+        posicion = np.empty(self.n, dtype=np.intp)
+        posicion[[indice[str(e)] for e in individuo]] = np.arange(self.n)
+        return posicion
+
+    def individuo(self, posicion):
+        """Individuo (id que muestra cada posición) de una asignación."""
+        individuo = [None] * self.n
+        for i, k in enumerate(posicion):
+            individuo[k] = self.estanterias[i]
+        return individuo
+
+    def ejecutar(self, individuo_inicial=None, max_iteraciones=10000, tiempo_maximo=30, mostrar_progreso=True):
+        """
+        Ejecuta la búsqueda tabú.
+
+        Args:
+            individuo_inicial: Disposición inicial (por defecto, la original)
+            max_iteraciones: Iteraciones máximas
+            tiempo_maximo: Tiempo máximo en segundos
+            mostrar_progreso: Si es True, informa cada mejora del mejor costo
+
+        Returns:
+            Tupla (mejor individuo, su costo QAP)
+        """
+        posicion = self.posiciones(individuo_inicial or self.estanterias)
+        g, deltas = self.estado(posicion)
+        todos = np.arange(self.n)
+        costo = self.costo(posicion)
+        mejor_posicion, self.mejor_costo = posicion.copy(), costo
+        # tabu[i, k]: iteración hasta la que no se puede volver a poner el id i en la posición k
+        tabu = np.zeros((self.n, self.n), dtype=np.int64)
+        superior = np.triu(np.ones((self.n, self.n), dtype=bool), 1)
+
+        inicio = time.time()
+        iteracion = 0
+        for iteracion in range(1, max_iteraciones + 1):
+            if time.time() - inicio > tiempo_maximo:
+                break
+            prohibido = (tabu[todos[:, None], posicion[None, :]] > iteracion) & \
+                        (tabu[todos[None, :], posicion[:, None]] > iteracion)
+            permitido = superior & (~prohibido | (costo + deltas < self.mejor_costo - 1e-9))
+            if not permitido.any():
+                permitido = superior
+            u, v = np.unravel_index(np.argmin(np.where(permitido, deltas, np.inf)), deltas.shape)
+
+            # Los ids no vuelven pronto a la posición que dejan
+            tabu[u, posicion[u]] = iteracion + self.rng.randint(int(0.9 * self.tenencia), int(1.1 * self.tenencia) + 1)
+            tabu[v, posicion[v]] = iteracion + self.rng.randint(int(0.9 * self.tenencia), int(1.1 * self.tenencia) + 1)
+
+            costo += deltas[u, v]
+            self._intercambiar(posicion, g, deltas, u, v)
+
+            self.historial_costo.append(costo)
+            if costo < self.mejor_costo - 1e-9:
+                mejor_posicion, self.mejor_costo = posicion.copy(), costo
+                if mostrar_progreso:
+                    print(f"\rIteración {iteracion}: mejor costo {self.mejor_costo:.1f}", end="")
+        if mostrar_progreso:
+            print()
+
+        self.iteraciones = iteracion
+        self.mejor_individuo = self.individuo(mejor_posicion)
+        return self.mejor_individuo, self.mejor_costo
+
+
+def main():
+    import argparse
+    from motor_fitness import MotorFitness
+    from procesador_batch import leer_ordenes
+
+    parser = argparse.ArgumentParser(description="Búsqueda tabú de la asignación de estanterías (QAP).")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--iteraciones', type=int, default=10000)
+    parser.add_argument('--tiempo', type=float, default=30)
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args()
+
+    ordenes = leer_ordenes(args.ordenes)
+    estanterias = sorted(str(i) for i in range(1, 49))
+    tabu = BusquedaTabu(estanterias, ordenes, semilla=args.semilla)
+    inicio = time.time()
+    mejor, costo = tabu.ejecutar(max_iteraciones=args.iteraciones, tiempo_maximo=args.tiempo)
+    print(f"{tabu.iteraciones} iteraciones en {time.time() - inicio:.2f}s; costo QAP "
+          f"{tabu.costo(tabu.posiciones(estanterias)):.1f} -> {costo:.1f}")
+
+    # Costo real de recorrido sobre todas las órdenes (disposición original vs. la encontrada)
+    motor = MotorFitness(estanterias, ordenes, max_iteraciones=2000, temp_inicial=30, factor_enfriamiento=0.995)
+    rng = random.Random(0)
+    print(f"Recorrido total: {motor.evaluar(estanterias, rng):.0f} -> {motor.evaluar(mejor, rng):.0f}")
+
+
+if __name__ == "__main__":
+    main()
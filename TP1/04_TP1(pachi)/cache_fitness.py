@@ -0,0 +1,115 @@
+# cache_fitness.py
+"""
+Caché acotada (LRU) del fitness de los individuos del algoritmo genético.
+
+Cada individuo se codifica en forma compacta como los bytes de sus índices uint8 (la
+posición de cada id en la lista de estanterías), en lugar de una tupla de strings.
+Cuenta aciertos, fallos y desalojos por generación y puede persistirse en un archivo
+.npz para que otra corrida con las mismas órdenes y parámetros arranque con la caché
+cargada.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+
+
+def firma_fitness(estanterias, ordenes, **parametros):
+    """Identifica el problema de fitness; la caché en disco solo se reutiliza si coincide."""
+    texto = json.dumps({'estanterias': [str(e) for e in estanterias],
+                        'ordenes': [[str(i) for i in orden] for orden in ordenes],
+                        'parametros': parametros}, sort_keys=True)
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+
+class CacheFitness:
+    def __init__(self, estanterias, capacidad=10000, archivo=None, firma=None):
+        """
+        Args:
+            estanterias: Ids de las estanterías (definen la codificación de los individuos)
+            capacidad: Máximo de individuos guardados; al superarlo se desaloja el menos usado
+            archivo: Archivo .npz de la caché en disco (None = solo en memoria)
+            firma: Firma del problema (ver firma_fitness); la caché en disco se descarta si difiere
+        """
+        if len(estanterias) > 256:
+            raise ValueError("La codificación uint8 admite hasta 256 estanterías")
+        self._indice = {str(e): i for i, e in enumerate(estanterias)}
+        self.capacidad = capacidad
+        self.archivo = archivo
+        self.firma = firma
+        self._entradas = OrderedDict()
+        self.aciertos = self.fallos = self.desalojos = 0
+        self._contadores_generacion = (0, 0, 0)
+        if archivo and os.path.exists(archivo):
+            self.cargar()
+
+    def codificar(self, individuo):
+        return np.fromiter((self._indice[str(e)] for e in individuo), dtype=np.uint8,
+                           count=len(individuo)).tobytes()
+
+    def buscar(self, individuo):
+        """Fitness guardado del individuo, o None si no está."""
+        clave = self.codificar(individuo)
+        fitness = self._entradas.get(clave)
+        if fitness is None:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return fitness
+
+    def guardar(self, individuo, fitness):
+        clave = self.codificar(individuo)
+        self._entradas[clave] = fitness
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+            self.desalojos += 1
+
+    def limpiar(self):
+        self._entradas.clear()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def estadisticas_generacion(self):
+        """Aciertos, fallos y desalojos desde la última llamada."""
+        aciertos, fallos, desalojos = self._contadores_generacion
+        self._contadores_generacion = (self.aciertos, self.fallos, self.desalojos)
+        return {
+            'aciertos': self.aciertos - aciertos,
+            'fallos': self.fallos - fallos,
+            'desalojos': self.desalojos - desalojos,
+            'entradas': len(self._entradas),
+        }
+
+    def exportar(self):
+        """Arreglos (individuos codificados, fitness), del menos al más usado."""
+        largo = len(self._indice)
+        individuos = np.frombuffer(b"".join(self._entradas), dtype=np.uint8).reshape(-1, largo)
+        return individuos, np.array(list(self._entradas.values()), dtype=float)
+
+    def importar(self, individuos, fitness):
+        """Agrega entradas exportadas (ver exportar), respetando la capacidad."""
+        for codigo, valor in zip(individuos, fitness):
+            self._entradas[codigo.tobytes()] = float(valor)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+
+    def cargar(self):
+        datos = np.load(self.archivo)
+        if self.firma is not None and str(datos['firma']) != self.firma:
+            print(f"Caché de fitness '{self.archivo}' descartada: corresponde a otras órdenes o parámetros")
+            return
+        self.importar(datos['individuos'], datos['fitness'])
+        print(f"Caché de fitness cargada: {len(self._entradas)} individuos")
+
+    def guardar_en_disco(self):
+        """Escribe la caché en el archivo de forma atómica (archivo temporal + reemplazo)."""
+        if not self.archivo:
+            return
+        individuos, fitness = self.exportar()
+        temporal = self.archivo + ".tmp.npz"
+        np.savez(temporal, individuos=individuos, fitness=fitness, firma=np.array(self.firma or ""))
+        os.replace(temporal, self.archivo)
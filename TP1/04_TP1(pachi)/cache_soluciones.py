@@ -0,0 +1,118 @@
+# cache_soluciones.py
+"""
+Memoria persistente de soluciones de órdenes.
+
+Cada entrada se identifica por (hash de la disposición, conjunto de ids de la orden) y
+guarda el mejor recorrido conocido y su costo. Además indexa cada conjunto sin uno de
+sus ids, para encontrar en O(tamaño de la orden) una solución guardada que difiera en
+un solo producto y usarla como arranque del temple.
+"""
+import hashlib
+import json
+import os
+
+
+def hash_layout(posiciones):
+    """
+    Hash estable de una disposición de estanterías.
+
+    Args:
+        posiciones: Diccionario {id de estantería: índice de casillero}
+    """
+    texto = ";".join(f"{id_estanteria}:{indice}" for id_estanteria, indice
+                     in sorted((str(k), v) for k, v in posiciones.items()))
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+
+class CacheSoluciones:
+    def __init__(self, archivo=None):
+        """
+        Args:
+            archivo: Archivo JSON donde persistir las soluciones (None = solo en memoria)
+        """
+        self.archivo = archivo
+        self._entradas = {}   # (layout, frozenset ids) -> (ruta, costo)
+        self._parciales = {}  # (layout, frozenset ids sin uno) -> set de frozensets completos
+        self.aciertos = 0
+        self.fallos = 0
+        self.arranques_tibios = 0
+        if archivo and os.path.exists(archivo):
+            self.cargar()
+
+    @staticmethod
+    def _clave(ids):
+        return frozenset(str(i) for i in ids)
+
+    def buscar(self, layout, ids):
+        """Devuelve (ruta, costo) de la orden si está guardada, o None."""
+        entrada = self._entradas.get((layout, self._clave(ids)))
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return list(entrada[0]), entrada[1]
+
+    def guardar(self, layout, ids, ruta, costo):
+        """Guarda la solución si la orden no estaba o si mejora el costo conocido."""
+        conjunto = self._clave(ids)
+        clave = (layout, conjunto)
+        anterior = self._entradas.get(clave)
+        if anterior is not None and anterior[1] <= costo:
+            return
+        self._entradas[clave] = ([str(i) for i in ruta], costo)
+        for id_estanteria in conjunto:
+            self._parciales.setdefault((layout, conjunto - {id_estanteria}), set()).add(conjunto)
+
+    def buscar_parecida(self, layout, ids):
+        """
+        Busca una solución guardada cuya orden difiera en un solo producto (uno de más,
+        uno de menos o uno reemplazado) y la adapta: quita los ids que sobran y devuelve
+        aparte el id que falta, para que el llamador lo inserte donde convenga.
+
+        Returns:
+            Tupla (ruta parcial, ids faltantes) o None si no hay ninguna parecida
+        """
+        conjunto = self._clave(ids)
+        candidatos = set(self._parciales.get((layout, conjunto), ()))  # Guardada con un id de más
+        for id_estanteria in conjunto:
+            reducido = conjunto - {id_estanteria}
+            if (layout, reducido) in self._entradas:                   # Guardada con un id de menos
+                candidatos.add(reducido)
+            candidatos.update(self._parciales.get((layout, reducido), ()))  # Con un id reemplazado
+        candidatos.discard(conjunto)
+        if not candidatos:
+            return None
+
+        # Preferir la de menor costo entre las parecidas
+        similar = min(candidatos, key=lambda c: self._entradas[(layout, c)][1])
+        ruta = [i for i in self._entradas[(layout, similar)][0] if i in conjunto]
+        faltantes = sorted(conjunto - similar)
+        self.arranques_tibios += 1
+        return ruta, faltantes
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'arranques_tibios': self.arranques_tibios,
+        }
+
+    def cargar(self):
+        with open(self.archivo, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        for entrada in datos.get('entradas', []):
+            self.guardar(entrada['layout'], entrada['ids'], entrada['ruta'], entrada['costo'])
+
+    def guardar_en_disco(self):
+        """Escribe la memoria en el archivo de forma atómica (archivo temporal + reemplazo)."""
+        if not self.archivo:
+            return
+        datos = {'entradas': [{'layout': layout, 'ids': sorted(ids, key=int), 'ruta': ruta, 'costo': costo}
+                              for (layout, ids), (ruta, costo) in self._entradas.items()]}
+        temporal = self.archivo + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(datos, f)
+        os.replace(temporal, self.archivo)
@@ -0,0 +1,117 @@
+# carreras_fitness.py
+"""
+Fitness sobre todas las órdenes con mini-lotes y carreras estadísticas.
+
+En cada generación se evalúa a toda la población sobre un mini-lote de órdenes. Los
+mini-lotes recorren permutaciones sucesivas de las órdenes, de modo que todas se usan
+antes de repetir alguna. Si un individuo queda estadísticamente empatado con el mejor
+(la diferencia media pareada no supera z errores estándar), ambos se evalúan sobre
+más órdenes, hasta desempatar o agotarlas. El ranking final usa todas las órdenes.
+
+El fitness de un individuo es el costo medio por orden de las órdenes que se le
+evaluaron, multiplicado por la cantidad total de órdenes (estimación del costo total).
+"""
+import random
+import numpy as np
+
+
+class CarrerasFitness:
+    def __init__(self, motor, tam_lote=8, incremento=4, z=1.64, semilla=None):
+        """
+        Args:
+            motor: MotorFitness con el conjunto completo de órdenes
+            tam_lote: Órdenes del mini-lote de cada generación
+            incremento: Órdenes que se agregan en cada ronda de desempate
+            z: Umbral (en errores estándar) para considerar a un individuo empatado con el mejor
+            semilla: Semilla del muestreo de órdenes y del temple
+        """
+        self.motor = motor
+        self.num_ordenes = len(motor.ordenes)
+        self.tam_lote = min(tam_lote, self.num_ordenes)
+        self.incremento = incremento
+        self.z = z
+        self.rng = random.Random(semilla)
+        self._pendientes = []
+        self._lote = []
+        self._extra = []
+        self._costos = {}  # tupla individuo -> {índice de orden: costo}
+        self.evaluaciones = 0
+        self.rondas_desempate = 0
+        self.nuevo_lote()
+
+    def nuevo_lote(self):
+        """Elige el mini-lote de la generación y el orden en que se agregan órdenes para desempatar."""
+        lote = []
+        while len(lote) < self.tam_lote:
+            if not self._pendientes:
+                self._pendientes = self.rng.sample(range(self.num_ordenes), self.num_ordenes)
+            indice = self._pendientes.pop()
+            if indice not in lote:
+                lote.append(indice)
+        self._lote = lote
+        self._extra = [i for i in self.rng.sample(range(self.num_ordenes), self.num_ordenes) if i not in lote]
+
+    def _costos_individuo(self, clave, indices):
+        costos = self._costos.setdefault(clave, {})
+        faltantes = [i for i in indices if i not in costos]
+        for indice, costo in zip(faltantes, self.motor.costos_ordenes(clave, faltantes, self.rng)):
+            costos[indice] = costo
+        self.evaluaciones += len(faltantes)
+        return np.array([costos[i] for i in indices], dtype=float)
+
+    def _empatado(self, clave, mejor, asignadas):
+        comunes = [i for i in asignadas[clave] if i in set(asignadas[mejor])]
+        diferencias = self._costos_individuo(clave, comunes) - self._costos_individuo(mejor, comunes)
+        if len(diferencias) < 2:
+            return True
+        error = diferencias.std(ddof=1) / np.sqrt(len(diferencias))
+        return diferencias.mean() <= self.z * error
+
+    def evaluar_poblacion(self, poblacion):
+        """
+        Fitness estimado de cada individuo sobre el mini-lote, con carreras para los empatados.
+
+        Returns:
+            Lista de fitness, en el mismo orden que la población
+        """
+        claves = list(dict.fromkeys(tuple(individuo) for individuo in poblacion))
+        # Solo se conservan los costos de los individuos vigentes
+        self._costos = {clave: self._costos.get(clave, {}) for clave in claves}
+        asignadas = {clave: list(self._lote) for clave in claves}
+
+        siguiente = 0
+        while True:
+            medias = {clave: self._costos_individuo(clave, asignadas[clave]).mean() for clave in claves}
+            mejor = min(claves, key=medias.get)
+            empatados = [clave for clave in claves if clave != mejor and self._empatado(clave, mejor, asignadas)]
+            if not empatados or siguiente >= len(self._extra):
+                break
+            nuevas = self._extra[siguiente:siguiente + self.incremento]
+            siguiente += self.incremento
+            self.rondas_desempate += 1
+            for clave in empatados + [mejor]:
+                asignadas[clave] += [i for i in nuevas if i not in asignadas[clave]]
+
+        return [float(medias[tuple(individuo)] * self.num_ordenes) for individuo in poblacion]
+
+    def evaluar_individuo(self, individuo):
+        """
+        Fitness estimado de un individuo sobre el mini-lote, sin carreras. Conserva los
+        costos ya calculados de la población.
+        """
+        return float(self._costos_individuo(tuple(individuo), self._lote).mean() * self.num_ordenes)
+
+    def ranking_final(self, individuos):
+        """
+        Ordena los individuos por su costo sobre todas las órdenes.
+
+        Returns:
+            Lista de tuplas (individuo, costo total), de mejor a peor
+        """
+        todas = list(range(self.num_ordenes))
+        costos = {}
+        for individuo in individuos:
+            clave = tuple(individuo)
+            if clave not in costos:
+                costos[clave] = float(self._costos_individuo(clave, todas).sum())
+        return sorted(((list(clave), costo) for clave, costo in costos.items()), key=lambda par: par[1])
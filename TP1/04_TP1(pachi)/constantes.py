@@ -1,6 +1,3 @@
-import pygame
-
-
 CANT_FILAS = 11
 CANT_COLUMNAS = 13
 
@@ -12,7 +9,7 @@ DARK_GRAY = (100, 100, 100)
 RED = (255, 0, 0) # Color objetivo principal 
 GREEN = (0, 255, 0) # Color Montacargas Inicio
 COLORES_OBJETIVOS = ['red','yellow','sandy brown','blue2','DarkGoldenrod4','bisque3','cyan3','MediumPurple2']
-BLUE = pygame.Color('blue')
+BLUE = (0, 0, 255)
 # Definir tamaño de la ventana y de los casilleros
 WINDOW_WIDTH = 850
 WINDOW_HEIGHT = 600
@@ -0,0 +1,49 @@
+# fitness_paralelo.py
+"""
+Evaluación del fitness del algoritmo genético en un pool de procesos.
+
+Cada proceso trabajador construye una vez su propio MotorFitness (sin pygame) y recibe
+solo la permutación del individuo y una semilla; devuelve el fitness y los recorridos
+resueltos (para el mapa de calor). El proceso principal conserva la caché de fitness y
+el elitismo.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from motor_fitness import MotorFitness
+
+# Motor de fitness de cada proceso trabajador (se inicializa una vez por proceso)
+_motor = None
+
+
+def _inicializar_trabajador(estanterias, ordenes, pesos, parametros_temple):
+    global _motor
+    _motor = MotorFitness(estanterias, ordenes, pesos=pesos, **parametros_temple)
+
+
+def _evaluar(argumentos):
+    individuo, semilla = argumentos
+    fitness = _motor.evaluar(individuo, random.Random(semilla))
+    return fitness, _motor.rutas_individuo(individuo)
+
+
+class EvaluadorParalelo:
+    def __init__(self, estanterias, ordenes, num_procesos=None, pesos=None, **parametros_temple):
+        """
+        Args:
+            estanterias: Ids originales de las estanterías (AlgoritmoGenetico.estanterias)
+            ordenes: Órdenes que se evalúan en cada fitness
+            num_procesos: Procesos del pool (por defecto, uno por núcleo)
+            pesos: Peso de cada orden en el fitness (por defecto, todas pesan 1)
+            parametros_temple: Parámetros del temple de cada orden
+        """
+        self._pool = ProcessPoolExecutor(max_workers=num_procesos, initializer=_inicializar_trabajador,
+                                         initargs=(list(estanterias), [list(o) for o in ordenes],
+                                                   pesos, parametros_temple))
+
+    def evaluar(self, individuos, semillas):
+        """Tuplas (fitness, recorridos) de cada individuo, en el mismo orden (ver MotorFitness.rutas_individuo)."""
+        argumentos = [(list(individuo), semilla) for individuo, semilla in zip(individuos, semillas)]
+        return list(self._pool.map(_evaluar, argumentos))
+
+    def cerrar(self):
+        self._pool.shutdown()
@@ -0,0 +1,133 @@
+# generador_ordenes.py
+"""
+Generador de órdenes sintéticas para pruebas y benchmarks.
+
+Permite controlar:
+    - La distribución del tamaño de las órdenes ('poisson', 'uniforme', 'geometrica' o
+      'empirica', esta última a partir de los tamaños de un CSV real).
+    - La popularidad de los productos, con sesgo Zipf (pocos productos muy pedidos).
+    - La co-ocurrencia: los productos se reparten en grupos de afinidad y, con cierta
+      probabilidad, cada producto nuevo de la orden sale del grupo de uno ya elegido.
+
+Uso:
+    python generador_ordenes.py --cantidad 10000 --salida ordenes_sinteticas.csv
+"""
+import argparse
+import csv
+import numpy as np
+
+DISTRIBUCIONES = ('poisson', 'uniforme', 'geometrica', 'empirica')
+
+
+class GeneradorOrdenes:
+    def __init__(self, ids=range(1, 49), distribucion='poisson', tamanio_medio=6, tamanio_min=1,
+                 tamanio_max=12, tamanios_empiricos=None, exponente_zipf=1.1, grupos_afinidad=8,
+                 prob_afinidad=0.5, semilla=None):
+        """
+        Args:
+            ids: Ids de estantería disponibles
+            distribucion: Distribución del tamaño de orden (ver DISTRIBUCIONES)
+            tamanio_medio: Tamaño medio para 'poisson' y 'geometrica'
+            tamanio_min, tamanio_max: Límites del tamaño de orden
+            tamanios_empiricos: Tamaños observados, para la distribución 'empirica'
+            exponente_zipf: Sesgo de popularidad (0 = uniforme)
+            grupos_afinidad: Cantidad de grupos de productos que suelen pedirse juntos
+            prob_afinidad: Probabilidad de que cada producto adicional salga de un grupo ya presente
+            semilla: Semilla del generador aleatorio
+        """
+        if distribucion not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución desconocida: {distribucion}. Opciones: {', '.join(DISTRIBUCIONES)}")
+        if distribucion == 'empirica' and not tamanios_empiricos:
+            raise ValueError("La distribución 'empirica' necesita tamanios_empiricos")
+
+        self.rng = np.random.default_rng(semilla)
+        self.ids = np.array(list(ids))
+        self.distribucion = distribucion
+        self.tamanio_medio = tamanio_medio
+        self.tamanio_min = tamanio_min
+        self.tamanio_max = min(tamanio_max, len(self.ids))
+        self.tamanios_empiricos = np.array(tamanios_empiricos or [])
+        self.prob_afinidad = prob_afinidad
+
+        # Popularidad Zipf sobre un orden aleatorio de los productos
+        rangos = np.empty(len(self.ids))
+        rangos[self.rng.permutation(len(self.ids))] = np.arange(1, len(self.ids) + 1)
+        pesos = rangos ** -exponente_zipf
+        self.popularidad = pesos / pesos.sum()
+
+        # Grupos de afinidad (cada producto pertenece a uno)
+        self.grupo = self.rng.integers(0, max(grupos_afinidad, 1), size=len(self.ids))
+
+    def _tamanio(self):
+        if self.distribucion == 'poisson':
+            tamanio = 1 + self.rng.poisson(max(self.tamanio_medio - 1, 0))
+        elif self.distribucion == 'uniforme':
+            tamanio = self.rng.integers(self.tamanio_min, self.tamanio_max + 1)
+        elif self.distribucion == 'geometrica':
+            tamanio = self.rng.geometric(1 / max(self.tamanio_medio, 1))
+        else:
+            tamanio = self.rng.choice(self.tamanios_empiricos)
+        return int(np.clip(tamanio, self.tamanio_min, self.tamanio_max))
+
+    def generar_orden(self):
+        """Genera una orden (lista de ids sin repetidos)."""
+        tamanio = self._tamanio()
+        disponibles = np.ones(len(self.ids), dtype=bool)
+        elegidos = []
+        for _ in range(tamanio):
+            pesos = self.popularidad * disponibles
+            if elegidos and self.rng.random() < self.prob_afinidad:
+                # Restringir a los grupos de los productos ya elegidos, si queda alguno
+                afines = pesos * np.isin(self.grupo, self.grupo[elegidos])
+                if afines.sum() > 0:
+                    pesos = afines
+            indice = self.rng.choice(len(self.ids), p=pesos / pesos.sum())
+            elegidos.append(indice)
+            disponibles[indice] = False
+        return [int(self.ids[i]) for i in elegidos]
+
+    def generar(self, cantidad):
+        """Generador de `cantidad` órdenes (no las guarda en memoria)."""
+        for _ in range(cantidad):
+            yield self.generar_orden()
+
+    def escribir_csv(self, archivo, cantidad):
+        """Escribe `cantidad` órdenes en un CSV con el mismo formato que ordenes.csv."""
+        with open(archivo, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for orden in self.generar(cantidad):
+                writer.writerow(orden)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera órdenes sintéticas.")
+    parser.add_argument('--cantidad', type=int, default=1000)
+    parser.add_argument('--salida', default='ordenes_sinteticas.csv')
+    parser.add_argument('--distribucion', default='poisson', choices=DISTRIBUCIONES)
+    parser.add_argument('--tamanio-medio', type=float, default=6)
+    parser.add_argument('--zipf', type=float, default=1.1, help="Exponente de popularidad Zipf")
+    parser.add_argument('--grupos', type=int, default=8, help="Grupos de afinidad")
+    parser.add_argument('--afinidad', type=float, default=0.5, help="Probabilidad de co-ocurrencia")
+    parser.add_argument('--empirico', default=None,
+                        help="CSV (o índice .npz de analitica_ordenes) del que tomar los tamaños ('empirica')")
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args()
+
+    tamanios = None
+    if args.empirico and args.empirico.endswith('.npz'):
+        from analitica_ordenes import IndiceOrdenes
+        tamanios = IndiceOrdenes.cargar(args.empirico).tamanios().tolist()
+    elif args.empirico:
+        with open(args.empirico, 'r', newline='', encoding='utf-8') as f:
+            tamanios = [len(fila) for fila in csv.reader(f) if fila]
+
+    generador = GeneradorOrdenes(distribucion=args.distribucion, tamanio_medio=args.tamanio_medio,
+                                 tamanios_empiricos=tamanios, exponente_zipf=args.zipf,
+                                 grupos_afinidad=args.grupos, prob_afinidad=args.afinidad,
+                                 semilla=args.semilla)
+    generador.escribir_csv(args.salida, args.cantidad)
+    print(f"{args.cantidad} órdenes escritas en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# ingesta_ordenes.py
+"""
+Servicio de ingesta de órdenes en streaming con memoria acotada (asyncio).
+
+Las órdenes se leen de a una desde un archivo CSV o desde un socket local (que hace las
+veces de la fuente de producción), se planifican en paralelo en un pool de procesos y
+los resultados se emiten en JSONL a medida que están listos. Las colas entre etapas
+son acotadas: si los trabajadores no dan abasto, la lectura se detiene (contrapresión),
+por lo que la memoria no depende del tamaño de la entrada.
+
+Uso:
+    python ingesta_ordenes.py --archivo ordenes.csv --salida resultados.jsonl
+    python ingesta_ordenes.py --puerto 9000 --salida -     (cada línea recibida es una orden)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from procesador_batch import _inicializar_trabajador, _resolver
+from resolvedores import RESOLVEDORES
+
+FIN = None  # Marca de fin de flujo entre etapas
+
+
+class EstadisticasLatencia:
+    """
+    Percentiles de latencia con memoria constante: conserva una muestra uniforme
+    (muestreo de reservorio) de tamaño fijo de todas las latencias observadas.
+    """
+    def __init__(self, capacidad=10000, semilla=0):
+        self.capacidad = capacidad
+        self.muestra = []
+        self.cantidad = 0
+        self.maximo = 0.0
+        self._rng = random.Random(semilla)
+
+    def registrar(self, latencia):
+        self.cantidad += 1
+        self.maximo = max(self.maximo, latencia)
+        if len(self.muestra) < self.capacidad:
+            self.muestra.append(latencia)
+        else:
+            j = self._rng.randrange(self.cantidad)
+            if j < self.capacidad:
+                self.muestra[j] = latencia
+
+    def percentiles(self, ps=(50, 90, 99)):
+        if not self.muestra:
+            return {f"p{p}": 0.0 for p in ps}
+        ordenada = sorted(self.muestra)
+        return {f"p{p}": ordenada[min(int(p / 100 * len(ordenada)), len(ordenada) - 1)] for p in ps}
+
+
+def _parsear_linea(linea):
+    """Convierte una línea CSV en una orden; devuelve None si es inválida o está vacía."""
+    linea = linea.strip()
+    if not linea:
+        return None
+    try:
+        return [int(item) for item in linea.split(",")]
+    except ValueError:
+        return None
+
+
+class ServicioIngesta:
+    def __init__(self, metodo='temple+local', num_trabajadores=None, tam_cola=64, semilla=None):
+        """
+        Args:
+            metodo: Método de ruteo (ver resolvedores.RESOLVEDORES)
+            num_trabajadores: Procesos del pool (por defecto, uno por núcleo)
+            tam_cola: Capacidad de las colas de entrada y salida
+            semilla: Semilla base; la orden i usa semilla + i
+        """
+        self.metodo = metodo
+        self.num_trabajadores = num_trabajadores or os.cpu_count()
+        self.tam_cola = tam_cola
+        self.semilla = semilla
+        self.latencias = EstadisticasLatencia()
+        self.tiempos_resolucion = EstadisticasLatencia()
+        self.ordenes_leidas = 0
+        self.lineas_invalidas = 0
+
+    async def _encolar(self, cola, linea):
+        orden = _parsear_linea(linea)
+        if orden is None:
+            if linea.strip():
+                self.lineas_invalidas += 1
+            return
+        self.ordenes_leidas += 1
+        semilla = None if self.semilla is None else self.semilla + self.ordenes_leidas
+        await cola.put((self.ordenes_leidas, orden, semilla, time.perf_counter()))
+
+    async def leer_archivo(self, archivo, cola, bloque=256):
+        """Lee el archivo por bloques de líneas en un hilo aparte para no bloquear el loop."""
+        with open(archivo, 'r', encoding='utf-8') as f:
+            while True:
+                lineas = await asyncio.to_thread(lambda: list(islice(f, bloque)))
+                if not lineas:
+                    break
+                for linea in lineas:
+                    await self._encolar(cola, linea)
+
+    async def leer_socket(self, host, puerto, cola, conexiones=1):
+        """
+        Atiende un socket local: cada línea recibida es una orden. Termina cuando se
+        cerraron `conexiones` conexiones de clientes.
+        """
+        terminadas = asyncio.Event()
+        restantes = [conexiones]
+
+        async def atender(reader, writer):
+            try:
+                while True:
+                    linea = await reader.readline()
+                    if not linea:
+                        break
+                    await self._encolar(cola, linea.decode('utf-8'))
+            finally:
+                writer.close()
+                restantes[0] -= 1
+                if restantes[0] == 0:
+                    terminadas.set()
+
+        servidor = await asyncio.start_server(atender, host, puerto)
+        print(f"Escuchando órdenes en {host}:{puerto}", file=sys.stderr)
+        async with servidor:
+            await terminadas.wait()
+
+    async def _trabajador(self, pool, entrada, salida):
+        loop = asyncio.get_running_loop()
+        while True:
+            tarea = await entrada.get()
+            if tarea is FIN:
+                await salida.put(FIN)
+                return
+            id_orden, orden, semilla, llegada = tarea
+            resultado = await loop.run_in_executor(pool, _resolver, (id_orden, orden, semilla))
+            self.tiempos_resolucion.registrar(resultado['tiempo'])
+            self.latencias.registrar(time.perf_counter() - llegada)
+            await salida.put(resultado)
+
+    async def _escritor(self, salida, destino, num_productores):
+        terminados = 0
+        while terminados < num_productores:
+            resultado = await salida.get()
+            if resultado is FIN:
+                terminados += 1
+                continue
+            destino.write(json.dumps({'orden': resultado['orden'], 'ruta': resultado['ruta'],
+                                      'costo': resultado['costo'],
+                                      'tiempo': resultado['tiempo']}) + "\n")
+
+    async def ejecutar(self, fuente, destino):
+        """
+        Ejecuta el pipeline fuente -> trabajadores -> destino.
+
+        Args:
+            fuente: Corrutina que recibe la cola de entrada y la llena (leer_archivo/leer_socket)
+            destino: Objeto tipo archivo donde se escriben los resultados en JSONL
+
+        Returns:
+            Resumen con cantidad de órdenes, rendimiento y percentiles de latencia
+        """
+        entrada = asyncio.Queue(maxsize=self.tam_cola)
+        salida = asyncio.Queue(maxsize=self.tam_cola)
+        # Dos tareas en vuelo por proceso para que el pool no quede ocioso entre órdenes
+        concurrencia = 2 * self.num_trabajadores
+
+        inicio = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.num_trabajadores, initializer=_inicializar_trabajador,
+                                 initargs=(self.metodo,)) as pool:
+            trabajadores = [asyncio.create_task(self._trabajador(pool, entrada, salida))
+                            for _ in range(concurrencia)]
+            escritor = asyncio.create_task(self._escritor(salida, destino, concurrencia))
+
+            await fuente(entrada)
+            for _ in range(concurrencia):
+                await entrada.put(FIN)
+            await asyncio.gather(*trabajadores)
+            await escritor
+        tiempo_total = time.perf_counter() - inicio
+
+        return {
+            'ordenes': self.latencias.cantidad,
+            'lineas_invalidas': self.lineas_invalidas,
+            'tiempo_total_s': tiempo_total,
+            'ordenes_por_segundo': self.latencias.cantidad / tiempo_total if tiempo_total > 0 else 0.0,
+            'latencia_s': {**self.latencias.percentiles(), 'max': self.latencias.maximo},
+            'resolucion_s': {**self.tiempos_resolucion.percentiles(), 'max': self.tiempos_resolucion.maximo},
+        }
+
+
+async def enviar_ordenes(host, puerto, archivo):
+    """Cliente de prueba: envía las líneas de un archivo al servicio por el socket local."""
+    _, writer = await asyncio.open_connection(host, puerto)
+    with open(archivo, 'r', encoding='utf-8') as f:
+        for linea in f:
+            writer.write(linea.encode('utf-8'))
+            await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingesta y planificación de órdenes en streaming.")
+    parser.add_argument('--archivo', help="CSV de órdenes a leer en streaming")
+    parser.add_argument('--puerto', type=int, help="Escuchar órdenes en un socket local")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--salida', default='-', help="Archivo JSONL de resultados ('-' = stdout)")
+    parser.add_argument('--metodo', default='temple+local', choices=sorted(RESOLVEDORES))
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--cola', type=int, default=64, help="Capacidad de las colas")
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args()
+    if (args.archivo is None) == (args.puerto is None):
+        parser.error("Indique exactamente una fuente: --archivo o --puerto")
+
+    servicio = ServicioIngesta(args.metodo, args.procesos, args.cola, args.semilla)
+    if args.archivo:
+        fuente = lambda cola: servicio.leer_archivo(args.archivo, cola)
+    else:
+        fuente = lambda cola: servicio.leer_socket(args.host, args.puerto, cola)
+
+    destino = sys.stdout if args.salida == '-' else open(args.salida, 'w', encoding='utf-8')
+    try:
+        resumen = asyncio.run(servicio.ejecutar(fuente, destino))
+    finally:
+        if destino is not sys.stdout:
+            destino.close()
+    print(json.dumps(resumen, indent=2), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,12 @@
 import pygame
 import sys
 from constantes import*
+import tablero_modelo as modelo
 import csv
 import os
 
-class Casillero:
-    def __init__(self, x, y, caracter="", libre=True):
-        self.x = x
-        self.y = y
-        self.caracter = caracter
-        self.libre = libre
-        self.color = None
-        self.objetivo = False
-        self.inicio = False
-        self.recorrido = False
-        self.veces_visitado = 0
-    
-    def set_objetivo(self, color):
-        self.color = color
-        self.objetivo = True
-
-    def set_inicio(self):
-        self.color = GREEN
-        self.inicio = True
-        
-    def get_estanteria(self):
-        return "casillero libre" if self.libre else "estanteria"
-    
-    def get_indice(self):
-        return (self.y // CELL_SIZE) * CANT_COLUMNAS + (self.x // CELL_SIZE)
-    
+class Casillero(modelo.Casillero):
+    """Casillero del modelo con su dibujo en pygame."""
     def dibujar(self, screen, visitas = False):
         
         rect = pygame.Rect(self.x,self.y,CELL_SIZE,CELL_SIZE)
@@ -55,96 +32,13 @@ class Casillero:
         text_rect = text.get_rect(center=(self.x + CELL_SIZE // 2, self.y + CELL_SIZE // 2))
         screen.blit(text, text_rect)
     
-    def __str__(self):
-        return f"Soy el casillero: {self.get_indice()}"
-        
-    
 
-class Tablero:
+class Tablero(modelo.Tablero):
+    """Tablero del modelo que se dibuja en una ventana de pygame."""
     def __init__(self, ventana, filas, columnas):
+        super().__init__(filas, columnas)
         self.ventana = ventana
-        self.filas = filas
-        self.columnas = columnas
-        self.casilleros = []
-        self.inicio : Casillero = None
-        self.objetivos = []
-        
-    def get_objetivos(self):
-        return self.objetivos
-    
-    def get_celda_c(self):
-        """Devuelve la casilla que tiene caracter=='C', o None si no existe."""
-        for cas in self.casilleros:
-            if cas.caracter == "C":
-                return cas
-        return None
-
-    
-    def get_inicio(self):
-        return self.inicio
-    
-    def set_inicio(self, indice):
-        self.casilleros[indice].set_inicio()
-        self.inicio = self.casilleros[indice]
-    
-    def set_objetivo(self, indice):
-        self.objetivos.append(self.casilleros[indice])
-        self.casilleros[indice].set_objetivo(COLORES_OBJETIVOS[(len(self.objetivos) - 1) % len(COLORES_OBJETIVOS)])
-        
-    def limpiar_tablero(self):
-        self.inicio = None
-        self.objetivos = []
-        for casillero in self.casilleros:
-            self.casilleros[casillero.get_indice()].color = None
-            self.casilleros[casillero.get_indice()].inicio = False
-            self.casilleros[casillero.get_indice()].objetivo = False
-            self.casilleros[casillero.get_indice()].veces_visitado = 0
         
-    def actualizar_tablero(self, casilleros):
-        for casillero in casilleros:
-            self.casilleros[casillero.get_indice()] = casillero
-            
-    def get_vecinos(self, indice):
-        # Convertir el índice lineal a coordenadas (fila, columna)
-        columna = indice % self.columnas
-        fila = indice // self.columnas
-        
-        # Inicializar una lista para almacenar los vecinos
-        vecinos = []
-
-        # Verificar y agregar el vecino de arriba
-        if fila > 0:
-            if self.get_casillero_por_elemento(fila-1,columna).libre or (self.get_casillero_por_elemento(fila-1,columna).objetivo and not self.casilleros[indice].objetivo):
-                vecinos.append(self.get_casillero_por_elemento(fila-1,columna))  # Arriba
-
-        # Verificar y agregar el vecino de abajo
-        if fila < self.filas - 1:
-            if self.get_casillero_por_elemento(fila+1,columna).libre or (self.get_casillero_por_elemento(fila+1,columna).objetivo and not self.casilleros[indice].objetivo):
-                vecinos.append(self.get_casillero_por_elemento(fila+1,columna))  # Abajo
-
-        # Verificar y agregar el vecino de la izquierda
-        if columna > 0:
-            if self.get_casillero_por_elemento(fila,columna-1).libre or (self.get_casillero_por_elemento(fila,columna-1).objetivo and not self.casilleros[indice].objetivo):
-                vecinos.append(self.get_casillero_por_elemento(fila,columna-1))  # Izquierda
-
-        # Verificar y agregar el vecino de la derecha
-        if columna < self.columnas - 1:
-            if self.get_casillero_por_elemento(fila,columna+1).libre or (self.get_casillero_por_elemento(fila,columna+1).objetivo and not self.casilleros[indice].objetivo):
-                vecinos.append(self.get_casillero_por_elemento(fila,columna+1))  # Derecha
-        return vecinos
-        
-    def buscar_por_caracter(self,caracter):
-        for casillero in self.casilleros:
-            if casillero.caracter == caracter:
-                return casillero.get_indice()
-
-    def agregar_casillero(self, casillero):
-        self.casilleros.append(casillero)
-        
-    def get_casillero_por_elemento(self, fila, columna):
-        indice = fila*self.columnas + columna
-        return self.casilleros[indice]
-
     def dibujar(self, instrucciones, visitas = False):
         self.ventana.fill(WHITE)
         if instrucciones:
@@ -167,19 +61,6 @@ class Tablero:
         for casillero in self.casilleros:
             casillero.dibujar(self.ventana, visitas)
         pygame.display.flip()
-        
-    def __str__(self):
-        text = ""
-        if self.inicio is not None:
-            text += f"Mi casillero indice es: {self.inicio.get_indice()} \n y los casilleros objetivos son:\n "
-        else:
-            text += "No ha marcado el casillero indice\n"
-        if len(self.objetivos) != 0:
-            for casillero in self.objetivos:
-                text += f"--- {casillero.get_indice()}\n"
-        else:
-            text+= "No ha marcado casilleros objetivos"
-        return text
     
 class MenuSelector:
     def __init__(self, archivo, ventana):
@@ -0,0 +1,186 @@
+# islas.py
+"""
+Algoritmo genético en islas: varias poblaciones en procesos separados con migración.
+
+Cada isla es un AlgoritmoGenetico con sus propias tasas y operadores, sobre su propio
+tablero sin interfaz y con el fitness sobre la tabla de distancias (motor_fitness); las
+demás opciones (pesos de órdenes, carreras, surrogado, etc.) son comunes a todas.
+Cada `intervalo_migracion` generaciones, una isla envía copias de sus mejores
+individuos a la siguiente isla del anillo por una cola y reemplaza a sus peores
+individuos por los que haya recibido. Al final se toma el mejor individuo de todas
+las islas y se informa la convergencia de cada una.
+
+Uso:
+    python islas.py --islas 4 --poblacion 20 --generaciones 100
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import random
+import time
+
+
+def configuraciones_islas(num_islas, tasa_cruce=0.8, tasa_mutacion=0.2):
+    """
+    Parámetros de cada isla: las tasas de mutación se reparten entre la mitad y el doble
+    de la indicada y los operadores de cruce y mutación se alternan.
+    """
+    configuraciones = []
+    for i in range(num_islas):
+        factor = 0.5 + 1.5 * i / (num_islas - 1) if num_islas > 1 else 1.0
+        configuraciones.append({
+            'tasa_cruce': tasa_cruce,
+            'tasa_mutacion': round(min(tasa_mutacion * factor, 1.0), 3),
+            'operador_cruce': ('pmx', 'ox')[i % 2],
+            'operador_mutacion': ('intercambio', 'inversion')[(i // 2) % 2],
+        })
+    return configuraciones
+
+
+def _ejecutar_isla(isla, ordenes, parametros, configuracion, entrada, salida, resultados, semilla):
+    """Proceso de una isla: ejecuta el algoritmo genético y migra por las colas del anillo."""
+    from tablero_modelo import crear_tablero
+    from algoritmo_genetico import AlgoritmoGenetico
+
+    # Las colas pueden quedar con migrantes sin leer al terminar
+    entrada.cancel_join_thread()
+    salida.cancel_join_thread()
+    random.seed(semilla)
+    telemetria = {'isla': isla, 'configuracion': configuracion, 'migrantes_enviados': 0,
+                  'migrantes_recibidos': 0, 'generacion_ultima_mejora': 0}
+
+    def migrar(ag, generacion, fitness):
+        if ag.historial_fitness[-1] < ag.historial_fitness[-2]:
+            telemetria['generacion_ultima_mejora'] = generacion + 1
+        if not parametros['num_migrantes'] or (generacion + 1) % parametros['intervalo_migracion'] != 0:
+            return
+        mejores = fitness.argsort(kind='stable')[:parametros['num_migrantes']]
+        salida.put(ag.individuos(ag.poblacion[mejores]))
+        telemetria['migrantes_enviados'] += len(mejores)
+        inmigrantes = []
+        while True:
+            try:
+                inmigrantes += entrada.get_nowait()
+            except queue.Empty:
+                break
+        if inmigrantes:
+            ag.reemplazar_peores(inmigrantes, fitness)
+            telemetria['migrantes_recibidos'] += len(inmigrantes)
+
+    inicio = time.time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ag = AlgoritmoGenetico(crear_tablero(), ordenes, tam_poblacion=parametros['tam_poblacion'],
+                               num_generaciones=parametros['num_generaciones'], elitismo=parametros['elitismo'],
+                               motor_fitness=True, **parametros['ag'], **configuracion)
+        ag.ejecutar(tiempo_maximo=parametros['tiempo_maximo'], generaciones_sin_mejora=None,
+                    al_terminar_generacion=migrar)
+    telemetria.update({
+        'mejor_individuo': ag.mejor_individuo,
+        'mejor_fitness': ag.mejor_fitness,
+        'historial_fitness': ag.historial_fitness,
+        'historial_promedio': ag.historial_promedio,
+        'generaciones': len(ag.historial_fitness) - 1,
+        'rutas': ag.rutas_mejor(),
+        'tiempo': time.time() - inicio,
+    })
+    resultados.put(telemetria)
+
+
+def ejecutar_islas(ordenes, num_islas=None, tam_poblacion=10, num_generaciones=50, elitismo=2,
+                   intervalo_migracion=5, num_migrantes=2, tasa_cruce=0.8, tasa_mutacion=0.2,
+                   tiempo_maximo=300, semilla=None, parametros_ag=None):
+    """
+    Ejecuta el algoritmo genético en islas y combina los resultados.
+
+    Args:
+        ordenes: Lista de órdenes
+        num_islas: Cantidad de islas (procesos); por defecto, una por núcleo
+        tam_poblacion: Individuos de cada isla
+        num_generaciones: Generaciones de cada isla
+        elitismo: Elitismo de cada isla
+        intervalo_migracion: Cada cuántas generaciones migran los mejores individuos
+        num_migrantes: Individuos que envía cada isla en cada migración
+        tasa_cruce, tasa_mutacion: Tasas de referencia (ver configuraciones_islas)
+        tiempo_maximo: Tiempo máximo de cada isla, en segundos
+        semilla: Semilla de las islas (None = aleatoria)
+        parametros_ag: Otros parámetros de AlgoritmoGenetico, iguales en todas las islas (no
+                       pueden incluir las tasas ni los operadores, que define cada isla)
+
+    Returns:
+        Diccionario con el mejor individuo, su fitness y la telemetría de cada isla
+    """
+    num_islas = num_islas or os.cpu_count() or 1
+    if num_islas == 1:
+        # Una sola isla no tiene a quién enviar migrantes
+        num_migrantes = 0
+    parametros = {'tam_poblacion': tam_poblacion, 'num_generaciones': num_generaciones, 'elitismo': elitismo,
+                  'intervalo_migracion': intervalo_migracion, 'num_migrantes': num_migrantes,
+                  'tiempo_maximo': tiempo_maximo, 'ag': dict(parametros_ag or {})}
+    generador = random.Random(semilla)
+    colas = [multiprocessing.Queue() for _ in range(num_islas)]
+    resultados = multiprocessing.Queue()
+
+    procesos = []
+    for isla, configuracion in enumerate(configuraciones_islas(num_islas, tasa_cruce, tasa_mutacion)):
+        # Topología en anillo: cada isla envía a la siguiente
+        proceso = multiprocessing.Process(
+            target=_ejecutar_isla,
+            args=(isla, ordenes, parametros, configuracion, colas[isla], colas[(isla + 1) % num_islas],
+                  resultados, generador.getrandbits(32)))
+        proceso.start()
+        procesos.append(proceso)
+
+    # Leer los resultados antes de esperar a los procesos (la cola se vacía mientras tanto)
+    telemetria = []
+    while len(telemetria) < num_islas:
+        try:
+            telemetria.append(resultados.get(timeout=1))
+        except queue.Empty:
+            if not any(proceso.is_alive() for proceso in procesos) and resultados.empty():
+                break
+    for proceso in procesos:
+        proceso.join()
+    if not telemetria:
+        raise RuntimeError("Ninguna isla terminó correctamente")
+
+    telemetria.sort(key=lambda t: t['isla'])
+    mejor = min(telemetria, key=lambda t: t['mejor_fitness'])
+    return {'mejor_individuo': mejor['mejor_individuo'], 'mejor_fitness': mejor['mejor_fitness'],
+            'mejor_isla': mejor['isla'], 'islas': telemetria}
+
+
+def imprimir_telemetria(resultado):
+    print(f"\n{'Isla':>4} {'Mut.':>6} {'Cruce':>6} {'Mutación':>12} {'Gens':>5} {'Últ. mejora':>11} "
+          f"{'Recibidos':>9} {'Mejor':>8} {'Tiempo':>8}")
+    for t in resultado['islas']:
+        c = t['configuracion']
+        print(f"{t['isla']:>4} {c['tasa_mutacion']:>6} {c['operador_cruce']:>6} {c['operador_mutacion']:>12} "
+              f"{t['generaciones']:>5} {t['generacion_ultima_mejora']:>11} {t['migrantes_recibidos']:>9} "
+              f"{t['mejor_fitness']:>8.1f} {t['tiempo']:>7.1f}s")
+    print(f"Mejor disposición: isla {resultado['mejor_isla']}, fitness {resultado['mejor_fitness']:.1f}")
+
+
+def main():
+    from procesador_batch import leer_ordenes
+
+    parser = argparse.ArgumentParser(description="Algoritmo genético en islas con migración.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--islas', type=int, default=None, help="Cantidad de islas (por defecto, una por núcleo)")
+    parser.add_argument('--poblacion', type=int, default=10)
+    parser.add_argument('--generaciones', type=int, default=50)
+    parser.add_argument('--intervalo', type=int, default=5, help="Generaciones entre migraciones")
+    parser.add_argument('--migrantes', type=int, default=2)
+    parser.add_argument('--semilla', type=int, default=None)
+    args = parser.parse_args()
+
+    resultado = ejecutar_islas(leer_ordenes(args.ordenes), args.islas, args.poblacion, args.generaciones,
+                               intervalo_migracion=args.intervalo, num_migrantes=args.migrantes,
+                               semilla=args.semilla)
+    imprimir_telemetria(resultado)
+
+
+if __name__ == "__main__":
+    main()
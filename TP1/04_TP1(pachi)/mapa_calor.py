@@ -0,0 +1,167 @@
+# mapa_calor.py
+"""
+Mapa de calor de visitas a partir de recorridos ya calculados.
+
+Un recorrido es la secuencia de estanterías visitadas (C al principio y al final). En
+lugar de reconstruir cada camino celda por celda, se cuentan las veces que se recorre
+cada tramo entre nodos (C o estanterías) con np.add.at; al pedir el mapa, cada tramo
+aporta sus celdas (ModeloAlmacen.tramos, calculados una sola vez) multiplicadas por su
+cuenta. La memoria y el costo del mapa no dependen de la cantidad de órdenes y no se
+buscan caminos nuevos.
+
+Uso (con los resultados de procesador_batch):
+    python mapa_calor.py --resultados resultados.jsonl --salida mapa_calor.png
+"""
+import argparse
+import csv
+import json
+from itertools import chain, islice
+import numpy as np
+from modelo_almacen import ModeloAlmacen
+
+
+class MapaCalor:
+    def __init__(self, modelo=None):
+        """
+        Args:
+            modelo: ModeloAlmacen con la geometría del almacén (por defecto, uno nuevo)
+        """
+        self.modelo = modelo or ModeloAlmacen()
+        self._celdas = np.array([self.modelo.indice_c] + [self.modelo.posiciones[c] for c in self.modelo.nodos()[1:]])
+        # Nodo de la tabla de costos de cada celda (-1 si no es C ni estantería)
+        self._nodo_celda = np.full(self.modelo.filas * self.modelo.columnas, -1, dtype=np.int64)
+        self._nodo_celda[self._celdas] = np.arange(len(self._celdas))
+        self.visitas_tramos = np.zeros((len(self._celdas), len(self._celdas)), dtype=np.int64)
+        self.num_rutas = 0
+
+    def acumular(self, rutas, bloque=100000):
+        """
+        Suma los tramos de cada recorrido.
+
+        Args:
+            rutas: Iterable de recorridos; cada uno es la lista de celdas (índices de casillero)
+                   de las estanterías en orden de visita, sin la celda C
+            bloque: Recorridos procesados por vez (acota la memoria)
+        """
+        rutas = iter(rutas)
+        c = self.modelo.indice_c
+        while True:
+            parte = list(islice(rutas, bloque))
+            if not parte:
+                break
+            # C, ruta 1, C, ruta 2, C...: cada par consecutivo es un tramo
+            celdas = np.fromiter(chain([c], chain.from_iterable(chain(ruta, [c]) for ruta in parte)), dtype=np.int64)
+            nodos = self._nodo_celda[celdas]
+            if (nodos < 0).any():
+                raise ValueError("Los recorridos solo pueden visitar estanterías")
+            np.add.at(self.visitas_tramos, (nodos[:-1], nodos[1:]), 1)
+            self.num_rutas += len(parte)
+
+    def matriz(self):
+        """Matriz (filas x columnas) de visitas a cada casillero."""
+        tramos = self.modelo.tramos()
+        origenes, destinos = np.nonzero(self.visitas_tramos)
+        celdas = [tramos[a][b] for a, b in zip(origenes, destinos)]
+        conteo = np.zeros(self.modelo.filas * self.modelo.columnas, dtype=np.int64)
+        if celdas:
+            pesos = np.repeat(self.visitas_tramos[origenes, destinos], [len(t) for t in celdas])
+            np.add.at(conteo, np.concatenate(celdas), pesos)
+        # La celda C de partida de cada recorrido (los tramos no incluyen su celda de partida)
+        conteo[self.modelo.indice_c] += self.num_rutas
+        return conteo.reshape(self.modelo.filas, self.modelo.columnas)
+
+    def ordenar_vecino_mas_cercano(self, celdas):
+        """
+        Orden de visita aproximado de un conjunto de estanterías (la más cercana primero),
+        sobre la tabla de costos; para órdenes sin recorrido calculado.
+        """
+        tabla = self.modelo.tabla_costos()
+        pendientes = list(dict.fromkeys(int(celda) for celda in celdas))
+        actual, ruta = 0, []
+        while pendientes:
+            siguiente = min(pendientes, key=lambda celda: tabla[actual, self._nodo_celda[celda]])
+            pendientes.remove(siguiente)
+            ruta.append(siguiente)
+            actual = self._nodo_celda[siguiente]
+        return ruta
+
+    def guardar(self, archivo):
+        np.savez_compressed(archivo, visitas_tramos=self.visitas_tramos, num_rutas=self.num_rutas)
+
+    def cargar(self, archivo):
+        """Suma las visitas guardadas en el archivo a las acumuladas."""
+        datos = np.load(archivo)
+        self.visitas_tramos += datos['visitas_tramos']
+        self.num_rutas += int(datos['num_rutas'])
+
+
+def dibujar_mapa_calor(matriz, etiquetas, archivo, titulo='Mapa de calor de frecuencia de visitas', mostrar=True):
+    """
+    Dibuja la matriz de visitas y la guarda en un archivo.
+
+    Args:
+        matriz: Matriz (filas x columnas) de visitas (ver MapaCalor.matriz)
+        etiquetas: Diccionario {(fila, columna): texto}, por ejemplo el id de cada estantería
+        archivo: Imagen de salida
+        titulo: Título del gráfico
+        mostrar: Si es True, además muestra la figura
+    """
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 10))
+    plt.imshow(matriz, cmap='hot', interpolation='nearest')
+    plt.colorbar(label='Frecuencia de visitas')
+    for (fila, columna), texto in etiquetas.items():
+        plt.text(columna, fila, texto, ha='center', va='center', color='white', fontweight='bold')
+    plt.title(titulo)
+    plt.xlabel('Columna')
+    plt.ylabel('Fila')
+    plt.tight_layout()
+    plt.savefig(archivo)
+    if mostrar:
+        plt.show()
+    plt.close()
+
+
+def rutas_resultados(resultados, modelo):
+    """Recorridos (celdas) de los resultados de procesador_batch (rutas de ids, disposición original)."""
+    for resultado in resultados:
+        yield [modelo.posiciones[str(i)] for i in resultado['ruta']]
+
+
+def leer_resultados(archivo):
+    """Lee los resultados escritos por procesador_batch.escribir_resultados (.jsonl o .csv)."""
+    with open(archivo, 'r', newline='', encoding='utf-8') as f:
+        if archivo.endswith('.jsonl'):
+            for linea in f:
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            for fila in csv.DictReader(f):
+                # Ruta "C-3-17-C"
+                yield {'ruta': fila['ruta'].split("-")[1:-1]}
+
+
+def main():
+    import time
+
+    parser = argparse.ArgumentParser(description="Mapa de calor de visitas a partir de recorridos calculados.")
+    parser.add_argument('--resultados', default='resultados.csv', help="Salida de procesador_batch (.csv o .jsonl)")
+    parser.add_argument('--salida', default='mapa_calor.png')
+    args = parser.parse_args()
+
+    modelo = ModeloAlmacen()
+    mapa = MapaCalor(modelo)
+    inicio = time.perf_counter()
+    mapa.acumular(rutas_resultados(leer_resultados(args.resultados), modelo))
+    matriz = mapa.matriz()
+    print(f"{mapa.num_rutas} recorridos acumulados en {time.perf_counter() - inicio:.3f}s")
+
+    etiquetas = {divmod(celda, modelo.columnas): caracter for celda, caracter in enumerate(modelo.caracteres)
+                 if caracter}
+    dibujar_mapa_calor(matriz, etiquetas, args.salida, mostrar=False)
+    print(f"Mapa de calor guardado en '{args.salida}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# memetico.py
+"""
+Modo memético del algoritmo genético: búsqueda local sobre los mejores individuos.
+
+En cada generación, los k mejores individuos se mejoran con una escalada por
+intercambios (el mejor intercambio de dos ids, mientras baje el costo) sobre el costo
+QAP de busqueda_tabu, con las variaciones de costo actualizadas en forma incremental.
+El presupuesto (intercambios por generación) se reparte entre los k individuos. Los
+individuos mejorados reemplazan a los originales solo si su fitness real no empeora.
+
+Uso (comparación con el algoritmo genético sin búsqueda local):
+    python memetico.py --generaciones 40 --k 2 --presupuesto 100
+"""
+import numpy as np
+from busqueda_tabu import BusquedaTabu
+
+
+class EscaladaIntercambios:
+    def __init__(self, estanterias, ordenes, modelo=None):
+        """
+        Args:
+            estanterias: Ids originales de las estanterías, en el orden de los genes
+            ordenes: Órdenes de las que se toman el flujo y las frecuencias del costo QAP
+            modelo: ModeloAlmacen con la disposición original (por defecto, uno nuevo)
+        """
+        self.problema = BusquedaTabu(estanterias, ordenes, modelo)
+        self._superior = np.triu(np.ones((self.problema.n, self.problema.n), dtype=bool), 1)
+
+    def mejorar(self, individuo, presupuesto):
+        """
+        Aplica el mejor intercambio mientras mejore el costo y quede presupuesto.
+
+        Args:
+            individuo: Disposición (lista de ids) a mejorar
+            presupuesto: Máximo de intercambios
+
+        Returns:
+            Tupla (individuo mejorado, intercambios realizados, variación del costo QAP)
+        """
+        problema = self.problema
+        posicion = problema.posiciones(individuo)
+        g, deltas = problema.estado(posicion)
+        variacion = 0.0
+        intercambios = 0
+        while intercambios < presupuesto:
+            u, v = np.unravel_index(np.argmin(np.where(self._superior, deltas, np.inf)), deltas.shape)
+            if deltas[u, v] >= -1e-9:
+                break
+            variacion += deltas[u, v]
+            problema._intercambiar(posicion, g, deltas, u, v)
+            intercambios += 1
+        return problema.individuo(posicion), intercambios, variacion
+
+
+def generacion_objetivo(historial, objetivo):
+    """Primera generación cuyo mejor fitness alcanza el objetivo (None si no lo alcanza)."""
+    for generacion, fitness in enumerate(historial):
+        if fitness <= objetivo:
+            return generacion
+    return None
+
+
+def main():
+    import argparse
+    import contextlib
+    import io
+    import random
+    from algoritmo_genetico import AlgoritmoGenetico
+    from procesador_batch import leer_ordenes
+    from tablero_modelo import crear_tablero
+
+    parser = argparse.ArgumentParser(description="Compara el algoritmo genético con y sin búsqueda local.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--poblacion', type=int, default=10)
+    parser.add_argument('--generaciones', type=int, default=40)
+    parser.add_argument('--k', type=int, default=2, help="Individuos mejorados por generación")
+    parser.add_argument('--presupuesto', type=int, default=100, help="Intercambios por generación")
+    parser.add_argument('--semillas', type=int, default=3)
+    args = parser.parse_args()
+
+    ordenes = leer_ordenes(args.ordenes)
+    corridas = {'genético': [], 'memético': []}
+    for semilla in range(args.semillas):
+        for modo, k in (('genético', 0), ('memético', args.k)):
+            random.seed(semilla)
+            with contextlib.redirect_stdout(io.StringIO()):
+                ag = AlgoritmoGenetico(crear_tablero(), ordenes, tam_poblacion=args.poblacion,
+                                       num_generaciones=args.generaciones, motor_fitness=True,
+                                       memetico_k=k, presupuesto_memetico=args.presupuesto)
+                ag.ejecutar(generaciones_sin_mejora=None)
+            corridas[modo].append(ag)
+
+    # Objetivo: el peor de los mejores fitness finales del algoritmo genético sin búsqueda local
+    objetivo = max(ag.mejor_fitness for ag in corridas['genético'])
+    print(f"Objetivo: fitness <= {objetivo:.1f} ({args.semillas} semillas, {args.generaciones} generaciones)")
+    print(f"{'Modo':>9} {'Mejor medio':>12} {'Gens. al objetivo':>18} {'Tiempo al objetivo':>19} {'Tiempo total':>13}")
+    for modo, algoritmos in corridas.items():
+        generaciones, tiempos = [], []
+        for ag in algoritmos:
+            generacion = generacion_objetivo(ag.historial_fitness, objetivo)
+            if generacion is not None:
+                generaciones.append(generacion)
+                tiempos.append(ag.historial_tiempo[generacion])
+        alcanzado = f"{np.mean(generaciones):.1f}" if generaciones else "-"
+        tiempo = f"{np.mean(tiempos):.2f}s" if tiempos else "-"
+        print(f"{modo:>9} {np.mean([ag.mejor_fitness for ag in algoritmos]):>12.1f} "
+              f"{alcanzado + f' ({len(generaciones)}/{len(algoritmos)})':>18} {tiempo:>19} "
+              f"{np.mean([ag.historial_tiempo[-1] for ag in algoritmos]):>12.2f}s")
+
+
+if __name__ == "__main__":
+    main()
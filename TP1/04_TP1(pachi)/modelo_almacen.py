@@ -0,0 +1,158 @@
+# modelo_almacen.py
+"""
+Modelo del almacén sin dependencias gráficas (no importa pygame).
+
+Reproduce la misma disposición que Aplicacion.llenar_tablero y calcula la tabla de
+costos de tramo (en pasos) entre la celda C y todas las estanterías, equivalente a
+los costos que obtiene A* sobre el Tablero. También reconstruye los caminos (celda por
+celda) de cada tramo, para acumular recorridos sin volver a buscarlos.
+"""
+from collections import deque
+import numpy as np
+from constantes import CANT_FILAS, CANT_COLUMNAS
+
+
+class ModeloAlmacen:
+    def __init__(self, filas=CANT_FILAS, columnas=CANT_COLUMNAS):
+        self.filas = filas
+        self.columnas = columnas
+        self.caracteres = []
+        self.libres = []
+        self._construir_layout()
+
+        # Posición (índice lineal) de cada estantería y de la celda C
+        self.posiciones = {c: i for i, c in enumerate(self.caracteres) if c and c != "C"}
+        self.indice_c = self.caracteres.index("C")
+        self._tabla = None
+        self._nodos = None
+        self._tramos = None
+
+    def _construir_layout(self):
+        """Misma disposición de 11 x 13 que Aplicacion.llenar_tablero."""
+        set1, set2, set3 = 1, 9, 17
+        for num_casillero in range(self.filas * self.columnas):
+            i = num_casillero // self.columnas
+            j = num_casillero % self.columnas
+            caracter, libre = "", True
+
+            if i == 5 and j == 0:
+                caracter = "C"
+            elif ((1 < j < 4) or (5 < j < 8) or (9 < j < 12)) and (i % 5 != 0):
+                libre = False
+                if 1 < j < 4:
+                    caracter = f"{set1}" if i < 5 else f"{set1 + 16}"
+                    set1 += 1
+                elif 5 < j < 8:
+                    caracter = f"{set2}" if i < 5 else f"{set2 + 16}"
+                    set2 += 1
+                else:
+                    caracter = f"{set3}" if i < 5 else f"{set3 + 16}"
+                    set3 += 1
+            self.caracteres.append(caracter)
+            self.libres.append(libre)
+
+    def get_vecinos_libres(self, indice):
+        """Vecinos (arriba, abajo, izquierda, derecha) transitables de una celda."""
+        fila, columna = divmod(indice, self.columnas)
+        vecinos = []
+        if fila > 0:
+            vecinos.append(indice - self.columnas)
+        if fila < self.filas - 1:
+            vecinos.append(indice + self.columnas)
+        if columna > 0:
+            vecinos.append(indice - 1)
+        if columna < self.columnas - 1:
+            vecinos.append(indice + 1)
+        return [v for v in vecinos if self.libres[v]]
+
+    def _busqueda_amplitud(self, indice):
+        """Distancia en pasos y celda previa de cada celda libre (BFS por pasillos desde `indice`)."""
+        infinito = float('inf')
+        distancias = [infinito] * len(self.caracteres)
+        previas = [None] * len(self.caracteres)
+        distancias[indice] = 0
+        cola = deque([indice])
+        while cola:
+            actual = cola.popleft()
+            for vecino in self.get_vecinos_libres(actual):
+                if distancias[vecino] == infinito:
+                    distancias[vecino] = distancias[actual] + 1
+                    previas[vecino] = actual
+                    cola.append(vecino)
+        return distancias, previas
+
+    def distancias_desde(self, indice):
+        """
+        Distancia en pasos desde una celda a todas las demás (BFS por pasillos).
+        Una estantería se alcanza desde un pasillo adyacente y se sale de ella hacia
+        un pasillo, igual que en Tablero.get_vecinos con la estantería como objetivo.
+        """
+        infinito = float('inf')
+        distancias, _ = self._busqueda_amplitud(indice)
+
+        # Las estanterías se alcanzan con un paso más desde su pasillo adyacente
+        for celda, libre in enumerate(self.libres):
+            if not libre and celda != indice:
+                adyacentes = [distancias[v] for v in self.get_vecinos_libres(celda)]
+                distancias[celda] = min(adyacentes, default=infinito) + 1
+        return distancias
+
+    def caminos_desde(self, origen, destinos):
+        """
+        Un camino más corto (lista de celdas, origen y destino incluidos) desde `origen` a
+        cada celda de `destinos`, con el mismo criterio que distancias_desde; None si no hay.
+        """
+        distancias, previas = self._busqueda_amplitud(origen)
+        caminos = []
+        for destino in destinos:
+            if destino == origen:
+                caminos.append([origen])
+                continue
+            llegada = destino
+            if not self.libres[destino]:
+                # Se entra a la estantería desde su pasillo adyacente más cercano
+                llegada = min(self.get_vecinos_libres(destino), key=lambda v: distancias[v], default=None)
+            if llegada is None or distancias[llegada] == float('inf'):
+                caminos.append(None)
+                continue
+            camino = []
+            celda = llegada
+            while celda != origen:
+                camino.append(celda)
+                celda = previas[celda]
+            camino = [origen] + camino[::-1]
+            if llegada != destino:
+                camino.append(destino)
+            caminos.append(camino)
+        return caminos
+
+    def tramos(self):
+        """
+        Celdas de cada tramo entre nodos de la tabla de costos: tramos()[a][b] es un arreglo
+        con las celdas del camino de a a b sin la celda de partida (vacío si a == b).
+        """
+        if self._tramos is None:
+            celdas = [self.indice_c] + [self.posiciones[c] for c in self.nodos()[1:]]
+            self._tramos = [[np.array(camino[1:] if camino else [], dtype=np.int64)
+                             for camino in self.caminos_desde(origen, celdas)] for origen in celdas]
+        return self._tramos
+
+    def nodos(self):
+        """Orden de los nodos de la tabla de costos: 'C' y luego las estanterías por id."""
+        if self._nodos is None:
+            self._nodos = ["C"] + sorted(self.posiciones, key=int)
+        return self._nodos
+
+    def tabla_costos(self):
+        """Matriz (n+1 x n+1) de costos de tramo entre la celda C y todas las estanterías."""
+        if self._tabla is None:
+            celdas = [self.indice_c] + [self.posiciones[c] for c in self.nodos()[1:]]
+            filas = [self.distancias_desde(origen) for origen in celdas]
+            self._tabla = np.array([[fila[destino] for destino in celdas] for fila in filas], dtype=float)
+        return self._tabla
+
+    def indices_orden(self, orden):
+        """Índices en la tabla de costos de los ids de una orden (se ignoran los desconocidos)."""
+        indice_nodo = {c: i for i, c in enumerate(self.nodos())}
+        return [indice_nodo[str(id_estanteria)] for id_estanteria in orden
+                if str(id_estanteria) in indice_nodo]
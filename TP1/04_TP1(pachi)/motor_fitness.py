@@ -0,0 +1,177 @@
+# motor_fitness.py
+"""
+Fitness del algoritmo genético sobre distancias fijas entre posiciones.
+
+El algoritmo genético solo cambia qué id muestra cada estantería física: la geometría
+del almacén no cambia. Por eso la tabla de costos entre posiciones (celda C y cada
+estantería física) se calcula una sola vez y cada individuo se evalúa traduciendo los
+ids de cada orden a posiciones y resolviendo el recorrido sobre esa tabla, sin tocar
+el tablero ni buscar caminos.
+
+El costo de una orden solo depende de las posiciones de sus ids, así que se guarda por
+conjunto de posiciones: otro individuo (o una corrida posterior, si se indica un
+archivo) que ubique esos ids en las mismas posiciones lo reutiliza sin resolverla.
+Las órdenes pueden tener pesos, por ejemplo para dar más importancia a las recientes.
+Los recorridos resueltos también se guardan (acotados) por conjunto de posiciones, para
+armar el mapa de calor sin volver a resolverlos (ver mapa_calor).
+"""
+import hashlib
+import json
+import os
+import random
+from collections import OrderedDict
+import numpy as np
+from modelo_almacen import ModeloAlmacen
+from temple_paralelo import temple_matriz
+
+
+class MotorFitness:
+    def __init__(self, estanterias, ordenes, modelo=None, pesos=None, capacidad_costos=0,
+                 archivo_costos=None, capacidad_rutas=10000, **parametros_temple):
+        """
+        Args:
+            estanterias: Ids originales de las estanterías, en el orden de los genes
+            ordenes: Órdenes que se evalúan en cada fitness
+            modelo: ModeloAlmacen con la disposición original (por defecto, uno nuevo)
+            pesos: Peso de cada orden en el fitness (por defecto, todas pesan 1)
+            capacidad_costos: Costos por conjunto de posiciones que se guardan (LRU; 0 = ninguno)
+            archivo_costos: Archivo JSON donde persistir esos costos entre corridas
+            capacidad_rutas: Mejores recorridos por conjunto de posiciones que se guardan (LRU)
+            parametros_temple: Parámetros de temple_matriz para cada orden
+        """
+        modelo = modelo or ModeloAlmacen()
+        self.estanterias = [str(e) for e in estanterias]
+        self.ordenes = [[str(i) for i in orden] for orden in ordenes]
+        self.pesos = [1.0] * len(self.ordenes) if pesos is None else [float(p) for p in pesos]
+        self.parametros_temple = parametros_temple
+
+        # Posición 0 = celda C; posición k+1 = estantería física que ocupa el gen k
+        nodos = [0] + modelo.indices_orden(self.estanterias)
+        self.distancias = modelo.tabla_costos()[np.ix_(nodos, nodos)]
+
+        # Costos de orden por conjunto de posiciones; válidos para esta geometría y este temple
+        self.capacidad_costos = capacidad_costos
+        self.archivo_costos = archivo_costos
+        self._costos = OrderedDict()
+        self.aciertos_costos = self.fallos_costos = 0
+        self.capacidad_rutas = capacidad_rutas
+        self._rutas = OrderedDict()
+        texto = json.dumps({'distancias': self.distancias.tolist(), 'temple': parametros_temple}, sort_keys=True)
+        self._firma_costos = hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+        if archivo_costos and os.path.exists(archivo_costos):
+            self.cargar_costos()
+
+    def posiciones(self, individuo):
+        """Diccionario {id de estantería: posición en la tabla} para un individuo."""
+        return {str(id_estanteria): k + 1 for k, id_estanteria in enumerate(individuo)}
+
+    def _nodos_orden(self, posiciones, orden):
+        return [0] + list(dict.fromkeys(posiciones[i] for i in orden if i in posiciones))
+
+    def matriz_orden(self, posiciones, orden):
+        """Submatriz de distancias de una orden (nodo 0 = C); los ids repetidos o inexistentes se ignoran."""
+        nodos = self._nodos_orden(posiciones, orden)
+        return self.distancias[np.ix_(nodos, nodos)]
+
+    @staticmethod
+    def clave_orden(posiciones, orden):
+        """Conjunto (ordenado) de posiciones que visita la orden: clave de costos y recorridos."""
+        return tuple(sorted({posiciones[i] for i in orden if i in posiciones}))
+
+    def ruta_orden(self, posiciones, orden):
+        """Mejor recorrido guardado de la orden (posiciones en orden de visita, sin C), o None."""
+        guardada = self._rutas.get(self.clave_orden(posiciones, orden))
+        return None if guardada is None else list(guardada[1])
+
+    def rutas_individuo(self, individuo):
+        """Recorridos guardados de las órdenes del motor para un individuo: {clave_orden: ruta}."""
+        posiciones = self.posiciones(individuo)
+        rutas = {}
+        for orden in self.ordenes:
+            clave = self.clave_orden(posiciones, orden)
+            if clave in self._rutas:
+                rutas[clave] = list(self._rutas[clave][1])
+        return rutas
+
+    def costo_orden(self, posiciones, orden, rng=None):
+        clave = self.clave_orden(posiciones, orden)
+        if not clave:
+            return 0
+        costo = self._costos.get(clave)
+        if costo is not None:
+            self._costos.move_to_end(clave)
+            self.aciertos_costos += 1
+            return costo
+        self.fallos_costos += 1
+
+        nodos = self._nodos_orden(posiciones, orden)
+        ruta, costo = temple_matriz(self.distancias[np.ix_(nodos, nodos)].tolist(), rng=rng, **self.parametros_temple)
+        if costo == float('inf'):
+            # Misma penalización que evaluar_fitness si no se encuentra ruta
+            costo = 1000 * len(orden)
+        elif self.capacidad_rutas:
+            anterior = self._rutas.get(clave)
+            if anterior is None or costo < anterior[0]:
+                self._rutas[clave] = (costo, [nodos[k] for k in ruta])
+            self._rutas.move_to_end(clave)
+            while len(self._rutas) > self.capacidad_rutas:
+                self._rutas.popitem(last=False)
+        if self.capacidad_costos:
+            self._costos[clave] = costo
+            while len(self._costos) > self.capacidad_costos:
+                self._costos.popitem(last=False)
+        return costo
+
+    def cargar_costos(self):
+        with open(self.archivo_costos, 'r', encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        if datos.get('firma') != self._firma_costos:
+            print(f"Costos de órdenes '{self.archivo_costos}' descartados: corresponden a otra geometría o temple")
+            return
+        for clave, costo in datos['costos'].items():
+            self._costos[tuple(int(p) for p in clave.split(','))] = costo
+        while len(self._costos) > self.capacidad_costos:
+            self._costos.popitem(last=False)
+
+    def guardar_costos(self):
+        """Escribe los costos por conjunto de posiciones de forma atómica (archivo temporal + reemplazo)."""
+        if not self.archivo_costos:
+            return
+        datos = {'firma': self._firma_costos,
+                 'costos': {','.join(map(str, clave)): costo for clave, costo in self._costos.items()}}
+        temporal = self.archivo_costos + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(datos, archivo)
+        os.replace(temporal, self.archivo_costos)
+
+    def costos_ordenes(self, individuo, indices, rng=None):
+        """Costo de recorrido de las órdenes self.ordenes[i] para cada i de `indices`."""
+        posiciones = self.posiciones(individuo)
+        return [self.costo_orden(posiciones, self.ordenes[i], rng) for i in indices]
+
+    def evaluar(self, individuo, rng=None):
+        """Fitness de un individuo: suma (ponderada) de los costos de recorrido de las órdenes."""
+        posiciones = self.posiciones(individuo)
+        return sum(peso * self.costo_orden(posiciones, orden, rng) for orden, peso in zip(self.ordenes, self.pesos))
+
+
+def main():
+    import time
+    from procesador_batch import leer_ordenes
+
+    ordenes = leer_ordenes('ordenes.csv')
+    estanterias = sorted(str(i) for i in range(1, 49))
+    inicio = time.perf_counter()
+    motor = MotorFitness(estanterias, ordenes[:10], max_iteraciones=50, temp_inicial=30, factor_enfriamiento=0.9)
+    print(f"Tabla de distancias entre posiciones: {time.perf_counter() - inicio:.3f}s")
+
+    rng = random.Random(0)
+    individuos = [rng.sample(estanterias, len(estanterias)) for _ in range(200)]
+    inicio = time.perf_counter()
+    for individuo in individuos:
+        motor.evaluar(individuo, rng)
+    print(f"Tiempo por individuo: {1000 * (time.perf_counter() - inicio) / len(individuos):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# optimizacion.py
+"""
+Optimización de la disposición de estanterías sin interfaz gráfica.
+
+Trabaja sobre el tablero de tablero_modelo, por lo que no importa pygame; matplotlib
+solo se importa si se piden los gráficos (mapa de calor y evolución del fitness).
+OptimizacionEstanterias usa la misma función con la ventana de pygame.
+
+Uso:
+    python optimizacion.py --poblacion 10 --generaciones 50
+    python optimizacion.py --carreras --graficos
+    python optimizacion.py --algoritmo tabu --indice-ordenes indice_ordenes.npz
+    python optimizacion.py --generaciones 500 --tiempo 3600 --checkpoint corrida.npz
+    python optimizacion.py --generaciones 1000 --reanudar corrida.npz
+    python optimizacion.py --disposicion disposicion.json --vida-media 20 --costos-orden costos_orden.json
+"""
+import argparse
+import os
+from algoritmo_genetico import AlgoritmoGenetico
+from analitica_ordenes import IndiceOrdenes, actualizar_indice
+from busqueda_tabu import BusquedaTabu
+from cache_soluciones import CacheSoluciones
+from islas import ejecutar_islas, imprimir_telemetria
+from operadores_geneticos import CRUCES, MUTACIONES
+from procesador_batch import leer_ordenes
+from reoptimizacion import cargar_disposicion, guardar_disposicion, pesos_recientes
+from tablero_modelo import crear_tablero
+
+
+def _fraccion(texto):
+    """Tipo de argparse para fracciones en (0, 1]."""
+    valor = float(texto)
+    if not 0 < valor <= 1:
+        raise argparse.ArgumentTypeError(f"debe estar en (0, 1], no {texto}")
+    return valor
+
+
+def optimizar_disposicion(tablero, ordenes, config, graficos=False):
+    """
+    Ejecuta el algoritmo genético (o la búsqueda tabú, con config['algoritmo'] = 'tabu')
+    y aplica la mejor disposición al tablero.
+
+    Args:
+        tablero: Tablero con la disposición original (de tablero_modelo o de interfaz)
+        ordenes: Lista de órdenes
+        config: Configuración del algoritmo genético (ver OptimizacionEstanterias)
+        graficos: Si es True, genera el mapa de calor y los gráficos de evolución (matplotlib)
+
+    Returns:
+        El AlgoritmoGenetico ejecutado
+    """
+    # Memoria de soluciones por orden y disposición (persistente si se indica un archivo)
+    cache_soluciones = CacheSoluciones(config.get('archivo_cache_soluciones'))
+
+    # Re-optimización incremental: arranque desde la disposición anterior y órdenes ponderadas por antigüedad
+    anterior = cargar_disposicion(config.get('archivo_disposicion'))
+    if anterior is not None:
+        print(f"Arranque desde la disposición de '{config['archivo_disposicion']}' "
+              f"(fitness {anterior['fitness']:.1f} con {anterior['num_ordenes']} órdenes)")
+    pesos_ordenes = None
+    max_ordenes_fitness = config.get('max_ordenes_fitness', 10)
+    if config.get('vida_media_ordenes'):
+        pesos_ordenes = pesos_recientes(len(ordenes), config['vida_media_ordenes'])
+        max_ordenes_fitness = config.get('max_ordenes_fitness')
+
+    # Opciones del fitness y de la búsqueda, comunes al algoritmo genético y a cada isla
+    comunes = dict(
+        carreras_fitness=config.get('carreras_fitness', False),
+        fraccion_surrogado=config.get('fraccion_surrogado'),
+        memetico_k=config.get('memetico_k', 0),
+        presupuesto_memetico=config.get('presupuesto_memetico', 100),
+        max_ordenes_fitness=max_ordenes_fitness,
+        pesos_ordenes=pesos_ordenes,
+        individuo_inicial=anterior['individuo'] if anterior is not None else None,
+        diversidad_minima=config.get('diversidad_minima'),
+        fraccion_inmigrantes=config.get('fraccion_inmigrantes', 0.5)
+    )
+    if config.get('num_islas') and config.get('algoritmo', 'genetico') != 'tabu':
+        incompatibles = [clave for clave in ('num_procesos', 'archivo_checkpoint', 'reanudar_desde',
+                                             'archivo_costos_orden') if config.get(clave)]
+        if incompatibles:
+            raise ValueError(f"El modo en islas no admite: {', '.join(incompatibles)} "
+                             "(cada isla es un proceso con su propio estado)")
+
+    ag = AlgoritmoGenetico(
+        tablero=tablero,
+        ordenes=ordenes,
+        tam_poblacion=config.get('tam_poblacion', 10),
+        tasa_mutacion=config.get('tasa_mutacion', 0.2),
+        tasa_cruce=config.get('tasa_cruce', 0.8),
+        num_generaciones=config.get('num_generaciones', 50),
+        elitismo=config.get('elitismo', 2),
+        cache_soluciones=cache_soluciones,
+        num_procesos=config.get('num_procesos'),
+        motor_fitness=config.get('motor_fitness', False),
+        archivo_cache_fitness=config.get('archivo_cache_fitness'),
+        operador_cruce=config.get('operador_cruce', 'pmx'),
+        operador_mutacion=config.get('operador_mutacion', 'intercambio'),
+        capacidad_costos_orden=100000 if config.get('archivo_costos_orden') else 0,
+        archivo_costos_orden=config.get('archivo_costos_orden'),
+        **comunes
+    )
+    if config.get('algoritmo', 'genetico') == 'tabu':
+        # QAP con búsqueda tabú; el algoritmo genético solo informa el fitness y aplica la solución
+        # Flujo y frecuencias del índice de órdenes, si hay uno (ver analitica_ordenes)
+        indice = None
+        if config.get('archivo_indice_ordenes'):
+            indice = IndiceOrdenes.cargar(config['archivo_indice_ordenes'])
+        tabu = BusquedaTabu(ag.estanterias, ordenes, semilla=config.get('semilla'), indice=indice)
+        tabu.ejecutar(max_iteraciones=config.get('iteraciones_tabu', 10000),
+                      tiempo_maximo=config.get('tiempo_maximo', 300))
+        ag.mejor_individuo = tabu.mejor_individuo
+        ag.mejor_fitness = ag.evaluar_fitness(tabu.mejor_individuo)
+        ag.historial_fitness, ag.historial_promedio = [ag.mejor_fitness], [ag.mejor_fitness]
+        print(f"Búsqueda tabú: {tabu.iteraciones} iteraciones, costo QAP {tabu.mejor_costo:.1f}, "
+              f"fitness {ag.mejor_fitness:.1f}")
+    elif config.get('num_islas'):
+        # Islas en procesos separados; este algoritmo solo aplica y grafica la mejor disposición
+        resultado = ejecutar_islas(ordenes, config['num_islas'], ag.tam_poblacion, ag.num_generaciones,
+                                   ag.elitismo, config.get('intervalo_migracion', 5), config.get('num_migrantes', 2),
+                                   ag.tasa_cruce, ag.tasa_mutacion, tiempo_maximo=config.get('tiempo_maximo', 300),
+                                   semilla=config.get('semilla'), parametros_ag=comunes)
+        imprimir_telemetria(resultado)
+        ag.mejor_individuo, ag.mejor_fitness = resultado['mejor_individuo'], resultado['mejor_fitness']
+        mejor_isla = resultado['islas'][resultado['mejor_isla']]
+        ag.historial_fitness, ag.historial_promedio = mejor_isla['historial_fitness'], mejor_isla['historial_promedio']
+        # Recorridos resueltos en la mejor isla, para el mapa de calor
+        ag.incorporar_rutas(ag.mejor_individuo, ag.mejor_fitness, mejor_isla['rutas'])
+    else:
+        ag.ejecutar(tiempo_maximo=config.get('tiempo_maximo', 300),
+                    archivo_checkpoint=config.get('archivo_checkpoint'),
+                    reanudar_desde=config.get('reanudar_desde'))
+
+    # Aplicar la solución al tablero y, si se pide, generar el mapa de calor
+    ag.aplicar_mejor_solucion(generar_mapa_calor=graficos)
+    cache_soluciones.guardar_en_disco()
+    if config.get('archivo_disposicion'):
+        guardar_disposicion(config['archivo_disposicion'], ag.mejor_individuo, ag.mejor_fitness, len(ordenes))
+
+    if graficos:
+        ag.visualizar_resultados()
+    return ag
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimiza la disposición de estanterías sin interfaz gráfica.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--poblacion', type=int, default=10)
+    parser.add_argument('--generaciones', type=int, default=50)
+    parser.add_argument('--mutacion', type=float, default=0.2)
+    parser.add_argument('--cruce', type=float, default=0.8)
+    parser.add_argument('--elitismo', type=int, default=2)
+    parser.add_argument('--operador-cruce', choices=sorted(CRUCES), default='pmx')
+    parser.add_argument('--operador-mutacion', choices=sorted(MUTACIONES), default='intercambio')
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos para evaluar el fitness")
+    parser.add_argument('--algoritmo', choices=('genetico', 'tabu'), default='genetico')
+    parser.add_argument('--islas', type=int, default=None, help="Ejecuta el algoritmo en islas con migración")
+    parser.add_argument('--surrogado', type=_fraccion, default=None,
+                        help="Fracción de hijos (los mejores según el surrogado) que se evalúa por completo")
+    parser.add_argument('--memetico', type=int, default=0, metavar='K',
+                        help="Mejora con búsqueda local a los K mejores individuos de cada generación")
+    parser.add_argument('--diversidad-minima', type=float, default=None,
+                        help="Distancia de Hamming media por debajo de la cual se incorporan inmigrantes")
+    parser.add_argument('--carreras', action='store_true', help="Fitness sobre todas las órdenes con carreras")
+    parser.add_argument('--cache-fitness', default='cache_fitness.npz')
+    parser.add_argument('--tiempo', type=float, default=300, help="Tiempo máximo en segundos")
+    parser.add_argument('--checkpoint', default=None, help="Archivo .npz donde guardar el estado de la corrida")
+    parser.add_argument('--reanudar', default=None, help="Checkpoint desde el cual continuar una corrida")
+    parser.add_argument('--disposicion', default=None,
+                        help="Archivo JSON de la mejor disposición: se arranca desde ella si existe y se actualiza")
+    parser.add_argument('--vida-media', type=float, default=None,
+                        help="Fitness sobre todas las órdenes, con peso que se reduce a la mitad cada tantas órdenes")
+    parser.add_argument('--costos-orden', default=None, help="Archivo JSON con los costos de orden ya calculados")
+    parser.add_argument('--indice-ordenes', default=None,
+                        help="Índice .npz de estadísticas de las órdenes (se actualiza con las órdenes nuevas)")
+    parser.add_argument('--graficos', action='store_true', help="Genera el mapa de calor y los gráficos")
+    args = parser.parse_args()
+
+    archivo = args.ordenes
+    if not os.path.isabs(archivo) and not os.path.exists(archivo):
+        archivo = os.path.join(os.path.dirname(os.path.realpath(__file__)), archivo)
+    if args.indice_ordenes:
+        indice, nuevas = actualizar_indice(args.indice_ordenes, archivo)
+        print(f"Índice de órdenes '{args.indice_ordenes}': {nuevas} órdenes nuevas, {indice.num_ordenes} en total")
+    config = {
+        'tam_poblacion': args.poblacion,
+        'tasa_mutacion': args.mutacion,
+        'tasa_cruce': args.cruce,
+        'num_generaciones': args.generaciones,
+        'elitismo': args.elitismo,
+        'operador_cruce': args.operador_cruce,
+        'operador_mutacion': args.operador_mutacion,
+        'num_procesos': args.procesos,
+        'algoritmo': args.algoritmo,
+        'num_islas': args.islas,
+        'motor_fitness': True,
+        'carreras_fitness': args.carreras,
+        'fraccion_surrogado': args.surrogado,
+        'memetico_k': args.memetico,
+        'diversidad_minima': args.diversidad_minima,
+        'archivo_cache_fitness': args.cache_fitness,
+        'tiempo_maximo': args.tiempo,
+        'archivo_checkpoint': args.checkpoint or args.reanudar,
+        'reanudar_desde': args.reanudar,
+        'archivo_disposicion': args.disposicion,
+        'vida_media_ordenes': args.vida_media,
+        'archivo_costos_orden': args.costos_orden,
+        'archivo_indice_ordenes': args.indice_ordenes,
+    }
+    optimizar_disposicion(crear_tablero(), leer_ordenes(archivo), config, graficos=args.graficos)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import sys
 import time
 import os
 from aplicacion import Aplicacion
-from algoritmo_genetico import AlgoritmoGenetico
+from optimizacion import optimizar_disposicion
 from constantes import *
 
 class OptimizacionEstanterias(Aplicacion):
@@ -86,25 +86,8 @@ class OptimizacionEstanterias(Aplicacion):
         for i in range(min(3, len(self.ordenes))):
             print(f"  Orden {i+1}: {self.ordenes[i]}")
         
-        # Crear instancia del algoritmo genético
-        ag = AlgoritmoGenetico(
-            tablero=self.tablero,
-            ordenes=self.ordenes,
-            tam_poblacion=config['tam_poblacion'],
-            tasa_mutacion=config['tasa_mutacion'],
-            tasa_cruce=config['tasa_cruce'],
-            num_generaciones=config['num_generaciones'],
-            elitismo=config['elitismo']
-        )
-        
-        # Ejecutar el algoritmo
-        mejor_solucion, mejor_fitness = ag.ejecutar()
-        
-        # Aplicar la solución al tablero y generar mapa de calor
-        ag.aplicar_mejor_solucion(generar_mapa_calor=True)
-        
-        # Visualizar resultados
-        ag.visualizar_resultados()
+        # Ejecutar el algoritmo genético, aplicar la solución al tablero y generar los gráficos
+        optimizar_disposicion(self.tablero, self.ordenes, config, graficos=True)
         
         # Si no estamos en modo silencioso, mantener ventana abierta
         if not modo_silencioso:
@@ -144,19 +127,37 @@ class OptimizacionEstanterias(Aplicacion):
 def main():
     # Configuración personalizable
     config = {
+        'algoritmo': 'genetico',   # 'genetico' o 'tabu' (búsqueda tabú sobre el QAP, ver busqueda_tabu)
         'tam_poblacion': 10,       # Tamaño de la población
         'tasa_mutacion': 0.2,      # Probabilidad de mutación
         'tasa_cruce': 0.8,         # Probabilidad de cruce
         'num_generaciones': 50,    # Número de generaciones
-        'elitismo': 2              # Número de mejores individuos que pasan directamente
+        'elitismo': 2,             # Número de mejores individuos que pasan directamente
+        'operador_cruce': 'pmx',   # Cruce vectorizado: 'pmx' u 'ox'
+        'operador_mutacion': 'intercambio',  # Mutación vectorizada: 'intercambio' o 'inversion'
+        'archivo_cache_soluciones': 'cache_soluciones.json',  # Memoria persistente de recorridos
+        'num_procesos': None,      # Procesos para evaluar el fitness en paralelo (None = en serie)
+        'num_islas': None,         # Islas en procesos separados con migración (None = una sola población)
+        'motor_fitness': True,     # Fitness sobre distancias fijas entre posiciones (sin A* ni tablero)
+        'carreras_fitness': False, # Fitness sobre todas las órdenes con mini-lotes y carreras
+        'fraccion_surrogado': None,  # Fracción de hijos pre-filtrados con el surrogado que se evalúa
+        'memetico_k': 0,           # Mejores individuos que se mejoran con búsqueda local por generación
+        'presupuesto_memetico': 100,  # Intercambios por generación de la búsqueda local
+        'diversidad_minima': None, # Diversidad (Hamming medio) bajo la cual se incorporan inmigrantes
+        'fraccion_inmigrantes': 0.5,  # Fracción de la población (sin la élite) reemplazada al inmigrar
+        'archivo_cache_fitness': 'cache_fitness.npz',  # Caché de fitness persistente entre corridas
+        'archivo_checkpoint': None,  # Estado de la corrida (.npz) para poder reanudarla
+        'reanudar_desde': None,    # Checkpoint desde el cual continuar una corrida anterior
+        'max_ordenes_fitness': 10, # Órdenes del fitness (None = todas): las primeras o, con vida_media_ordenes, las más recientes
+        'archivo_disposicion': None,  # Mejor disposición (JSON): arranque en caliente y se actualiza al terminar
+        'vida_media_ordenes': None,   # Pondera las órdenes por antigüedad (peso 1/2 cada tantas órdenes)
+        'archivo_costos_orden': None, # Costos de orden ya calculados (JSON), reutilizados entre corridas
+        'archivo_indice_ordenes': None  # Estadísticas de órdenes (.npz, ver analitica_ordenes) para la búsqueda tabú
     }
     
     tablero_info = {'filas': 11, 'columnas': 13}
     app = OptimizacionEstanterias(tablero_info, "ordenes.csv")
     
-    # Configurar tablero inicial (reutilizando el código existente)
-    app.llenar_tablero()
-    
     # Ejecutar la optimización en modo silencioso (sin visualización)
     app.ejecutar_optimizacion(config, modo_silencioso=True)
 
@@ -0,0 +1,145 @@
+# procesador_batch.py
+"""
+Procesamiento por lotes de ordenes.csv sin interfaz gráfica (no importa pygame).
+
+Resuelve todas las órdenes en paralelo, una por tarea, en un pool de procesos. Cada
+proceso construye una vez el ModeloAlmacen y su tabla de costos. Los resultados se
+escriben en CSV o JSONL (según la extensión del archivo de salida) junto con un
+resumen de rendimiento.
+
+Uso:
+    python procesador_batch.py --ordenes ordenes.csv --salida resultados.csv --procesos 4
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from resolvedores import PlanificadorRutas, RESOLVEDORES
+
+# Planificador de cada proceso trabajador
+_planificador = None
+
+
+def leer_ordenes(archivo):
+    """Lee las órdenes del CSV, una por línea; las líneas inválidas se informan y se omiten."""
+    ordenes = []
+    with open(archivo, 'r', newline='', encoding='utf-8') as f:
+        for numero, fila in enumerate(csv.reader(f), start=1):
+            if not fila:
+                continue
+            try:
+                ordenes.append([int(item) for item in fila])
+            except ValueError:
+                print(f"Advertencia: Se ignoró la línea {numero} con formato incorrecto: {fila}")
+    return ordenes
+
+
+def _inicializar_trabajador(metodo):
+    global _planificador
+    _planificador = PlanificadorRutas(metodo=metodo)
+
+
+def _resolver(argumentos):
+    id_orden, orden, semilla = argumentos
+    resultado = _planificador.planificar(orden, semilla)
+    resultado['orden'] = id_orden
+    return resultado
+
+
+def procesar_ordenes(ordenes, metodo='temple+local', num_procesos=None, semilla=None, chunksize=4):
+    """
+    Resuelve todas las órdenes en paralelo.
+
+    Args:
+        ordenes: Lista de órdenes (listas de ids de estantería)
+        metodo: Método de ruteo (ver resolvedores.RESOLVEDORES)
+        num_procesos: Procesos del pool (por defecto, uno por núcleo)
+        semilla: Semilla base; la orden i usa semilla + i
+        chunksize: Órdenes enviadas por tarea al pool
+
+    Returns:
+        Tupla (lista de resultados en el orden del CSV, resumen de rendimiento)
+    """
+    tareas = [(i, orden, None if semilla is None else semilla + i)
+              for i, orden in enumerate(ordenes, start=1)]
+
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=num_procesos, initializer=_inicializar_trabajador,
+                             initargs=(metodo,)) as pool:
+        resultados = list(pool.map(_resolver, tareas, chunksize=chunksize))
+    tiempo_total = time.perf_counter() - inicio
+
+    tiempos = sorted(r['tiempo'] for r in resultados)
+    cantidad = len(resultados)
+    resumen = {
+        'metodo': metodo,
+        'ordenes': cantidad,
+        'procesos': num_procesos or os.cpu_count(),
+        'tiempo_total_s': tiempo_total,
+        'ordenes_por_segundo': cantidad / tiempo_total if tiempo_total > 0 else 0.0,
+        'tiempo_medio_orden_s': sum(tiempos) / cantidad if cantidad else 0.0,
+        'tiempo_p95_orden_s': tiempos[min(int(0.95 * cantidad), cantidad - 1)] if cantidad else 0.0,
+        'costo_total': sum(r['costo'] for r in resultados),
+        # Tiempo de resolución acumulado / tiempo de reloj: cuánto rindió el paralelismo
+        'aceleracion': sum(tiempos) / tiempo_total if tiempo_total > 0 else 0.0,
+    }
+    return resultados, resumen
+
+
+def escribir_resultados(resultados, archivo):
+    """Escribe los resultados en JSONL si la extensión es .jsonl, y en CSV en otro caso."""
+    if archivo.endswith('.jsonl'):
+        with open(archivo, 'w', encoding='utf-8') as f:
+            for r in resultados:
+                f.write(json.dumps({'orden': r['orden'], 'ruta': r['ruta'], 'costo': r['costo'],
+                                    'tiempo': r['tiempo']}) + "\n")
+    else:
+        with open(archivo, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['orden', 'ruta', 'costo', 'tiempo'])
+            for r in resultados:
+                writer.writerow([r['orden'], "-".join(["C"] + r['ruta'] + ["C"]), r['costo'],
+                                 f"{r['tiempo']:.6f}"])
+
+
+def main():
+    script_dir = os.path.dirname(os.path.realpath(__file__))
+    parser = argparse.ArgumentParser(description="Resuelve en paralelo todas las órdenes de un CSV.")
+    parser.add_argument('--ordenes', default=os.path.join(script_dir, 'ordenes.csv'))
+    parser.add_argument('--salida', default='resultados.csv', help="Archivo .csv o .jsonl")
+    parser.add_argument('--metodo', default='temple+local', choices=sorted(RESOLVEDORES))
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=None)
+    parser.add_argument('--mapa-calor', default=None,
+                        help="Imagen del mapa de calor de visitas, armado con las rutas obtenidas")
+    args = parser.parse_args()
+
+    ordenes = leer_ordenes(args.ordenes)
+    resultados, resumen = procesar_ordenes(ordenes, args.metodo, args.procesos, args.semilla)
+    escribir_resultados(resultados, args.salida)
+
+    archivo_resumen = os.path.splitext(args.salida)[0] + "_resumen.json"
+    with open(archivo_resumen, 'w', encoding='utf-8') as f:
+        json.dump(resumen, f, indent=2)
+
+    print(f"{resumen['ordenes']} órdenes resueltas con '{resumen['metodo']}' "
+          f"en {resumen['tiempo_total_s']:.2f}s ({resumen['ordenes_por_segundo']:.1f} órdenes/s, "
+          f"{resumen['procesos']} procesos)")
+    print(f"Tiempo por orden: medio {resumen['tiempo_medio_orden_s'] * 1000:.2f} ms, "
+          f"p95 {resumen['tiempo_p95_orden_s'] * 1000:.2f} ms | Costo total: {resumen['costo_total']:.0f}")
+    print(f"Resultados en '{args.salida}', resumen en '{archivo_resumen}'")
+
+    if args.mapa_calor:
+        from mapa_calor import MapaCalor, dibujar_mapa_calor, rutas_resultados
+        mapa = MapaCalor()
+        mapa.acumular(rutas_resultados(resultados, mapa.modelo))
+        etiquetas = {divmod(celda, mapa.modelo.columnas): caracter
+                     for celda, caracter in enumerate(mapa.modelo.caracteres) if caracter}
+        dibujar_mapa_calor(mapa.matriz(), etiquetas, args.mapa_calor, mostrar=False)
+        print(f"Mapa de calor en '{args.mapa_calor}'")
+
+
+if __name__ == "__main__":
+    main()
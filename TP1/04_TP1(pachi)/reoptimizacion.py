@@ -0,0 +1,117 @@
+# reoptimizacion.py
+"""
+Re-optimización incremental de la disposición cuando llegan órdenes nuevas.
+
+En lugar de repetir la optimización desde cero, la corrida del día siguiente:
+- arranca desde la mejor disposición anterior y vecinos suyos (AlgoritmoGenetico con
+  individuo_inicial);
+- pondera cada orden con un decaimiento exponencial según su antigüedad, para que el
+  fitness siga a la demanda reciente;
+- reutiliza los costos de orden ya calculados (motor_fitness con archivo_costos): las
+  órdenes viejas en posiciones que no cambiaron no se vuelven a resolver.
+
+La disposición anterior se guarda en un archivo JSON junto con la cantidad de órdenes
+que había al optimizarla.
+
+Uso (simula un día con las primeras órdenes y otro con todas, en frío y en caliente):
+    python reoptimizacion.py --ordenes-nuevas 10 --vida-media 20
+"""
+import json
+import os
+import numpy as np
+
+
+def pesos_decaimiento(edades, vida_media):
+    """
+    Peso de cada orden según su antigüedad: 1 para la más reciente y la mitad cada
+    `vida_media` órdenes (o días, en las unidades de `edades`) de antigüedad.
+    """
+    return 0.5 ** (np.asarray(edades, dtype=float) / vida_media)
+
+
+def pesos_recientes(num_ordenes, vida_media):
+    """Pesos de órdenes en orden cronológico (la última es la más reciente)."""
+    return pesos_decaimiento(np.arange(num_ordenes)[::-1], vida_media).tolist()
+
+
+def cargar_disposicion(archivo):
+    """Disposición guardada por guardar_disposicion, o None si el archivo no existe."""
+    if not archivo or not os.path.exists(archivo):
+        return None
+    with open(archivo, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def guardar_disposicion(archivo, individuo, fitness, num_ordenes):
+    """Guarda la mejor disposición de forma atómica (archivo temporal + reemplazo)."""
+    datos = {'individuo': [str(e) for e in individuo], 'fitness': fitness, 'num_ordenes': num_ordenes}
+    temporal = archivo + ".tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(datos, f)
+    os.replace(temporal, archivo)
+
+
+def main():
+    import argparse
+    import contextlib
+    import io
+    import random
+    import tempfile
+    import time
+    from algoritmo_genetico import AlgoritmoGenetico
+    from memetico import generacion_objetivo
+    from procesador_batch import leer_ordenes
+    from tablero_modelo import crear_tablero
+
+    parser = argparse.ArgumentParser(description="Compara la re-optimización en frío y en caliente.")
+    parser.add_argument('--ordenes', default='ordenes.csv')
+    parser.add_argument('--ordenes-nuevas', type=int, default=10, help="Órdenes que llegan el segundo día")
+    parser.add_argument('--vida-media', type=float, default=20, help="Órdenes tras las que el peso se reduce a la mitad")
+    parser.add_argument('--poblacion', type=int, default=10)
+    parser.add_argument('--generaciones', type=int, default=40)
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    ordenes = leer_ordenes(args.ordenes)
+    ordenes_dia1 = ordenes[:len(ordenes) - args.ordenes_nuevas]
+    directorio = tempfile.mkdtemp()
+    archivo_costos = os.path.join(directorio, 'costos_orden.json')
+
+    def optimizar(ordenes_dia, **parametros):
+        random.seed(args.semilla)
+        inicio = time.time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ag = AlgoritmoGenetico(crear_tablero(), ordenes_dia, tam_poblacion=args.poblacion,
+                                   num_generaciones=args.generaciones, motor_fitness=True,
+                                   max_ordenes_fitness=None,
+                                   pesos_ordenes=pesos_recientes(len(ordenes_dia), args.vida_media),
+                                   **parametros)
+            ag.ejecutar(generaciones_sin_mejora=None)
+        return ag, time.time() - inicio
+
+    # Día 1: corrida en frío; deja la disposición y los costos de orden para el día siguiente
+    dia1, tiempo_dia1 = optimizar(ordenes_dia1, capacidad_costos_orden=100000, archivo_costos_orden=archivo_costos)
+    print(f"Día 1 ({len(ordenes_dia1)} órdenes): fitness {dia1.mejor_fitness:.1f} en {tiempo_dia1:.2f}s")
+
+    # Día 2: en frío (como si no hubiera corrida anterior) y en caliente
+    frio, tiempo_frio = optimizar(ordenes)
+    caliente, tiempo_caliente = optimizar(ordenes, individuo_inicial=dia1.mejor_individuo,
+                                          capacidad_costos_orden=100000, archivo_costos_orden=archivo_costos)
+    motor = caliente._motor
+    print(f"Día 2 ({len(ordenes)} órdenes, {args.ordenes_nuevas} nuevas):")
+    print(f"  en frío:     fitness {frio.mejor_fitness:.1f} en {tiempo_frio:.2f}s")
+    print(f"  en caliente: fitness {caliente.mejor_fitness:.1f} en {tiempo_caliente:.2f}s "
+          f"(costos de orden reutilizados: {motor.aciertos_costos}, calculados: {motor.fallos_costos})")
+
+    # Tiempo hasta alcanzar el resultado final de la corrida en frío
+    generacion = generacion_objetivo(caliente.historial_fitness, frio.mejor_fitness)
+    if generacion is None:
+        print("  la corrida en caliente no alcanzó el fitness de la corrida en frío")
+    else:
+        tiempo = caliente.historial_tiempo[generacion]
+        print(f"  en caliente alcanza el fitness final en frío en la generación {generacion} "
+              f"({tiempo:.2f}s, {100 * tiempo / tiempo_frio:.0f}% del tiempo en frío)")
+
+
+if __name__ == "__main__":
+    main()
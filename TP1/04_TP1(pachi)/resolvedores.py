@@ -0,0 +1,139 @@
+# resolvedores.py
+"""
+Planificación de rutas de órdenes sobre la tabla de costos del ModeloAlmacen.
+
+Reúne los distintos métodos de ruteo del proyecto bajo una misma interfaz para que
+los procesos por lotes, el servicio de ingesta y los benchmarks puedan elegirlos por
+nombre. No importa pygame.
+"""
+import random
+import time
+import numpy as np
+from busqueda_local import optimizar_ruta
+from modelo_almacen import ModeloAlmacen
+from temple_paralelo import temple_matriz
+from temple_vectorizado import temple_multicadena
+
+
+MAX_OBJETIVOS_EXACTO = 12
+
+
+def ruta_optima(matriz):
+    """
+    Ruta óptima por programación dinámica (Held-Karp), O(2^n * n^2).
+    Solo es práctica para órdenes chicas (hasta MAX_OBJETIVOS_EXACTO objetivos).
+
+    Returns:
+        Tupla (ruta, costo)
+    """
+    n = len(matriz) - 1
+    if n > MAX_OBJETIVOS_EXACTO:
+        raise ValueError(f"Orden demasiado grande para el método exacto ({n} > {MAX_OBJETIVOS_EXACTO})")
+    if n == 0:
+        return [], 0
+    infinito = float('inf')
+    # costo[mascara][j]: mejor costo saliendo de C, visitando la máscara y terminando en el objetivo j+1
+    costo = [[infinito] * n for _ in range(1 << n)]
+    previo = [[-1] * n for _ in range(1 << n)]
+    for j in range(n):
+        costo[1 << j][j] = matriz[0][j + 1]
+    for mascara in range(1, 1 << n):
+        for j in range(n):
+            actual = costo[mascara][j]
+            if actual == infinito:
+                continue
+            for k in range(n):
+                if mascara & (1 << k):
+                    continue
+                siguiente = mascara | (1 << k)
+                nuevo = actual + matriz[j + 1][k + 1]
+                if nuevo < costo[siguiente][k]:
+                    costo[siguiente][k] = nuevo
+                    previo[siguiente][k] = j
+
+    completa = (1 << n) - 1
+    ultimo = min(range(n), key=lambda j: costo[completa][j] + matriz[j + 1][0])
+    mejor_costo = costo[completa][ultimo] + matriz[ultimo + 1][0]
+    ruta, mascara = [], completa
+    while ultimo != -1:
+        ruta.append(ultimo + 1)
+        ultimo, mascara = previo[mascara][ultimo], mascara & ~(1 << ultimo)
+    return ruta[::-1], mejor_costo
+
+
+def _resolver_temple(matriz, semilla):
+    return temple_matriz(matriz.tolist(), rng=random.Random(semilla))
+
+
+def _resolver_temple_local(matriz, semilla):
+    matriz = matriz.tolist()
+    ruta, _ = temple_matriz(matriz, rng=random.Random(semilla))
+    return optimizar_ruta(matriz, ruta)
+
+
+def _resolver_exacto(matriz, semilla):
+    # Las órdenes con más de MAX_OBJETIVOS_EXACTO objetivos se resuelven con temple + búsqueda local
+    if len(matriz) - 1 > MAX_OBJETIVOS_EXACTO:
+        return _resolver_temple_local(matriz, semilla)
+    return ruta_optima(matriz.tolist())
+
+
+def _resolver_multicadena(matriz, semilla):
+    return temple_multicadena(matriz, semilla=semilla)
+
+
+def _resolver_local(matriz, semilla):
+    return optimizar_ruta(matriz.tolist())
+
+
+# Métodos disponibles: función (matriz de la orden, semilla) -> (ruta, costo)
+RESOLVEDORES = {
+    'temple': _resolver_temple,
+    'temple+local': _resolver_temple_local,
+    'multicadena': _resolver_multicadena,
+    'local': _resolver_local,
+    'exacto': _resolver_exacto,
+}
+
+
+class PlanificadorRutas:
+    """
+    Resuelve órdenes sobre la tabla de costos precalculada del almacén.
+    Cada proceso debe tener su propio planificador (la tabla se calcula una sola vez).
+    """
+    def __init__(self, modelo=None, metodo='temple+local'):
+        if metodo not in RESOLVEDORES:
+            raise ValueError(f"Método desconocido: {metodo}. Opciones: {', '.join(RESOLVEDORES)}")
+        self.modelo = modelo or ModeloAlmacen()
+        self.metodo = metodo
+        self.tabla = self.modelo.tabla_costos()
+        self.nodos = self.modelo.nodos()
+
+    def matriz_orden(self, orden):
+        """
+        Submatriz de costos de una orden (nodo 0 = C) y los índices de tabla de sus objetivos.
+        Los ids repetidos o inexistentes se ignoran.
+        """
+        indices = list(dict.fromkeys(self.modelo.indices_orden(orden)))
+        nodos = [0] + indices
+        return self.tabla[np.ix_(nodos, nodos)], indices
+
+    def planificar(self, orden, semilla=None):
+        """
+        Calcula la ruta de una orden.
+
+        Returns:
+            Diccionario con la ruta (ids de estantería en orden de visita), su costo
+            y el tiempo de resolución en segundos
+        """
+        inicio = time.perf_counter()
+        matriz, indices = self.matriz_orden(orden)
+        if indices:
+            ruta, costo = RESOLVEDORES[self.metodo](matriz, semilla)
+        else:
+            ruta, costo = [], 0
+        return {
+            'ruta': [self.nodos[indices[nodo - 1]] for nodo in ruta],
+            'costo': float(costo),
+            'tiempo': time.perf_counter() - inicio,
+        }
@@ -0,0 +1,113 @@
+# surrogado_fitness.py
+"""
+Estimación barata (surrogado) del fitness de disposiciones para pre-filtrar hijos.
+
+El puntaje de una disposición combina dos términos calculados con NumPy para toda la
+población a la vez:
+- frecuencia de cada id en las órdenes x distancia (ida y vuelta) de su estantería a C;
+- cantidad de órdenes en que aparecen juntos dos ids x distancia entre sus estanterías.
+
+No resuelve recorridos, así que no reemplaza al fitness: solo ordena candidatos para
+que el fitness completo se calcule sobre los más prometedores. La correlación de
+rangos (Spearman) con el fitness real permite comprobar que el filtro es seguro, si se
+mide también sobre una muestra de los candidatos descartados (ver separar): sobre los
+aceptados solamente, el rango está recortado y no muestra si se descartaron buenos.
+"""
+import numpy as np
+from analitica_ordenes import IndiceOrdenes
+from modelo_almacen import ModeloAlmacen
+
+
+def correlacion_rangos(a, b):
+    """Correlación de Spearman entre dos vectores (nan si alguno es constante)."""
+    rango_a = np.argsort(np.argsort(a)).astype(float)
+    rango_b = np.argsort(np.argsort(b)).astype(float)
+    if len(a) < 2 or rango_a.std() == 0 or rango_b.std() == 0:
+        return float('nan')
+    return float(np.corrcoef(rango_a, rango_b)[0, 1])
+
+
+class SurrogadoFitness:
+    def __init__(self, estanterias, ordenes, modelo=None, indice=None):
+        """
+        Args:
+            estanterias: Ids originales de las estanterías, en el orden de los genes
+            ordenes: Órdenes de las que se toman frecuencias y co-ocurrencias
+            modelo: ModeloAlmacen con la disposición original (por defecto, uno nuevo)
+            indice: IndiceOrdenes ya construido (ver analitica_ordenes); si se indica, se usa
+                    en lugar de `ordenes`
+        """
+        modelo = modelo or ModeloAlmacen()
+        estanterias = [str(e) for e in estanterias]
+        n = len(estanterias)
+
+        # Distancias entre posiciones: la posición k es la estantería física del gen k
+        nodos = modelo.indices_orden(estanterias)
+        tabla = modelo.tabla_costos()
+        self.distancia_c = 2 * tabla[0, nodos]
+        self.distancias = tabla[np.ix_(nodos, nodos)]
+
+        # Frecuencia de cada id y co-ocurrencia de pares de ids (índices en `estanterias`)
+        indice = indice or IndiceOrdenes.desde_ordenes(ordenes)
+        self.frecuencia = indice.frecuencia(estanterias).astype(float)
+        self.coocurrencia = indice.coocurrencia(estanterias).astype(float)
+
+    def puntajes(self, poblacion):
+        """
+        Puntaje de cada fila de la población (menor es mejor).
+
+        Args:
+            poblacion: Arreglo (P x n); la fila muestra en la posición k el id de índice poblacion[r, k]
+        """
+        poblacion = np.asarray(poblacion, dtype=np.intp)
+        filas = np.arange(len(poblacion))[:, None]
+        # Posición de cada id en cada fila (permutación inversa)
+        posicion = np.empty_like(poblacion)
+        posicion[filas, poblacion] = np.arange(poblacion.shape[1])
+
+        costo_c = (self.frecuencia * self.distancia_c[posicion]).sum(axis=1)
+        distancias_pares = self.distancias[posicion[:, :, None], posicion[:, None, :]]
+        costo_pares = (self.coocurrencia * distancias_pares).sum(axis=(1, 2)) / 2
+        return costo_c + costo_pares
+
+    def separar(self, candidatos, cantidad):
+        """
+        Returns:
+            Tupla (aceptados, descartados): las `cantidad` filas de mejor puntaje y el resto,
+            ambas en orden de puntaje
+        """
+        orden = np.argsort(self.puntajes(candidatos), kind='stable')
+        return candidatos[orden[:cantidad]], candidatos[orden[cantidad:]]
+
+    def filtrar(self, candidatos, cantidad):
+        """Las `cantidad` filas de mejor puntaje, en orden de puntaje."""
+        return self.separar(candidatos, cantidad)[0]
+
+    def correlacion(self, poblacion, fitness):
+        """Correlación de rangos entre el puntaje y el fitness real de la población."""
+        return correlacion_rangos(self.puntajes(poblacion), np.asarray(fitness, dtype=float))
+
+
+def main():
+    import random
+    import time
+    from motor_fitness import MotorFitness
+    from operadores_geneticos import poblacion_aleatoria
+    from procesador_batch import leer_ordenes
+
+    ordenes = leer_ordenes('ordenes.csv')[:10]
+    estanterias = sorted(str(i) for i in range(1, 49))
+    surrogado = SurrogadoFitness(estanterias, ordenes)
+    motor = MotorFitness(estanterias, ordenes, max_iteraciones=50, temp_inicial=30, factor_enfriamiento=0.9)
+
+    poblacion = poblacion_aleatoria(200, len(estanterias), np.random.default_rng(0))
+    inicio = time.perf_counter()
+    puntajes = surrogado.puntajes(poblacion)
+    print(f"Surrogado: {1000 * (time.perf_counter() - inicio) / len(poblacion):.3f} ms por individuo")
+    rng = random.Random(0)
+    fitness = [motor.evaluar([estanterias[i] for i in fila], rng) for fila in poblacion]
+    print(f"Correlación de rangos con el fitness: {correlacion_rangos(puntajes, fitness):.3f}")
+
+
+if __name__ == "__main__":
+    main()
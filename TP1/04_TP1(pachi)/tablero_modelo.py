@@ -0,0 +1,201 @@
+# tablero_modelo.py
+"""
+Modelo del tablero (casilleros, inicio, objetivos y vecindad) sin dependencias gráficas.
+
+El agente y el algoritmo genético trabajan sobre estas clases, de modo que pueden
+ejecutarse sin pygame (por ejemplo en procesos trabajadores o sin pantalla). La capa
+gráfica (interfaz.py) extiende Casillero y Tablero con los métodos de dibujo.
+"""
+from constantes import CANT_FILAS, CANT_COLUMNAS, CELL_SIZE, GREEN, COLORES_OBJETIVOS
+
+
+class Casillero:
+    def __init__(self, x, y, caracter="", libre=True):
+        self.x = x
+        self.y = y
+        self.caracter = caracter
+        self.libre = libre
+        self.color = None
+        self.objetivo = False
+        self.inicio = False
+        self.recorrido = False
+        self.veces_visitado = 0
+
+    def set_objetivo(self, color):
+        self.color = color
+        self.objetivo = True
+
+    def set_inicio(self):
+        self.color = GREEN
+        self.inicio = True
+
+    def get_estanteria(self):
+        return "casillero libre" if self.libre else "estanteria"
+
+    def get_indice(self):
+        return (self.y // CELL_SIZE) * CANT_COLUMNAS + (self.x // CELL_SIZE)
+
+    def __str__(self):
+        return f"Soy el casillero: {self.get_indice()}"
+
+
+class Tablero:
+    # Sin ventana: dibujar no hace nada y el agente no anima el recorrido
+    ventana = None
+
+    def __init__(self, filas=CANT_FILAS, columnas=CANT_COLUMNAS):
+        self.filas = filas
+        self.columnas = columnas
+        self.casilleros = []
+        self.inicio : Casillero = None
+        self.objetivos = []
+
+    def get_objetivos(self):
+        return self.objetivos
+
+    def get_celda_c(self):
+        """Devuelve la casilla que tiene caracter=='C', o None si no existe."""
+        for cas in self.casilleros:
+            if cas.caracter == "C":
+                return cas
+        return None
+
+    def get_inicio(self):
+        return self.inicio
+
+    def set_inicio(self, indice):
+        self.casilleros[indice].set_inicio()
+        self.inicio = self.casilleros[indice]
+
+    def set_objetivo(self, indice):
+        self.objetivos.append(self.casilleros[indice])
+        self.casilleros[indice].set_objetivo(COLORES_OBJETIVOS[(len(self.objetivos) - 1) % len(COLORES_OBJETIVOS)])
+
+    def limpiar_tablero(self):
+        self.inicio = None
+        self.objetivos = []
+        for casillero in self.casilleros:
+            self.casilleros[casillero.get_indice()].color = None
+            self.casilleros[casillero.get_indice()].inicio = False
+            self.casilleros[casillero.get_indice()].objetivo = False
+            self.casilleros[casillero.get_indice()].veces_visitado = 0
+
+    def actualizar_tablero(self, casilleros):
+        for casillero in casilleros:
+            self.casilleros[casillero.get_indice()] = casillero
+
+    def get_vecinos(self, indice):
+        # Convertir el índice lineal a coordenadas (fila, columna)
+        columna = indice % self.columnas
+        fila = indice // self.columnas
+
+        # Inicializar una lista para almacenar los vecinos
+        vecinos = []
+
+        # Verificar y agregar el vecino de arriba
+        if fila > 0:
+            if self.get_casillero_por_elemento(fila-1,columna).libre or (self.get_casillero_por_elemento(fila-1,columna).objetivo and not self.casilleros[indice].objetivo):
+                vecinos.append(self.get_casillero_por_elemento(fila-1,columna))  # Arriba
+
+        # Verificar y agregar el vecino de abajo
+        if fila < self.filas - 1:
+            if self.get_casillero_por_elemento(fila+1,columna).libre or (self.get_casillero_por_elemento(fila+1,columna).objetivo and not self.casilleros[indice].objetivo):
+                vecinos.append(self.get_casillero_por_elemento(fila+1,columna))  # Abajo
+
+        # Verificar y agregar el vecino de la izquierda
+        if columna > 0:
+            if self.get_casillero_por_elemento(fila,columna-1).libre or (self.get_casillero_por_elemento(fila,columna-1).objetivo and not self.casilleros[indice].objetivo):
+                vecinos.append(self.get_casillero_por_elemento(fila,columna-1))  # Izquierda
+
+        # Verificar y agregar el vecino de la derecha
+        if columna < self.columnas - 1:
+            if self.get_casillero_por_elemento(fila,columna+1).libre or (self.get_casillero_por_elemento(fila,columna+1).objetivo and not self.casilleros[indice].objetivo):
+                vecinos.append(self.get_casillero_por_elemento(fila,columna+1))  # Derecha
+        return vecinos
+
+    def buscar_por_caracter(self,caracter):
+        for casillero in self.casilleros:
+            if casillero.caracter == caracter:
+                return casillero.get_indice()
+
+    def agregar_casillero(self, casillero):
+        self.casilleros.append(casillero)
+
+    def get_casillero_por_elemento(self, fila, columna):
+        indice = fila*self.columnas + columna
+        return self.casilleros[indice]
+
+    def dibujar(self, instrucciones=False, visitas=False):
+        """Sin capa gráfica no hay nada que dibujar (ver interfaz.Tablero)."""
+        pass
+
+    def __str__(self):
+        text = ""
+        if self.inicio is not None:
+            text += f"Mi casillero indice es: {self.inicio.get_indice()} \n y los casilleros objetivos son:\n "
+        else:
+            text += "No ha marcado el casillero indice\n"
+        if len(self.objetivos) != 0:
+            for casillero in self.objetivos:
+                text += f"--- {casillero.get_indice()}\n"
+        else:
+            text+= "No ha marcado casilleros objetivos"
+        return text
+
+
+def llenar_tablero(tablero, clase_casillero=Casillero):
+    """
+    Carga en el tablero la disposición de 11 x 13 del almacén: la celda C en la fila 5,
+    columna 0, y tres bloques de estanterías numeradas de 1 a 48.
+
+    Args:
+        tablero: Tablero vacío
+        clase_casillero: Clase de los casilleros a crear (la de interfaz para dibujarlos)
+    """
+    columnas = 13
+
+    num_casillero = 0
+    # Crear casilleros y agregarlos al tablero
+    set1 = 1
+    set2 = 9
+    set3 = 17
+    for _ in range(143):
+        i = num_casillero // columnas
+        j = num_casillero % columnas
+        x = j * CELL_SIZE
+        y = i * CELL_SIZE
+
+        if i == 5 and j == 0:
+            casillero = clase_casillero(x, y, "C", libre=True)
+
+        elif ((j > 1 and j < 4) or (j > 5 and j < 8) or (j > 9 and j < 12)) and (i%5 != 0):
+            if (j > 1 and j < 4) and (i<5):
+                casillero = clase_casillero(x, y, f"{set1}", libre=False)
+                set1 += 1
+            elif (j > 5 and j < 8) and (i<5):
+                casillero = clase_casillero(x, y, f"{set2}", libre=False)
+                set2 += 1
+            elif (j > 9 and j < 12) and (i<5):
+                casillero = clase_casillero(x, y, f"{set3}", libre=False)
+                set3 += 1
+            elif (j > 1 and j < 4) and (i>5):
+                casillero = clase_casillero(x, y, f"{set1+16}", libre=False)
+                set1 += 1
+            elif (j > 5 and j < 8) and (i>5):
+                casillero = clase_casillero(x, y, f"{set2+16}", libre=False)
+                set2 += 1
+            elif (j > 9 and j < 12) and (i>5):
+                casillero = clase_casillero(x, y, f"{set3+16}", libre=False)
+                set3 += 1
+        else:
+            casillero = clase_casillero(x, y, "", libre=True)
+        tablero.agregar_casillero(casillero)
+
+        num_casillero += 1
+
+
+def crear_tablero():
+    """Tablero sin capa gráfica con la disposición del almacén ya cargada."""
+    tablero = Tablero(CANT_FILAS, CANT_COLUMNAS)
+    llenar_tablero(tablero)
+    return tablero
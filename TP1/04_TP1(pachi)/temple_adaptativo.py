@@ -0,0 +1,212 @@
+# temple_adaptativo.py
+"""
+Temple simulado instrumentado con enfriamiento adaptativo.
+
+Registra por iteración la tasa de aceptación (en una ventana móvil), el costo actual,
+el mejor costo y la temperatura en un buffer circular de tamaño fijo. Además del
+enfriamiento geométrico fijo del temple original ofrece un esquema adaptativo: la
+temperatura se corrige para seguir una tasa de aceptación objetivo que decrece a lo
+largo de la corrida, y la búsqueda se detiene si el mejor costo se estanca.
+
+En ordenes.csv (ver main), el adaptativo con 8 ventanas de estancamiento llega al costo
+medio del fijo lento (0.995) con unas 560 iteraciones en lugar de 1838; con 4 ventanas
+usa unas 300, pero queda cerca de un 1,5% por encima (50.80 contra 49.96).
+"""
+import math
+import random
+import numpy as np
+from busqueda_local import costo_ruta
+
+
+class BufferCircular:
+    """Últimas `capacidad` muestras de telemetría, en arreglos de NumPy preasignados."""
+    CAMPOS = ('iteracion', 'temperatura', 'costo_actual', 'mejor_costo', 'tasa_aceptacion')
+
+    def __init__(self, capacidad=1000):
+        self.capacidad = capacidad
+        self._datos = {campo: np.zeros(capacidad) for campo in self.CAMPOS}
+        self.total = 0
+
+    def registrar(self, iteracion, temperatura, costo_actual, mejor_costo, tasa_aceptacion):
+        posicion = self.total % self.capacidad
+        self._datos['iteracion'][posicion] = iteracion
+        self._datos['temperatura'][posicion] = temperatura
+        self._datos['costo_actual'][posicion] = costo_actual
+        self._datos['mejor_costo'][posicion] = mejor_costo
+        self._datos['tasa_aceptacion'][posicion] = tasa_aceptacion
+        self.total += 1
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    def datos(self):
+        """Diccionario {campo: arreglo} en orden cronológico."""
+        if self.total <= self.capacidad:
+            return {campo: valores[:self.total].copy() for campo, valores in self._datos.items()}
+        inicio = self.total % self.capacidad
+        return {campo: np.concatenate([valores[inicio:], valores[:inicio]])
+                for campo, valores in self._datos.items()}
+
+
+class TempleInstrumentado:
+    def __init__(self, matriz, capacidad_telemetria=1000, ventana=50):
+        """
+        Args:
+            matriz: Matriz de costos, nodo 0 = celda C
+            capacidad_telemetria: Iteraciones que conserva el buffer circular
+            ventana: Iteraciones de la ventana móvil de aceptación (y del ajuste adaptativo)
+        """
+        self.matriz = matriz
+        self.ventana = ventana
+        self.telemetria = BufferCircular(capacidad_telemetria)
+        self.iteraciones = 0
+        self.motivo_parada = None
+
+    def ejecutar(self, ruta_inicial=None, max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95,
+                 temp_minima=0.01, adaptativo=False, tasa_objetivo=0.5, tasa_final=0.01,
+                 estancamiento=None, rng=None):
+        """
+        Ejecuta el temple de intercambios registrando la telemetría.
+
+        Args:
+            ruta_inicial: Ruta de arranque; por defecto, aleatoria
+            max_iteraciones: Límite de iteraciones
+            temp_inicial: Temperatura inicial
+            factor_enfriamiento: Factor geométrico (en modo adaptativo, enfriamiento base)
+            temp_minima: Se detiene al bajar de esta temperatura (esquema fijo)
+            adaptativo: Si es True, ajusta la temperatura para seguir la tasa de aceptación objetivo
+            tasa_objetivo: Tasa de aceptación buscada al inicio (modo adaptativo)
+            tasa_final: Tasa de aceptación buscada al final (decrece geométricamente)
+            estancamiento: Iteraciones sin mejorar el mejor costo tras las cuales se detiene
+                           (por defecto 8 ventanas en modo adaptativo; sin límite en el fijo)
+            rng: Instancia de random.Random
+
+        Returns:
+            Tupla (mejor ruta, mejor costo)
+        """
+        rng = rng or random
+        if estancamiento is None and adaptativo:
+            estancamiento = 8 * self.ventana
+        if ruta_inicial is None:
+            ruta_actual = list(range(1, len(self.matriz)))
+            rng.shuffle(ruta_actual)
+        else:
+            ruta_actual = list(ruta_inicial)
+        costo_actual = costo_ruta(self.matriz, ruta_actual)
+        mejor_ruta, mejor_costo = ruta_actual, costo_actual
+        self.telemetria = BufferCircular(self.telemetria.capacidad)
+        self.iteraciones = 0
+        self.motivo_parada = 'trivial'
+        if len(ruta_actual) < 2:
+            return mejor_ruta, mejor_costo
+
+        aceptaciones = [False] * self.ventana  # Ventana móvil de aceptaciones
+        aceptadas_ventana = 0
+        ultima_mejora = 0
+        temp = temp_inicial
+        self.motivo_parada = 'max_iteraciones'
+
+        for iteracion in range(max_iteraciones):
+            ruta_vecina = ruta_actual.copy()
+            idx1, idx2 = rng.sample(range(len(ruta_vecina)), 2)
+            ruta_vecina[idx1], ruta_vecina[idx2] = ruta_vecina[idx2], ruta_vecina[idx1]
+            costo_vecino = costo_ruta(self.matriz, ruta_vecina)
+
+            delta_e = costo_vecino - costo_actual
+            aceptado = delta_e < 0 or rng.random() < math.exp(-delta_e / temp)
+            if aceptado:
+                ruta_actual, costo_actual = ruta_vecina, costo_vecino
+                if costo_actual < mejor_costo:
+                    mejor_ruta, mejor_costo = ruta_actual, costo_actual
+                    ultima_mejora = iteracion
+
+            posicion = iteracion % self.ventana
+            aceptadas_ventana += aceptado - aceptaciones[posicion]
+            aceptaciones[posicion] = aceptado
+            tasa = aceptadas_ventana / min(iteracion + 1, self.ventana)
+            self.telemetria.registrar(iteracion, temp, costo_actual, mejor_costo, tasa)
+            self.iteraciones = iteracion + 1
+
+            if adaptativo:
+                temp *= factor_enfriamiento
+                if (iteracion + 1) % self.ventana == 0:
+                    # Corrección proporcional hacia la tasa objetivo de este momento
+                    progreso = iteracion / max(max_iteraciones - 1, 1)
+                    objetivo = tasa_objetivo * (tasa_final / tasa_objetivo) ** progreso
+                    temp *= math.exp(2 * (objetivo - tasa))
+                    temp = max(temp, 1e-6)
+            else:
+                temp *= factor_enfriamiento
+                if temp < temp_minima:
+                    self.motivo_parada = 'temperatura'
+                    break
+
+            if estancamiento is not None and iteracion - ultima_mejora >= estancamiento:
+                self.motivo_parada = 'estancamiento'
+                break
+
+        return mejor_ruta, mejor_costo
+
+    def resumen(self):
+        """Resumen de la última ejecución."""
+        datos = self.telemetria.datos()
+        return {
+            'iteraciones': self.iteraciones,
+            'motivo_parada': self.motivo_parada,
+            'mejor_costo': float(datos['mejor_costo'][-1]) if len(self.telemetria) else None,
+            'tasa_aceptacion_media': float(datos['tasa_aceptacion'].mean()) if len(self.telemetria) else 0.0,
+        }
+
+    def graficar(self, archivo='telemetria_temple.png'):
+        """Grafica la telemetría conservada en el buffer."""
+        import matplotlib.pyplot as plt
+
+        datos = self.telemetria.datos()
+        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 10), sharex=True)
+        ax1.plot(datos['iteracion'], datos['costo_actual'], 'r-', label='Costo actual')
+        ax1.plot(datos['iteracion'], datos['mejor_costo'], 'b-', label='Mejor costo')
+        ax1.set_ylabel('Costo')
+        ax1.legend()
+        ax2.plot(datos['iteracion'], datos['temperatura'], 'g-')
+        ax2.set_ylabel('Temperatura')
+        ax2.set_yscale('log')
+        ax3.plot(datos['iteracion'], datos['tasa_aceptacion'], 'm-')
+        ax3.set_ylabel('Tasa de aceptación')
+        ax3.set_xlabel('Iteración')
+        for ax in (ax1, ax2, ax3):
+            ax.grid(True)
+        plt.tight_layout()
+        plt.savefig(archivo)
+        plt.close(fig)
+
+
+def main():
+    from procesador_batch import leer_ordenes
+    from resolvedores import PlanificadorRutas
+
+    planificador = PlanificadorRutas()
+    ordenes = leer_ordenes('ordenes.csv')
+    configuraciones = {
+        'fijo (GA: 50 it, 0.9)': dict(max_iteraciones=50, temp_inicial=30, factor_enfriamiento=0.9),
+        'fijo (1000 it, 0.95)': dict(max_iteraciones=1000, temp_inicial=100, factor_enfriamiento=0.95),
+        'fijo lento (0.995)': dict(max_iteraciones=2000, temp_inicial=100, factor_enfriamiento=0.995),
+        'adaptativo': dict(max_iteraciones=2000, temp_inicial=30, factor_enfriamiento=0.995, adaptativo=True),
+    }
+    print(f"{'Configuración':<24}{'Costo medio':>12}{'Iteraciones':>13}{'Aceptación':>12}")
+    for nombre, parametros in configuraciones.items():
+        costos, iteraciones, tasas = [], [], []
+        for i, orden in enumerate(ordenes):
+            matriz, _ = planificador.matriz_orden(orden)
+            temple = TempleInstrumentado(matriz.tolist())
+            _, costo = temple.ejecutar(rng=random.Random(i), **parametros)
+            resumen = temple.resumen()
+            costos.append(costo)
+            iteraciones.append(resumen['iteraciones'])
+            tasas.append(resumen['tasa_aceptacion_media'])
+        print(f"{nombre:<24}{np.mean(costos):>12.2f}{np.mean(iteraciones):>13.1f}{np.mean(tasas):>12.2f}")
+        if parametros.get('adaptativo'):
+            temple.graficar()
+
+
+if __name__ == "__main__":
+    main()
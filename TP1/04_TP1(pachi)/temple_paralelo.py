@@ -0,0 +1,163 @@
+# temple_paralelo.py
+"""
+Temple simulado con múltiples arranques en paralelo (un proceso por núcleo).
+
+Cada arranque es una ejecución independiente del temple sobre la matriz de costos de la
+orden, con su propia semilla. La matriz se comparte en solo lectura mediante memoria
+compartida, de modo que los procesos no la copian ni la reciben serializada.
+"""
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, util
+import numpy as np
+from busqueda_local import costo_ruta
+
+# Estado de cada proceso trabajador (se inicializa una vez por proceso)
+_memoria = None
+_matriz = None
+
+
+def temple_matriz(matriz, ruta_inicial=None, max_iteraciones=1000, temp_inicial=100,
+                  factor_enfriamiento=0.95, rng=None):
+    """
+    Temple simulado de intercambios (el mismo de Agente.temple_simulado_orden) sobre una
+    matriz de costos en lugar de A*. Devuelve la mejor ruta visitada por la cadena.
+
+    Args:
+        matriz: Matriz de costos, nodo 0 = celda C
+        ruta_inicial: Ruta inicial; si es None se usa un orden aleatorio
+        max_iteraciones: Número máximo de iteraciones
+        temp_inicial: Temperatura inicial
+        factor_enfriamiento: Factor de enfriamiento geométrico
+        rng: Instancia de random.Random (por defecto, el módulo random)
+
+    Returns:
+        Tupla (ruta, costo)
+    """
+    rng = rng or random
+    if ruta_inicial is None:
+        ruta_actual = list(range(1, len(matriz)))
+        rng.shuffle(ruta_actual)
+    else:
+        ruta_actual = list(ruta_inicial)
+    costo_actual = costo_ruta(matriz, ruta_actual)
+    mejor_ruta, mejor_costo = ruta_actual, costo_actual
+    if len(ruta_actual) < 2:
+        return mejor_ruta, mejor_costo
+
+    temp = temp_inicial
+    for _ in range(max_iteraciones):
+        ruta_vecina = ruta_actual.copy()
+        idx1, idx2 = rng.sample(range(len(ruta_vecina)), 2)
+        ruta_vecina[idx1], ruta_vecina[idx2] = ruta_vecina[idx2], ruta_vecina[idx1]
+        costo_vecino = costo_ruta(matriz, ruta_vecina)
+
+        delta_e = costo_vecino - costo_actual
+        if delta_e < 0 or rng.random() < math.exp(-delta_e / temp):
+            ruta_actual, costo_actual = ruta_vecina, costo_vecino
+            if costo_actual < mejor_costo:
+                mejor_ruta, mejor_costo = ruta_actual, costo_actual
+
+        temp *= factor_enfriamiento
+        if temp < 0.01:
+            break
+
+    return mejor_ruta, mejor_costo
+
+
+def semillas_reinicios(num_reinicios, semilla=None):
+    """Semillas independientes para cada arranque; con la misma semilla se repiten."""
+    secuencias = np.random.SeedSequence(semilla).spawn(num_reinicios)
+    return [int(s.generate_state(1)[0]) for s in secuencias]
+
+
+def _inicializar_trabajador(nombre, forma, tipo):
+    """Adjunta la matriz de costos compartida en el proceso trabajador."""
+    global _memoria, _matriz
+    _memoria = shared_memory.SharedMemory(name=nombre)
+    _matriz = np.ndarray(forma, dtype=tipo, buffer=_memoria.buf)
+    _matriz.flags.writeable = False
+    # Los trabajadores terminan con os._exit (atexit no corre); multiprocessing sí ejecuta
+    # los finalizadores con prioridad al salir del proceso
+    util.Finalize(None, _cerrar_memoria, exitpriority=10)
+
+
+def _cerrar_memoria():
+    """Libera el mapeo de la matriz compartida en el proceso trabajador."""
+    global _memoria, _matriz
+    _matriz = None  # La vista debe soltarse antes de cerrar el buffer
+    if _memoria is not None:
+        _memoria.close()
+        _memoria = None
+
+
+def _ejecutar_arranque(argumentos):
+    indice, semilla, parametros = argumentos
+    rng = random.Random(semilla)
+    ruta, costo = temple_matriz(_matriz, rng=rng, **parametros)
+    return float(costo), indice, [int(nodo) for nodo in ruta]
+
+
+def temple_multiarranque(matriz, num_reinicios=8, num_procesos=None, semilla=None, **parametros_temple):
+    """
+    Lanza arranques independientes del temple en un pool de procesos y devuelve la mejor ruta.
+
+    Args:
+        matriz: Matriz de costos de la orden, nodo 0 = celda C
+        num_reinicios: Número de arranques independientes
+        num_procesos: Procesos del pool (por defecto, uno por núcleo)
+        semilla: Semilla maestra; si se indica, el resultado es reproducible sin importar
+                 cuántos procesos se usen ni en qué orden terminen
+        parametros_temple: max_iteraciones, temp_inicial y factor_enfriamiento de temple_matriz
+
+    Returns:
+        Tupla (ruta, costo)
+    """
+    matriz = np.ascontiguousarray(matriz, dtype=np.float64)
+    semillas = semillas_reinicios(num_reinicios, semilla)
+
+    memoria = shared_memory.SharedMemory(create=True, size=matriz.nbytes)
+    try:
+        np.ndarray(matriz.shape, dtype=matriz.dtype, buffer=memoria.buf)[:] = matriz
+        with ProcessPoolExecutor(max_workers=num_procesos, initializer=_inicializar_trabajador,
+                                 initargs=(memoria.name, matriz.shape, matriz.dtype.str)) as pool:
+            resultados = list(pool.map(_ejecutar_arranque,
+                                       [(i, s, parametros_temple) for i, s in enumerate(semillas)]))
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+    # Desempate por índice de arranque para que el resultado no dependa del planificador
+    costo, _, ruta = min(resultados)
+    return ruta, costo
+
+
+def main():
+    import csv
+    import statistics
+    from tablero_modelo import crear_tablero
+    from agente import Agente
+    from busqueda_local import _preparar_orden
+
+    tablero = crear_tablero()
+    with open('ordenes.csv', 'r', newline='', encoding='utf-8') as f:
+        ordenes = [[int(item) for item in fila] for fila in csv.reader(f) if fila]
+
+    for i, orden in enumerate(ordenes[:10], start=1):
+        _preparar_orden(tablero, orden)
+        agente = Agente(tablero)
+        matriz = agente.matriz_costos([tablero.get_inicio()] + tablero.get_objetivos())
+
+        costos_simples = [temple_matriz(matriz, rng=random.Random(s))[1] for s in range(16)]
+        inicio = time.perf_counter()
+        _, costo = temple_multiarranque(matriz, num_reinicios=16, semilla=i)
+        tiempo = time.perf_counter() - inicio
+        print(f"Orden #{i}: arranque único {statistics.mean(costos_simples):.1f} "
+              f"± {statistics.pstdev(costos_simples):.1f} (mín {min(costos_simples):.0f}) | "
+              f"multiarranque {costo:.0f} en {tiempo:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+# temple_vectorizado.py
+"""
+Temple simulado con múltiples cadenas avanzando en paralelo con NumPy.
+
+Las K cadenas se guardan como un arreglo de permutaciones (K x n) sobre una matriz
+de costos compartida (nodo 0 = celda C, nodos 1..n = objetivos). En cada iteración
+cada cadena propone un movimiento, y los deltas y la aceptación de Metropolis se
+calculan para todas a la vez.
+"""
+import random
+import time
+import numpy as np
+
+
+def costos_rutas(matriz, rutas):
+    """Costo C -> ruta -> C de cada fila del arreglo de rutas (K x n)."""
+    costos = matriz[0, rutas[:, 0]] + matriz[rutas[:, -1], 0]
+    if rutas.shape[1] > 1:
+        costos = costos + matriz[rutas[:, :-1], rutas[:, 1:]].sum(axis=1)
+    return costos
+
+
+def _proponer_2opt(matriz, recorridos, filas, rng):
+    """
+    Propone invertir un tramo [a, b] de cada recorrido [0, ruta, 0].
+
+    Returns:
+        Tupla (delta de costo por cadena, índices que aplican la inversión)
+    """
+    k, largo = recorridos.shape
+    n = largo - 2
+    a = rng.integers(1, n + 1, size=k)
+    b = rng.integers(1, n, size=k)
+    b = b + (b >= a)
+    a, b = np.minimum(a, b), np.maximum(a, b)
+
+    anterior, primero = recorridos[filas, a - 1], recorridos[filas, a]
+    ultimo, siguiente = recorridos[filas, b], recorridos[filas, b + 1]
+    delta = (matriz[anterior, ultimo] + matriz[primero, siguiente]
+             - matriz[anterior, primero] - matriz[ultimo, siguiente])
+
+    indices = np.broadcast_to(np.arange(largo), (k, largo))
+    dentro = (indices >= a[:, None]) & (indices <= b[:, None])
+    indices = np.where(dentro, (a + b)[:, None] - indices, indices)
+    return delta, indices
+
+
+def _proponer_swap(matriz, recorridos, filas, rng):
+    """
+    Propone intercambiar dos objetivos (posiciones p < q) de cada recorrido, como el temple original.
+
+    Returns:
+        Tupla (delta de costo por cadena, índices que aplican el intercambio)
+    """
+    k, largo = recorridos.shape
+    n = largo - 2
+    p = rng.integers(1, n + 1, size=k)
+    q = rng.integers(1, n, size=k)
+    q = q + (q >= p)
+    p, q = np.minimum(p, q), np.maximum(p, q)
+
+    def nodo(pos):
+        return recorridos[filas, pos]
+
+    ant_p, x, sig_p = nodo(p - 1), nodo(p), nodo(p + 1)
+    ant_q, y, sig_q = nodo(q - 1), nodo(q), nodo(q + 1)
+    adyacentes = q == p + 1
+    delta_general = (matriz[ant_p, y] + matriz[y, sig_p] + matriz[ant_q, x] + matriz[x, sig_q]
+                     - matriz[ant_p, x] - matriz[x, sig_p] - matriz[ant_q, y] - matriz[y, sig_q])
+    delta_adyacente = (matriz[ant_p, y] + matriz[y, x] + matriz[x, sig_q]
+                       - matriz[ant_p, x] - matriz[x, y] - matriz[y, sig_q])
+    delta = np.where(adyacentes, delta_adyacente, delta_general)
+
+    indices = np.tile(np.arange(largo), (k, 1))
+    indices[filas, p] = q
+    indices[filas, q] = p
+    return delta, indices
+
+
+def temple_multicadena(matriz, num_cadenas=32, max_iteraciones=1000, temp_inicial=100, temp_final=0.01,
+                       factor_enfriamiento=None, movimiento='2opt', semilla=None):
+    """
+    Ejecuta K cadenas de temple simulado independientes en paralelo y devuelve la mejor ruta.
+
+    Args:
+        matriz: Matriz de costos (n+1 x n+1), nodo 0 = celda C
+        num_cadenas: Número de cadenas K
+        max_iteraciones: Iteraciones de cada cadena
+        temp_inicial: Temperatura inicial
+        temp_final: Temperatura al final de las iteraciones (si no se da factor_enfriamiento)
+        factor_enfriamiento: Factor geométrico; por defecto se calcula para llegar a temp_final
+        movimiento: '2opt' (inversión de tramo) o 'swap' (intercambio, como el temple original)
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        Tupla (ruta con los nodos 1..n en orden de visita, costo)
+    """
+    matriz = np.asarray(matriz, dtype=float)
+    n = len(matriz) - 1
+    if n < 2:
+        ruta = list(range(1, n + 1))
+        return ruta, float(costos_rutas(matriz, np.array([ruta]))[0]) if n else 0.0
+    if movimiento == '2opt':
+        proponer = _proponer_2opt
+    elif movimiento == 'swap':
+        proponer = _proponer_swap
+    else:
+        raise ValueError(f"Movimiento desconocido: {movimiento}")
+    if factor_enfriamiento is None:
+        factor_enfriamiento = (temp_final / temp_inicial) ** (1 / max(max_iteraciones, 1))
+
+    rng = np.random.default_rng(semilla)
+    filas = np.arange(num_cadenas)
+
+    # Recorridos [0, ruta, 0] con orden inicial aleatorio en cada cadena
+    rutas = np.argsort(rng.random((num_cadenas, n)), axis=1) + 1
+    deposito = np.zeros((num_cadenas, 1), dtype=rutas.dtype)
+    recorridos = np.hstack([deposito, rutas, deposito])
+    costos = costos_rutas(matriz, rutas)
+
+    mejores_recorridos = recorridos.copy()
+    mejores_costos = costos.copy()
+
+    temp = temp_inicial
+    for _ in range(max_iteraciones):
+        delta, indices = proponer(matriz, recorridos, filas, rng)
+
+        # Criterio de Metropolis para todas las cadenas a la vez
+        with np.errstate(over='ignore'):
+            prob = np.exp(-np.maximum(delta, 0) / temp)
+        aceptados = (delta < 0) | (rng.random(num_cadenas) < prob)
+
+        if aceptados.any():
+            recorridos[aceptados] = np.take_along_axis(recorridos[aceptados], indices[aceptados], axis=1)
+            costos[aceptados] += delta[aceptados]
+            mejora = costos < mejores_costos
+            mejores_recorridos[mejora] = recorridos[mejora]
+            mejores_costos[mejora] = costos[mejora]
+
+        temp *= factor_enfriamiento
+
+    mejor = int(np.argmin(mejores_costos))
+    ruta = mejores_recorridos[mejor, 1:-1]
+    # Recalcular el costo para no arrastrar errores de redondeo de los deltas
+    return ruta.tolist(), float(costos_rutas(matriz, ruta[None, :])[0])
+
+
+def comparar_con_reinicios(tablero, ordenes, num_cadenas=32, max_iteraciones=1000, semilla=0):
+    """
+    Compara, para cada orden y con el mismo tiempo de reloj, el temple multicadena contra
+    reinicios sucesivos de temple_simulado_multi_objetivo (el temple original).
+
+    Returns:
+        Diccionario con costo medio y tiempo medio por orden de cada método
+    """
+    from agente import Agente
+    from busqueda_local import _preparar_orden
+
+    random.seed(semilla)
+    resultados = {'multicadena': [], 'reinicios': []}
+    tiempos = {'multicadena': [], 'reinicios': []}
+    reinicios_totales = 0
+
+    for i, orden in enumerate(ordenes):
+        _preparar_orden(tablero, orden)
+        if len(tablero.get_objetivos()) < 2:
+            continue
+        agente = Agente(tablero)
+
+        inicio = time.perf_counter()
+        matriz = agente.matriz_costos([tablero.get_inicio()] + tablero.get_objetivos())
+        _, costo = temple_multicadena(matriz, num_cadenas, max_iteraciones, semilla=semilla + i)
+        presupuesto = time.perf_counter() - inicio
+        resultados['multicadena'].append(costo)
+        tiempos['multicadena'].append(presupuesto)
+
+        # Reinicios del temple original hasta agotar el mismo tiempo (al menos uno)
+        inicio = time.perf_counter()
+        mejor_costo = float('inf')
+        while True:
+            _, costo = agente.temple_simulado_orden()
+            mejor_costo = min(mejor_costo, costo)
+            reinicios_totales += 1
+            if time.perf_counter() - inicio >= presupuesto:
+                break
+        resultados['reinicios'].append(mejor_costo)
+        tiempos['reinicios'].append(time.perf_counter() - inicio)
+
+    cantidad = max(len(resultados['multicadena']), 1)
+    resumen = {metodo: {'costo_medio': sum(resultados[metodo]) / cantidad,
+                        'tiempo_medio': sum(tiempos[metodo]) / cantidad}
+               for metodo in resultados}
+    resumen['reinicios']['reinicios_por_orden'] = reinicios_totales / cantidad
+    return resumen
+
+
+def main():
+    import csv
+    from tablero_modelo import crear_tablero
+
+    tablero = crear_tablero()
+    with open('ordenes.csv', 'r', newline='', encoding='utf-8') as f:
+        ordenes = [[int(item) for item in fila] for fila in csv.reader(f) if fila]
+
+    resumen = comparar_con_reinicios(tablero, ordenes)
+    for metodo, datos in resumen.items():
+        print(f"{metodo:<12} costo medio: {datos['costo_medio']:.2f} | "
+              f"tiempo medio por orden: {datos['tiempo_medio'] * 1000:.1f} ms")
+    print(f"Reinicios del temple original por orden: {resumen['reinicios']['reinicios_por_orden']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
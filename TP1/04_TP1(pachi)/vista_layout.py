@@ -0,0 +1,116 @@
+# vista_layout.py
+"""
+Vistas inmutables de una disposición de estanterías sobre el tablero original.
+
+El algoritmo genético solo cambia qué id muestra cada estantería física. En lugar de
+reescribir los caracteres del tablero compartido y restaurarlos después, cada individuo
+se representa como una VistaLayout: el arreglo de celdas de la disposición base (fijo,
+de solo lectura) junto con los ids que muestra cada una. TableroVista presenta esa
+disposición como un Tablero: comparte los casilleros de la base y copia solo las
+estanterías reetiquetadas y los casilleros que se marcan como inicio u objetivo.
+"""
+import copy
+import numpy as np
+from cache_soluciones import hash_layout
+from tablero_modelo import Tablero
+
+
+class VistaLayout:
+    def __init__(self, ids, celdas, indice_c=None):
+        """
+        Args:
+            ids: Id que muestra cada estantería, en el orden de los genes
+            celdas: Arreglo con el índice de casillero de cada estantería (compartido entre vistas)
+            indice_c: Índice del casillero de la celda C
+        """
+        self.ids = tuple(str(i) for i in ids)
+        self.celdas = celdas
+        self.indice_c = indice_c
+        self._posiciones = dict(zip(self.ids, self.celdas.tolist()))
+
+    @classmethod
+    def desde_tablero(cls, tablero, estanterias):
+        """
+        Toma la disposición base del tablero: el gen k es la estantería que hoy muestra estanterias[k].
+
+        Args:
+            tablero: Tablero con la disposición original
+            estanterias: Ids de las estanterías, en el orden de los genes
+        """
+        indices = {casillero.caracter: casillero.get_indice() for casillero in tablero.casilleros
+                   if not casillero.libre}
+        celdas = np.array([indices[str(e)] for e in estanterias], dtype=np.int16)
+        celdas.setflags(write=False)
+        celda_c = tablero.get_celda_c()
+        return cls(estanterias, celdas, None if celda_c is None else celda_c.get_indice())
+
+    def con_individuo(self, individuo):
+        """Vista de la disposición en la que la estantería del gen k muestra individuo[k]."""
+        return VistaLayout(individuo, self.celdas, self.indice_c)
+
+    def posicion(self, id_estanteria):
+        """Índice del casillero que muestra el id, o None si no existe."""
+        return self._posiciones.get(str(id_estanteria))
+
+    def posiciones(self):
+        """Diccionario {id de estantería: índice de casillero}."""
+        return dict(self._posiciones)
+
+    def hash(self):
+        return hash_layout(self._posiciones)
+
+    def aplicar(self, tablero):
+        """Escribe la disposición en los casilleros del tablero (solo para la solución final)."""
+        for id_estanteria, indice in self._posiciones.items():
+            tablero.casilleros[indice].caracter = id_estanteria
+
+
+class TableroVista(Tablero):
+    def __init__(self, base, vista):
+        """
+        Args:
+            base: Tablero con la disposición original; no se modifica
+            vista: VistaLayout con la disposición a presentar
+        """
+        super().__init__(base.filas, base.columnas)
+        self.vista = vista
+        self.casilleros = list(base.casilleros)
+        self._propios = set()
+        for id_estanteria, indice in vista._posiciones.items():
+            self._propio(indice).caracter = id_estanteria
+
+    def _propio(self, indice):
+        """Copia el casillero antes de la primera escritura, para no tocar el tablero base."""
+        if indice not in self._propios:
+            self.casilleros[indice] = copy.copy(self.casilleros[indice])
+            self._propios.add(indice)
+        return self.casilleros[indice]
+
+    def get_celda_c(self):
+        if self.vista.indice_c is None:
+            return None
+        return self.casilleros[self.vista.indice_c]
+
+    def set_inicio(self, indice):
+        self._propio(indice)
+        super().set_inicio(indice)
+
+    def set_objetivo(self, indice):
+        self._propio(indice)
+        super().set_objetivo(indice)
+
+    def limpiar_tablero(self):
+        self.inicio = None
+        self.objetivos = []
+        for indice, casillero in enumerate(self.casilleros):
+            if casillero.inicio or casillero.objetivo or casillero.color is not None or casillero.veces_visitado:
+                casillero = self._propio(indice)
+                casillero.color = None
+                casillero.inicio = False
+                casillero.objetivo = False
+                casillero.veces_visitado = 0
+
+    def buscar_por_caracter(self, caracter):
+        if caracter == "C":
+            return self.vista.indice_c
+        return self.vista.posicion(caracter)